@@ -11,8 +11,12 @@ from kivy.uix.screenmanager import Screen
 from kivy.properties import ObjectProperty, ListProperty, StringProperty, NumericProperty
 from kivy.metrics import dp
 from kivy.core.window import Window
+from kivy.clock import Clock
+from kivy.factory import Factory
 from kivymd.uix.menu import MDDropdownMenu
 from app.customwidgets.customlayouts.customlayouts import CircularLayout
+from app.units.formatting import format_batch, format_number
+from app.units.parsing import parse_number
 
 Window.softinput_mode = 'below_target'
 
@@ -25,7 +29,7 @@ class ConversionScreen(Screen):
     metric_name : str
         Name of the metric currently displayed.
     converter : object
-        The conversion class instance for performing unit conversions.
+        The conversion class for performing unit conversions.
     metric_units : list
         List of units available for conversion within the selected metric.
     color : str
@@ -39,18 +43,32 @@ class ConversionScreen(Screen):
     --------
     on_pre_enter():
         Resets initial values for conversion when the screen is displayed.
+    on_enter():
+        Builds the unit menu of the metric once the screen is shown.
+    get_unit_menu():
+        Returns the cached dropdown menu listing the units of the metric.
+    open_unit_menu(target, caller, ver_growth, position):
+        Opens the unit menu for one of the unit selections.
     open_first_menu():
         Opens a dropdown menu for the first unit selection.
     open_second_menu():
         Opens a dropdown menu for the second unit selection.
     menu_callback(unit, callback):
         Sets selected unit in the dropdown and initiates conversion.
+    schedule_conversion(field):
+        Schedules a conversion from a text input for the next frame.
+    show_value(field, text):
+        Displays the result of a conversion in a text input.
     format_result(result):
         Formats the conversion result to fit within 12 digits.
     first_conversion():
         Converts value from the first unit to the second unit.
     second_conversion():
         Converts value from the second unit to the first unit.
+    build_all_units_panel():
+        Creates one label per unit of the metric in the all-units panel.
+    update_all_units(value, from_unit):
+        Shows a value converted into every unit of the metric.
     """
     
     metric_name = StringProperty('')
@@ -62,11 +80,18 @@ class ConversionScreen(Screen):
     
     def __init__(self, **kwargs):
         """
-        Initializes the ConversionScreen, setting a flag to manage concurrent
-        conversion operations.
+        Initializes the ConversionScreen, creating the Clock triggers that run
+        at most one conversion per frame for each text input.
         """
         super(ConversionScreen, self).__init__(**kwargs)
-        self.is_converting = False  # Flag to prevent simultaneous conversion loops
+        self.first_trigger = Clock.create_trigger(self.first_conversion)
+        self.second_trigger = Clock.create_trigger(self.second_conversion)
+        self.written_text = {}  # Text last set by a conversion, by input id
+        self.all_units_labels = []
+        self.panel_units = None  # Units the all-units panel was built for
+        self.unit_menus = {}  # Unit menus by tuple of units
+        self.unit_menu = None  # Menu currently open
+        self.menu_target = 'first_menu'  # Selection updated by the open menu
         
     def on_pre_enter(self, *args):
         """
@@ -75,6 +100,68 @@ class ConversionScreen(Screen):
         """
         self.ids.first_unit_value.text = f"{self.initial_value}"
         self.ids.second_unit_value.text = f"{self.initial_value}"
+        self.build_all_units_panel()
+        self.second_trigger.cancel()
+        self.first_conversion()
+        
+    def on_enter(self, *args):
+        """
+        Called once the screen is shown. Builds the unit menu of the metric
+        after the transition, so the first tap on a chevron does not stall.
+        """
+        self.get_unit_menu()
+        
+    def get_unit_menu(self):
+        """
+        Returns the dropdown menu listing the units of the metric, building it
+        on first use. Menus are cached per list of units and shared by both
+        unit selections: MDDropdownMenu draws its items with a RecycleView, so
+        opening a cached menu only positions it, whatever the number of units.
+
+        Returns:
+        --------
+        MDDropdownMenu
+            The unit menu of the metric.
+        """
+        
+        units = tuple(self.metric_units)
+        menu = self.unit_menus.get(units)
+        if menu is None:
+            menu = MDDropdownMenu(
+                items = [
+                    {
+                        'text': unit,
+                        'on_release': lambda x=unit: self.menu_callback(x, self.menu_target)
+                        }
+                    for unit in units
+                    ],
+                max_height = dp(300)
+                )
+            self.unit_menus[units] = menu
+        return menu
+        
+    def open_unit_menu(self, target, caller, ver_growth, position):
+        """
+        Opens the cached unit menu below or above one of the unit buttons.
+
+        Parameters:
+        -----------
+        target : str
+            Either 'first_menu' or 'second_menu', the selection to update.
+        caller : Widget
+            The button the menu is attached to.
+        ver_growth : str
+            Direction in which the menu grows, 'down' or 'up'.
+        position : str
+            Position of the menu relative to the caller, 'bottom' or 'top'.
+        """
+        
+        self.unit_menu = self.get_unit_menu()
+        self.unit_menu.caller = caller
+        self.unit_menu.ver_growth = ver_growth
+        self.unit_menu.position = position
+        self.menu_target = target
+        self.unit_menu.open()
         
     def open_first_menu(self):
         """
@@ -82,21 +169,7 @@ class ConversionScreen(Screen):
         available units.
         """
         
-        self.first_menu = MDDropdownMenu(
-            caller = self.ids.first_unit_btn,
-            items = [
-                {
-                    'text': f'{unit}',
-                    'on_release': lambda x=f'{unit}': self.menu_callback(x, 'first_menu')
-                    }
-                for unit in self.metric_units
-                ],
-            ver_growth = "down",
-            max_height = dp(300),
-            position = 'bottom'
-            
-            )
-        self.first_menu.open()
+        self.open_unit_menu('first_menu', self.ids.first_unit_btn, 'down', 'bottom')
         
     def open_second_menu(self):
         """
@@ -104,21 +177,7 @@ class ConversionScreen(Screen):
         available units.
         """
         
-        self.second_menu = MDDropdownMenu(
-            caller = self.ids.second_unit_btn,
-            items = [
-                {
-                    'text': f'{unit}',
-                    'on_release': lambda x=f'{unit}': self.menu_callback(x, 'second_menu')
-                    }
-                for unit in self.metric_units
-                ],
-            ver_growth = "up",
-            max_height = dp(300),
-            position = 'top'
-            
-            )
-        self.second_menu.open()
+        self.open_unit_menu('second_menu', self.ids.second_unit_btn, 'up', 'top')
         
     def menu_callback(self, unit, callback):
         """
@@ -133,18 +192,58 @@ class ConversionScreen(Screen):
             Indicates whether the selection is for 'first_menu' or 'second_menu'.
         """
         
+        self.unit_menu.dismiss()
         if callback == 'first_menu':
             self.ids.first_unit_name.text = unit
-            self.first_menu.dismiss()
             self.first_conversion()
         else:
             self.ids.second_unit_name.text = unit
-            self.second_menu.dismiss()
             self.second_conversion()
     
+    def schedule_conversion(self, field):
+        """
+        Called whenever the text of a value input changes. Schedules a
+        conversion from that input for the next frame, so a burst of edits
+        (typing, pasting, holding backspace) costs a single conversion, and
+        cancels any pending conversion in the other direction. Changes made
+        by a conversion itself are ignored rather than converted back.
+
+        Parameters:
+        -----------
+        field : str
+            Either 'first_unit_value' or 'second_unit_value'.
+        """
+        
+        if self.written_text.pop(field, None) == self.ids[field].text:
+            return  # Echo of a result written by show_value
+        
+        if field == 'first_unit_value':
+            self.second_trigger.cancel()
+            self.first_trigger()
+        else:
+            self.first_trigger.cancel()
+            self.second_trigger()
+            
+    def show_value(self, field, text):
+        """
+        Displays the result of a conversion in a text input, remembering it so
+        that the resulting text event is not scheduled as a user edit.
+
+        Parameters:
+        -----------
+        field : str
+            Either 'first_unit_value' or 'second_unit_value'.
+        text : str
+            The text to display.
+        """
+        
+        self.written_text[field] = text
+        self.ids[field].text = text
+    
     def format_result(self, result):
         """
-        Formats the result of a conversion to fit within 12 digits.
+        Formats the result of a conversion to fit within 12 digits. Results
+        are cached, so repeated values are not formatted again.
 
         Parameters:
         -----------
@@ -157,72 +256,94 @@ class ConversionScreen(Screen):
             Formatted result with up to 12 characters.
         """
         
-        # Format the number in fixed-point notation with up to 12 digits after the decimal
-        formatted_result = f"{result:.12f}".rstrip("0").rstrip(".")
-        
-        # Count digits only (exclude decimal point and negative sign)
-        digit_count = len(formatted_result.replace(".", "").replace("-", ""))
-        
-        # If the result has 12 or fewer digits, return it in fixed-point notation
-        if digit_count <= 12:
-            return formatted_result
-        
-        # Otherwise, use scientific notation to fit within 12 characters
-        return f"{result:.6e}"[:12]
+        # Fixed-point notation when it fits in 12 digits, scientific otherwise
+        return format_number(float(result), 12)
             
-    def first_conversion(self):
+    def first_conversion(self, *args):
         """
         Converts the value from the first unit to the second unit, updating the
         second unit's display with the result.
         """
         
-        if self.is_converting:
-            return  # Exit if a conversion is already in progress
-        
-        self.is_converting = True
+        state, from_value = parse_number(self.ids.first_unit_value.text)
+        if state == 'incomplete':
+            return  # Keep the last result on screen while the user is typing
+        if state == 'invalid':
+            self.show_value('second_unit_value', "Invalid input")
+            return
         
         try:
-            # Get the current values and units
-            from_value = float(self.ids.first_unit_value.text)
+            # Get the current units
             from_unit = self.ids.first_unit_name.text
             to_unit = self.ids.second_unit_name.text
     
             # Perform the conversion
             result = self.converter.convert(from_value, from_unit, to_unit)
 
-            self.ids.second_unit_value.text = self.format_result(result)
+            self.show_value('second_unit_value', self.format_result(result))
+            self.update_all_units(from_value, from_unit)
             
         except ValueError:
-            self.ids.second_unit_value.text = "Invalid input"
-            
-        finally:
-            self.is_converting = False  # Reset flag after conversion is done
+            self.show_value('second_unit_value', "Invalid input")
 
     
-    def second_conversion(self):
+    def second_conversion(self, *args):
         """
         Converts the value from the second unit to the first unit, updating the
         first unit's display with the result.
         """
         
-        if self.is_converting:
-            return  # Exit if a conversion is already in progress
-        
-        self.is_converting = True
+        state, from_value = parse_number(self.ids.second_unit_value.text)
+        if state == 'incomplete':
+            return  # Keep the last result on screen while the user is typing
+        if state == 'invalid':
+            self.show_value('first_unit_value', "Invalid input")
+            return
         
         try:
-            # Get the current values and units
-            from_value = float(self.ids.second_unit_value.text)
+            # Get the current units
             from_unit = self.ids.second_unit_name.text
             to_unit = self.ids.first_unit_name.text
 
             # Perform the reverse conversion
             result = self.converter.convert(from_value, from_unit, to_unit)
 
-            self.ids.first_unit_value.text = self.format_result(result)
+            self.show_value('first_unit_value', self.format_result(result))
+            self.update_all_units(from_value, from_unit)
             
         except ValueError:
-            self.ids.first_unit_value.text = "Invalid input"
-            
-        finally:
-            self.is_converting = False  # Reset flag after conversion is done
\ No newline at end of file
+            self.show_value('first_unit_value', "Invalid input")
+
+    def build_all_units_panel(self):
+        """
+        Creates one label per unit of the metric in the all-units panel. The
+        labels are kept as long as the metric does not change, so typing only
+        updates their text.
+        """
+        
+        if self.panel_units == self.metric_units:
+            return
+        
+        panel = self.ids.all_units_panel
+        panel.clear_widgets()
+        self.all_units_labels = [Factory.AllUnitsLabel() for _ in self.metric_units]
+        for label in self.all_units_labels:
+            panel.add_widget(label)
+        self.panel_units = list(self.metric_units)
+        
+    def update_all_units(self, value, from_unit):
+        """
+        Shows a value converted into every unit of the metric, computed with a
+        single vectorized call to the converter.
+
+        Parameters:
+        -----------
+        value : float
+            The value entered by the user.
+        from_unit : str
+            The unit of the entered value.
+        """
+        
+        results = format_batch(self.converter.convert_to_all(value, from_unit), 12)
+        for label, unit, result in zip(self.all_units_labels, self.metric_units, results):
+            label.text = f"{result} {unit}"
@@ -0,0 +1,263 @@
+"""
+Categories Module
+
+This module describes the metric categories offered by the menu screen in a
+single table: the card shown in the menu, the unit module of the category and
+the initial state of its conversion screen. The menu cards and the conversion
+screen settings are both derived from it, so adding a category only requires
+its unit module in app/units and one entry here.
+
+Each unit module is imported and its converter class and unit list resolved
+once, on first use, and then reused for every later visit of the category.
+
+Once the app has drawn its first frame, start_warm_up does this for every
+category on a background thread, along with building their conversion
+tables, starting with the categories the user opens most often, so that even
+the first visit of a category does not pay for its import.
+
+Classes:
+--------
+Category : The description of one metric category.
+CategoryUsage : Counts the visits of each category, persisted in a JsonStore.
+
+Functions:
+----------
+get_category(name) : Returns the description of a category.
+load_category(name) : Returns the converter class and unit list of a category.
+warm_up(names) : Loads categories and builds their conversion tables.
+start_warm_up(names) : Runs warm_up on a background thread.
+
+Variables:
+----------
+metric_categories : tuple
+    The categories in the order of the menu.
+-------------------------------------------------------------------------------
+"""
+
+import os
+from collections import namedtuple
+from contextlib import suppress
+from functools import lru_cache
+from importlib import import_module
+from threading import Thread
+
+Category = namedtuple("Category", [
+    "name",            # Name of the unit module in app/units
+    "title",           # Title of the menu card
+    "icon",            # Icon of the menu card
+    "converter",       # Name of the converter class in the unit module
+    "units",           # Name of the unit list in the unit module
+    "color",           # Color of the menu card and of the conversion screen
+    "initial_unit",    # Unit selected when the conversion screen opens
+    "initial_value",   # Value displayed when the conversion screen opens
+])
+
+metric_categories = (
+    Category("angle", "Angle", "assets/ui/icons/angle.png",
+             "AngleConverter", "angle_units", "#6f0000", "Degrees", 90),
+    Category("area", "Area", "assets/ui/icons/area.png",
+             "AreaConverter", "area_units", "#111111", "Square Metres", 1),
+    Category("datastorage", "Data Storage", "assets/ui/icons/data-storage.png",
+             "DataStorageConverter", "data_units", "#3f4c6b", "Kilobits", 1),
+    Category("force", "Force", "assets/ui/icons/force.png",
+             "ForceConverter", "force_units", "#2a9064", "Newtons", 1),
+    Category("frequency", "Frequency", "assets/ui/icons/frequency.png",
+             "FrequencyConverter", "frequency_units", "#0f3443", "Hertz", 1),
+    Category("length", "Length", "assets/ui/icons/length.png",
+             "LengthConverter", "length_units", "#61a830", "Meters", 1),
+    Category("mass", "Mass", "assets/ui/icons/mass.png",
+             "MassConverter", "mass_units", "#aa388d", "Grams", 1),
+    Category("pressure", "Pressure", "assets/ui/icons/pressure.png",
+             "PressureConverter", "pressure_units", "#f7a800", "Atmospheres", 1),
+    Category("speed", "Speed", "assets/ui/icons/speed.png",
+             "SpeedConverter", "speed_units", "#3f2683", "Metres per Second", 1),
+    Category("temperature", "Temperature", "assets/ui/icons/temperature.png",
+             "TemperatureConverter", "temperature_units", "#ec662c", "Celsius", 25),
+    Category("time", "Time", "assets/ui/icons/time.png",
+             "TimeConverter", "time_units", "#cf112d", "Minutes", 1),
+    Category("volume", "Volume", "assets/ui/icons/volume.png",
+             "VolumeConverter", "volume_units", "#0060a8", "Litres", 1),
+)
+
+_categories = {category.name: category for category in metric_categories}
+
+
+def get_category(name):
+    """
+    Returns the description of a category.
+
+    Parameters:
+    -----------
+    name : str
+        Name of the category, e.g. 'length'.
+
+    Returns:
+    --------
+    Category
+        The description of the category.
+
+    Raises:
+    -------
+    ValueError
+        If the category is unknown.
+    """
+
+    try:
+        return _categories[name]
+    except KeyError:
+        raise ValueError(f"Unknown category: {name}") from None
+
+
+@lru_cache(maxsize=None)
+def load_category(name):
+    """
+    Imports the unit module of a category and returns its converter class and
+    unit list. Both are resolved once and shared by every later call.
+
+    Parameters:
+    -----------
+    name : str
+        Name of the category, e.g. 'length'.
+
+    Returns:
+    --------
+    tuple
+        (converter, units): the converter class of the category, whose
+        methods are all static, and its list of unit names.
+
+    Raises:
+    -------
+    ValueError
+        If the category is unknown.
+    """
+
+    category = get_category(name)
+    module = import_module(f"app.units.{category.name}")
+    return getattr(module, category.converter), getattr(module, category.units)
+
+
+def warm_up(names):
+    """
+    Loads each category in turn and builds its conversion table, including
+    the factor matrix used to convert a value into every unit at once, so
+    that opening the category later finds everything ready.
+
+    Parameters:
+    -----------
+    names : iterable
+        Names of the categories, in the order they should be loaded.
+    """
+
+    from app.units.engine import get_table
+
+    for name in names:
+        load_category(name)
+        get_table(name).matrix
+
+
+def start_warm_up(names):
+    """
+    Runs warm_up on a daemon thread, which never delays the interface and
+    does not keep the app alive once it is closed. Categories opened before
+    the thread reaches them are simply loaded by the interface.
+
+    Parameters:
+    -----------
+    names : iterable
+        Names of the categories, in the order they should be loaded.
+
+    Returns:
+    --------
+    threading.Thread
+        The started thread.
+    """
+
+    thread = Thread(target=warm_up, args=(list(names),), name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+class CategoryUsage:
+    """
+    Counts how many times each category is opened, persisting the counts in a
+    JsonStore so that they survive restarts. Visits are counted in memory and
+    written by save, which the app calls when it is paused or stopped, so
+    opening a category never touches the disk.
+
+    Attributes:
+    -----------
+    counts : dict
+        Number of visits by category name.
+
+    Methods:
+    --------
+    record(name):
+        Counts a visit of a category.
+    save():
+        Writes the counts if they changed since they were loaded or saved.
+    ranking():
+        Returns the category names, most visited first.
+    """
+
+    def __init__(self, path):
+        """
+        Loads the counts stored in a JSON file, which is created on the first
+        save. A file that cannot be read is discarded, starting the counts
+        over.
+
+        Parameters:
+        -----------
+        path : str
+            Path of the JSON file holding the counts.
+        """
+
+        from kivy.storage.jsonstore import JsonStore
+
+        self.changed = False
+        try:
+            self.store = JsonStore(path)
+            counts = self.store.get("usage")["counts"] if self.store.exists("usage") else {}
+            self.counts = {name: count for name, count in counts.items()
+                           if name in _categories and type(count) is int}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            with suppress(OSError):
+                os.remove(path)
+            self.store = JsonStore(path)
+            self.counts = {}
+
+    def record(self, name):
+        """
+        Counts a visit of a category, in memory only.
+
+        Parameters:
+        -----------
+        name : str
+            Name of the category.
+        """
+
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.changed = True
+
+    def save(self):
+        """
+        Writes the counts to the JSON file if they changed since they were
+        loaded or last saved.
+        """
+
+        if self.changed:
+            self.store.put("usage", counts=self.counts)
+            self.changed = False
+
+    def ranking(self):
+        """
+        Returns the names of every category, the most visited first and the
+        others in menu order.
+
+        Returns:
+        --------
+        list
+            The category names.
+        """
+
+        order = {category.name: index for index, category in enumerate(metric_categories)}
+        return sorted(order, key=lambda name: (-self.counts.get(name, 0), order[name]))
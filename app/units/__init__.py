@@ -0,0 +1,135 @@
+"""
+Units Package
+
+This package holds the conversion engine and one module per category, and
+never imports Kivy, so it can be used from scripts, services and the command
+line as well as from the app:
+
+    >>> from app import units
+    >>> units.convert(3, 'mi', 'km')
+    4.828032
+    >>> units.LengthConverter.convert(1, 'Feet', 'Inches')
+    12.0
+
+Nothing is imported up front: submodules, converter classes and engine
+functions are loaded on first access through a module-level __getattr__, so
+importing the package costs next to nothing and each category pays for its
+tables only when it is used.
+
+The command-line entry point, python -m app.units, answers a free-text query
+or runs one of the csv, binary, jsonl or serve commands.
+
+Functions:
+----------
+convert(value, from_unit, to_unit, category=None) : Converts a value between
+                                                    two units.
+
+Variables:
+----------
+converter_classes : dict
+    Maps each converter class name to the module defining it.
+-------------------------------------------------------------------------------
+"""
+
+from importlib import import_module
+
+# Converter class of each category module
+converter_classes = {
+    "AngleConverter": "angle",
+    "AreaConverter": "area",
+    "DataStorageConverter": "datastorage",
+    "ForceConverter": "force",
+    "FrequencyConverter": "frequency",
+    "LengthConverter": "length",
+    "MassConverter": "mass",
+    "PressureConverter": "pressure",
+    "SpeedConverter": "speed",
+    "TemperatureConverter": "temperature",
+    "TimeConverter": "time",
+    "VolumeConverter": "volume",
+}
+
+# Public names of the package, by the module defining them
+_exports = dict(converter_classes, **{
+    "categories": "engine",
+    "get_table": "engine",
+    "get_converter": "engine",
+    "get_coefficients": "engine",
+    "UnitTable": "engine",
+    "AffineTable": "engine",
+    "AffineTransform": "engine",
+    "registry": "registry",
+    "Unit": "registry",
+    "resolve": "aliases",
+    "resolve_pair": "aliases",
+    "format_number": "formatting",
+    "format_batch": "formatting",
+    "parse_number": "parsing",
+    "parse_numbers": "parsing",
+    "convert_parallel": "parallel",
+    "run_query": "query",
+})
+
+_submodules = {
+    "aliases", "cli", "dimensions", "engine", "formatting", "parallel", "parsing", "prefixes",
+    "query", "registry", "service",
+    "angle", "area", "datastorage", "force", "frequency", "length", "mass",
+    "pressure", "speed", "temperature", "time", "volume",
+}
+
+# Names whose attribute differs from the public name
+_renamed = {"run_query": "run"}
+
+
+def __getattr__(name):
+    """
+    Loads a submodule or a public name of the package on first access.
+    """
+
+    if name in _submodules:
+        return import_module(f"{__name__}.{name}")
+    try:
+        module = _exports[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(f"{__name__}.{module}"), _renamed.get(name, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | _submodules)
+
+
+def convert(value, from_unit, to_unit, category=None):
+    """
+    Converts a value between two units given by name or alias, inferring
+    their category when it is not given.
+
+    Parameters:
+    -----------
+    value : float or array_like
+        The value, or array of values, to be converted.
+    from_unit : str
+        The unit of the input value, e.g. 'Miles' or 'mi'.
+    to_unit : str
+        The unit to convert the value into.
+    category : str, optional
+        Name of the category of both units.
+
+    Returns:
+    --------
+    float or numpy.ndarray
+        The converted value.
+
+    Raises:
+    -------
+    ValueError
+        If a unit is unknown or the units belong to different categories.
+    """
+
+    from app.units.aliases import resolve_pair
+    from app.units.engine import get_converter
+
+    return get_converter(*resolve_pair(from_unit, to_unit, category))(value)
@@ -0,0 +1,53 @@
+"""
+Command-line entry point of the units package, which never imports Kivy:
+
+    python -m app.units 5 ft 3 in to cm
+    python -m app.units csv --column distance --from Miles --to Kilometers in.csv out.csv
+    python -m app.units serve --port 8080
+
+The csv, binary and jsonl commands are run by app.units.cli, serve by
+app.units.service, and anything else is answered as a query by
+app.units.query. Only the module needed by the command is imported.
+-------------------------------------------------------------------------------
+"""
+
+import sys
+
+# Module running each command
+_commands = {
+    "csv": "cli",
+    "binary": "cli",
+    "jsonl": "cli",
+    "serve": "service",
+}
+
+
+def main(argv=None):
+    """
+    Dispatches the command line to the module running it.
+
+    Parameters:
+    -----------
+    argv : list, optional
+        Command-line arguments, defaulting to sys.argv[1:].
+
+    Returns:
+    --------
+    int
+        The process exit status.
+    """
+
+    argv = sys.argv[1:] if argv is None else argv
+    module = _commands.get(argv[0]) if argv else None
+    if module == "cli":
+        from app.units.cli import main as run
+    elif module == "service":
+        from app.units.service import main as run
+        argv = argv[1:]
+    else:
+        from app.units.query import main as run
+    return run(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+"""
+Aliases Module
+
+This module indexes the names, symbols and alternative spellings of every unit
+in the registry into a trie, built once. Lookups are O(len) for exact and
+prefix matches. Typos are never corrected silently: they are only looked up on
+request, by suggest or with fuzzy=True, through a bounded edit-distance search
+that prunes whole branches of the trie as soon as they cannot match.
+
+Classes:
+--------
+AliasTrie : A trie mapping normalized keys to sets of unit IDs.
+AliasIndex : Resolves free-form unit strings to registered units.
+
+Functions:
+----------
+normalize(text) : Returns the normalized form of a unit string.
+get_index() : Returns the global AliasIndex, building it on first use.
+resolve(text, category=None, fuzzy=False) : Resolves a free-form unit string
+                                            to a Unit.
+resolve_pair(from_unit, to_unit, category=None) : Resolves the two units of a
+                                                  conversion.
+
+Variables:
+----------
+min_fuzzy_length : int
+    Keys shorter than this are never matched approximately.
+-------------------------------------------------------------------------------
+"""
+
+import re
+from functools import lru_cache
+from threading import RLock
+
+# Short keys are too close to too many symbols for a typo to be guessed safely
+min_fuzzy_length = 6
+
+_space_pattern = re.compile(r"\s+")
+_slash_pattern = re.compile(r"\s*/\s*")
+
+
+def normalize(text):
+    """
+    Returns the normalized form of a unit string: case-folded, with runs of
+    whitespace collapsed and no spaces around slashes.
+
+    Examples:
+    ---------
+    >>> normalize('  KM / H ')
+    'km/h'
+    """
+
+    text = _space_pattern.sub(" ", text.strip().casefold())
+    return _slash_pattern.sub("/", text)
+
+
+class _Node:
+    """A trie node: its children by character and the unit IDs ending here."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children = {}
+        self.ids = None
+
+
+class AliasTrie:
+    """
+    A trie mapping normalized keys to sets of unit IDs.
+
+    Methods:
+    --------
+    insert(key, unit_id)
+        Adds a key for a unit ID.
+    get(key)
+        Returns the unit IDs of a key, in O(len(key)).
+    complete(prefix, limit=10)
+        Returns the keys starting with a prefix and their unit IDs.
+    fuzzy(key, max_distance)
+        Returns the keys within an edit distance of a key.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+
+    def insert(self, key, unit_id):
+        """
+        Adds a key for a unit ID.
+        """
+
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        if node.ids is None:
+            node.ids = set()
+        node.ids.add(unit_id)
+
+    def _find(self, key):
+        """Returns the node reached by key, or None."""
+
+        node = self.root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def get(self, key):
+        """
+        Returns the set of unit IDs stored under key, empty if there is none.
+        """
+
+        node = self._find(key)
+        if node is None or node.ids is None:
+            return frozenset()
+        return frozenset(node.ids)
+
+    def complete(self, prefix, limit=10):
+        """
+        Returns up to limit (key, unit IDs) pairs whose key starts with prefix,
+        shortest keys first.
+        """
+
+        node = self._find(prefix)
+        if node is None:
+            return []
+
+        matches = []
+        level = [(prefix, node)]
+        while level and len(matches) < limit:
+            next_level = []
+            for key, current in level:
+                if current.ids is not None:
+                    matches.append((key, frozenset(current.ids)))
+                for char in sorted(current.children):
+                    next_level.append((key + char, current.children[char]))
+            level = next_level
+        return matches[:limit]
+
+    def fuzzy(self, key, max_distance):
+        """
+        Returns the (distance, key, unit IDs) triples of every stored key
+        within max_distance edits of key, closest first.
+
+        The Levenshtein row of each trie node is derived from its parent's,
+        and a branch is abandoned once every value of its row exceeds
+        max_distance.
+        """
+
+        matches = []
+        first_row = list(range(len(key) + 1))
+        stack = [(child, char, char, first_row) for char, child in self.root.children.items()]
+        while stack:
+            node, char, prefix, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(key) + 1):
+                row.append(min(
+                    row[column - 1] + 1,
+                    previous_row[column] + 1,
+                    previous_row[column - 1] + (key[column - 1] != char),
+                ))
+
+            if node.ids is not None and row[-1] <= max_distance:
+                matches.append((row[-1], prefix, frozenset(node.ids)))
+            if min(row) <= max_distance:
+                for next_char, child in node.children.items():
+                    stack.append((child, next_char, prefix + next_char, row))
+
+        matches.sort(key=lambda match: (match[0], match[1]))
+        return matches
+
+
+class AliasIndex:
+    """
+    A class used to resolve free-form unit strings to registered units.
+
+    Attributes:
+    -----------
+    registry : UnitRegistry
+        The registry whose units are indexed.
+    trie : AliasTrie
+        The normalized names and aliases of every unit.
+
+    Methods:
+    --------
+    resolve(text, category=None, fuzzy=False)
+        Returns the Unit denoted by text, tolerating case, spacing and, on
+        request, typos.
+    complete(prefix, category=None, limit=10)
+        Returns the units with a name or alias starting with prefix.
+    suggest(text, category=None, limit=5)
+        Returns the units whose names or aliases are closest to text.
+    """
+
+    def __init__(self, registry):
+        """
+        Builds the trie from every name and alias in the registry.
+        """
+
+        self.registry = registry
+        self.trie = AliasTrie()
+        self._size = 0
+        self._longest = 0  # Length of the longest indexed key
+        # Guards the trie against lookups from other threads while it grows
+        self._lock = RLock()
+        self.update()
+
+    def update(self):
+        """
+        Indexes the units registered since the index was last updated.
+        """
+
+        with self._lock:
+            units = self.registry.units[self._size:]
+            for unit in units:
+                for key in (unit.name,) + unit.aliases:
+                    key = normalize(key)
+                    self.trie.insert(key, unit.id)
+                    self._longest = max(self._longest, len(key))
+            self._size += len(units)
+
+    def _pick(self, unit_ids, category):
+        """Returns the only unit among unit_ids in category, or None."""
+
+        units = [self.registry.units[unit_id] for unit_id in unit_ids]
+        if category is not None:
+            units = [unit for unit in units if unit.category == category]
+        return units[0] if len(units) == 1 else None
+
+    def _fuzzy(self, key, max_distance):
+        """
+        Returns the trie matches within max_distance edits of key, skipping
+        the search for keys too long to match any indexed key.
+        """
+
+        if len(key) > self._longest + max_distance:
+            return []
+        with self._lock:
+            return self.trie.fuzzy(key, max_distance)
+
+    def resolve(self, text, category=None, fuzzy=False):
+        """
+        Returns the Unit denoted by text.
+
+        Exact registry matches are tried first, then prefixed units generated
+        on demand (e.g. 'PB', 'nm' or 'Terahertz'), whose symbols are case
+        sensitive, then normalized trie matches. Only when fuzzy is true are
+        typos then tolerated, through unambiguous matches within a small edit
+        distance (one edit for keys of up to eight characters, two beyond) of
+        keys of at least min_fuzzy_length characters.
+
+        Parameters:
+        -----------
+        text : str
+            A unit name, symbol or spelling, e.g. 'KM/H' or 'kilometre'.
+        category : str, optional
+            Restricts the match to one category.
+        fuzzy : bool, optional
+            Whether to accept a close misspelling of a unit.
+
+        Returns:
+        --------
+        Unit
+            The resolved unit.
+
+        Raises:
+        -------
+        ValueError
+            If no single unit matches.
+        """
+
+        if self._size != len(self.registry.units):
+            self.update()
+
+        if text in self.registry:
+            unit = self.registry.units[self.registry.unit_id(text)]
+            if category is None or unit.category == category:
+                return unit
+
+        from app.units.prefixes import generate
+
+        unit = generate(text, category)
+        if unit is not None:
+            self.update()
+            return unit
+
+        key = normalize(text)
+        unit = self._pick(self.trie.get(key), category)
+        if unit is not None:
+            return unit
+
+        if fuzzy and len(key) >= min_fuzzy_length:
+            max_distance = 1 if len(key) <= 8 else 2
+            matches = self._fuzzy(key, max_distance)
+            for distance in range(1, max_distance + 1):
+                unit_ids = set()
+                for match_distance, _, ids in matches:
+                    if match_distance == distance:
+                        unit_ids |= ids
+                candidates = {self.registry.units[unit_id] for unit_id in unit_ids}
+                if category is not None:
+                    candidates = {unit for unit in candidates if unit.category == category}
+                if len(candidates) == 1:
+                    return candidates.pop()
+                if candidates:
+                    break
+
+        raise ValueError(f"Unknown unit: {text}")
+
+    def complete(self, prefix, category=None, limit=10):
+        """
+        Returns up to limit distinct units with a name or alias starting with
+        prefix, shortest matches first.
+        """
+
+        if self._size != len(self.registry.units):
+            self.update()
+
+        units = []
+        for _, unit_ids in self.trie.complete(normalize(prefix), limit=len(self.registry.units)):
+            for unit_id in sorted(unit_ids):
+                unit = self.registry.units[unit_id]
+                if unit not in units and (category is None or unit.category == category):
+                    units.append(unit)
+            if len(units) >= limit:
+                break
+        return units[:limit]
+
+    def suggest(self, text, category=None, limit=5):
+        """
+        Returns up to limit distinct units whose names or aliases are within
+        two edits of text, closest first.
+        """
+
+        if self._size != len(self.registry.units):
+            self.update()
+
+        units = []
+        for _, _, unit_ids in self._fuzzy(normalize(text), 2):
+            for unit_id in sorted(unit_ids):
+                unit = self.registry.units[unit_id]
+                if unit not in units and (category is None or unit.category == category):
+                    units.append(unit)
+        return units[:limit]
+
+
+_index = None
+
+
+def get_index():
+    """
+    Returns the global AliasIndex over the unit registry, building it on
+    first use.
+    """
+
+    global _index
+    if _index is None:
+        from app.units.registry import registry
+
+        _index = AliasIndex(registry)
+    return _index
+
+
+@lru_cache(maxsize=65536)
+def resolve(text, category=None, fuzzy=False):
+    """
+    Resolves a free-form unit string to a Unit through the global index,
+    caching the answer for repeated strings. Misspellings are only accepted
+    with fuzzy=True.
+
+    Raises:
+    -------
+    ValueError
+        If no single unit matches.
+
+    Examples:
+    ---------
+    >>> resolve('KM/H').name
+    'Kilometres per Hour'
+    >>> resolve('kilometr', fuzzy=True).name
+    'Kilometers'
+    """
+
+    return get_index().resolve(text, category, fuzzy)
+
+
+def resolve_pair(from_unit, to_unit, category=None):
+    """
+    Resolves the two units of a conversion, inferring their category when it
+    is not given.
+
+    Parameters:
+    -----------
+    from_unit : str
+        The unit of the input values, by name or alias.
+    to_unit : str
+        The unit to convert the values into, by name or alias.
+    category : str, optional
+        Name of the category of both units. When given, the units are passed
+        through unchanged for the conversion table to resolve.
+
+    Returns:
+    --------
+    tuple
+        (category, from_unit, to_unit), with canonical unit names when the
+        category is inferred.
+
+    Raises:
+    -------
+    ValueError
+        If a unit is unknown or the units belong to different categories.
+
+    Examples:
+    ---------
+    >>> resolve_pair('mi', 'km')
+    ('length', 'Miles', 'Kilometers')
+    """
+
+    if category is not None:
+        return category, from_unit, to_unit
+
+    source, target = resolve(from_unit), resolve(to_unit)
+    if source.category != target.category:
+        raise ValueError("Invalid units or conversion not supported")
+    return source.category, source.name, target.name
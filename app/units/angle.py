@@ -11,14 +11,43 @@ AngleConverter : Provides static methods for converting angle values
 
 Variables:
 ----------
+angle_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 angle_units : list
     A list of supported angle units for conversion.
+angle_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+angle_table : UnitTable
+    The conversion table built from angle_factors and angle_aliases.
 -------------------------------------------------------------------------------
 """
 
+from fractions import Fraction
 from math import pi
+from app.units.engine import UnitTable
 
-angle_units = ["Degrees", "Radians", "Milliradians", "Gradians", "Seconds of Arc", "Minutes of Arc"]
+# Value of one unit expressed in Degrees
+angle_factors = {
+    "Degrees": 1.0,
+    "Radians": 180.0 / pi,
+    "Milliradians": 0.18 / pi,
+    "Gradians": 0.9,
+    "Seconds of Arc": Fraction(1, 3600),
+    "Minutes of Arc": Fraction(1, 60),
+}
+
+# Symbols and alternative spellings accepted for each unit
+angle_aliases = {
+    "Degrees": ("deg", "°", "Degree"),
+    "Radians": ("rad", "Radian"),
+    "Milliradians": ("mrad", "Milliradian"),
+    "Gradians": ("grad", "gon", "Gradian"),
+    "Seconds of Arc": ("arcsec", "″", "Second of Arc"),
+    "Minutes of Arc": ("arcmin", "′", "Minute of Arc"),
+}
+
+angle_units = list(angle_factors)
+angle_table = UnitTable("angle", angle_factors, angle_aliases)
 
 class AngleConverter:
     """
@@ -28,6 +57,14 @@ class AngleConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts an angle from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of angles from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts an angle into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts an angle exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of angles exactly.
     """
     
     @staticmethod
@@ -70,81 +107,122 @@ class AngleConverter:
         57.29577951308232
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Degrees":
-            if to_unit == "Radians":
-                return value * (pi / 180.0)
-            elif to_unit == "Gradians":
-                return value * (200.0 / 180.0)
-            elif to_unit == "Milliradians":
-                return value * ((1000.0 * pi) / 180.0)
-            elif to_unit == "Minutes of Arc":
-                return value * 60.0
-            elif to_unit == "Seconds of Arc":
-                return value * 3600.0
-            
-        elif from_unit == "Radians":
-            if to_unit == "Degrees":
-                return value * (180.0 / pi)
-            elif to_unit == "Gradians":
-                return value * (200.0 / pi)
-            elif to_unit == "Milliradians":
-                return value * (1000.0)
-            elif to_unit == "Minutes of Arc":
-                return value * ((60.0 * 180.0) / pi)
-            elif to_unit == "Seconds of Arc":
-                return value * ((3600.0 * 180.0) / pi)
-            
-        elif from_unit == "Gradians":
-            if to_unit == "Degrees":
-                return value * (180.0 / 200.0)
-            elif to_unit == "Radians":
-                return value * (pi / 200.0)
-            elif to_unit == "Milliradians":
-                return value * ((1000.0 * pi) / 200.0)
-            elif to_unit == "Minutes of Arc":
-                return value * (60.0 / 54.0)
-            elif to_unit == "Seconds of Arc":
-                return value * (3600.0 / 3240.0)
-            
-        elif from_unit == "Milliradians":
-            if to_unit == "Degrees":
-                return value * ((180.0 * 1000.0 * pi))
-            elif to_unit == "Radians":
-                return value * (1000.0)
-            elif to_unit == "Gradians":
-                return value * ((200.0 * 1000.0 * pi))
-            elif to_unit == "Minutes of Arc":
-                return value * ((60.0 * 180.0 * 1000.0 * pi))
-            elif to_unit == "Seconds of Arc":
-                return value * ((3600.0 * 180.0 * 1000.0 * pi))
-            
-        elif from_unit == "Minutes of Arc":
-            if to_unit == "Degrees":
-                return value / 60.0
-            elif to_unit == "Radians":
-                return value * (pi / (60.0 * 180.0))
-            elif to_unit == "Gradians":
-                return value * 54.0
-            elif to_unit == "Milliradians":
-                return value * ((1000.0 * pi) / (60.0 * 180.0))
-            elif to_unit == "Seconds of Arc":
-                return value * 60.0
-            
-        elif from_unit == "Seconds of Arc":
-            if to_unit == "Degrees":
-                return value / 3600.0
-            elif to_unit == "Radians":
-                return value * (pi / (180.0 * 3600.0))
-            elif to_unit == "Gradians":
-                return value / 3240.0
-            elif to_unit == "Milliradians":
-                return value * ((1000.0 * pi) / (180.0 * 3600.0))
-            elif to_unit == "Minutes of Arc":
-                return value / 60.0
-
-        raise ValueError("Invalid units or conversion not supported")
+        return angle_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of angles from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return angle_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts an angle into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of angle_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
 
+        return angle_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts an angle from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Factors involving pi are exact only up to the float value of pi.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return angle_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of angles from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
 
+        return angle_table.convert_exact_batch(values, from_unit, to_unit, precision)
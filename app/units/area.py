@@ -11,13 +11,46 @@ AreaConverter : Provides a static method for converting area values
 
 Variables:
 ----------
+area_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 area_units : list
     A list of supported area units for conversion.
+area_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+area_table : UnitTable
+    The conversion table built from area_factors and area_aliases.
 -------------------------------------------------------------------------------
 """
 
-area_units = ["Square Metres", "Square Kilometers", "Square Miles", 
-              "Square Inches","Square Feet", "Square Yards", "Hectares", "Acres"]
+from app.units.dimensions import derive
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Square Metres, derived from length units
+area_factors = {
+    "Square Metres": derive(("length", "Meters", 2)),
+    "Square Kilometers": derive(("length", "Kilometers", 2)),
+    "Square Miles": derive(("length", "Miles", 2)),
+    "Square Inches": derive(("length", "Inches", 2)),
+    "Square Feet": derive(("length", "Feet", 2)),
+    "Square Yards": derive(("length", "Yards", 2)),
+    "Hectares": 10000 * derive(("length", "Meters", 2)),
+    "Acres": 43560 * derive(("length", "Feet", 2)),
+}
+
+# Symbols and alternative spellings accepted for each unit
+area_aliases = {
+    "Square Metres": ("m²", "m2", "sq m", "Square Metre", "Square Meters", "Square Meter"),
+    "Square Kilometers": ("km²", "km2", "sq km", "Square Kilometer", "Square Kilometres", "Square Kilometre"),
+    "Square Miles": ("mi²", "mi2", "sq mi", "Square Mile"),
+    "Square Inches": ("in²", "in2", "sq in", "Square Inch"),
+    "Square Feet": ("ft²", "ft2", "sq ft", "Square Foot"),
+    "Square Yards": ("yd²", "yd2", "sq yd", "Square Yard"),
+    "Hectares": ("ha", "Hectare"),
+    "Acres": ("ac", "Acre"),
+}
+
+area_units = list(area_factors)
+area_table = UnitTable("area", area_factors, area_aliases)
 
 class AreaConverter:
     """
@@ -27,6 +60,14 @@ class AreaConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts an area from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of areas from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts an area into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts an area exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of areas exactly.
     """
     
     @staticmethod
@@ -71,137 +112,120 @@ class AreaConverter:
         43560.0
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Square Metres":
-            if to_unit == "Square Kilometers":
-                return value / 1e+6
-            elif to_unit == "Square Miles":
-                return value / 2589988.10
-            elif to_unit == "Square Yards":
-                return value * 1.1959900463
-            elif to_unit == "Square Feet":
-                return value * 10.76391042
-            elif to_unit == "Square Inches":
-                return value * 1550.0
-            elif to_unit == "Hectares":
-                return value / 10000.0
-            elif to_unit == "Acres":
-                return value / 4046.86
-            
-        elif from_unit == "Square Kilometers":
-            if to_unit == "Square Metres":
-                return value * 1e+6
-            elif to_unit == "Square Miles":
-                return value / 2.58999
-            elif to_unit == "Square Yards":
-                return value * 1195990.05
-            elif to_unit == "Square Feet":
-                return value * 10763910.41671
-            elif to_unit == "Square Inches":
-                return value * 1550003100.00
-            elif to_unit == "Hectares":
-                return value * 100.0
-            elif to_unit == "Acres":
-                return value * 247.105
-        
-        elif from_unit == "Acres":
-            if to_unit == "Square Kilometers":
-                return value / 247.105
-            elif to_unit == "Square Metres":
-                return value * 4046.86
-            elif to_unit == "Square Miles":
-                return value / 640.0
-            elif to_unit == "Square Yards":
-                return value * 4840.0
-            elif to_unit == "Square Feet":
-                return value * 43560.0
-            elif to_unit == "Square Inches":
-                return value * 6272640.0
-            elif to_unit == "Hectares":
-                return value / 2.4710538146717
-            
-        elif from_unit == "Hectares":
-            if to_unit == "Square Kilometers":
-                return value / 100.0
-            elif to_unit == "Square Metres":
-                return value * 10000.0
-            elif to_unit == "Square Miles":
-                return value / 258.99881103
-            elif to_unit == "Square Yards":
-                return value * 11959.900463011
-            elif to_unit == "Square Feet":
-                return value * 107639.0
-            elif to_unit == "Square Inches":
-                return value * 15500031.0
-            elif to_unit == "Acres":
-                return value * 2.4710538146717
-            
-        elif from_unit == "Square Feet":
-            if to_unit == "Square Kilometers":
-                return value / 10763910.41671
-            elif to_unit == "Square Metres":
-                return value / 10.76391042
-            elif to_unit == "Square Miles":
-                return value / 27878400.0
-            elif to_unit == "Square Yards":
-                return value / 9.0
-            elif to_unit == "Square Inches":
-                return value * 144.0
-            elif to_unit == "Hectares":
-                return value / 107639.0
-            elif to_unit == "Acres":
-                return value / 43560.0
-            
-        elif from_unit == "Square Inches":
-            if to_unit == "Square Kilometers":
-                return value / 1550003100.00
-            elif to_unit == "Square Metres":
-                return value / 1550.0
-            elif to_unit == "Square Miles":
-                return value / 4014489600.0
-            elif to_unit == "Square Yards":
-                return value / 1296.0
-            elif to_unit == "Square Feet":
-                return value / 144.0
-            elif to_unit == "Hectares":
-                return value / 15500031.0
-            elif to_unit == "Acres":
-                return value / 6272640.0
-            
-        elif from_unit == "Square Miles":
-            if to_unit == "Square Kilometers":
-                return value * 2.58999
-            elif to_unit == "Square Metres":
-                return value * 2589988.10
-            elif to_unit == "Square Yards":
-                return value * 3097600.0
-            elif to_unit == "Square Feet":
-                return value * 27878400.0
-            elif to_unit == "Square Inches":
-                return value * 4014489600.0
-            elif to_unit == "Hectares":
-                return value * 258.99881103
-            elif to_unit == "Acres":
-                return value * 640.0
-            
-        elif from_unit == "Square Yards":
-            if to_unit == "Square Kilometers":
-                return value / 1195990.05
-            elif to_unit == "Square Metres":
-                return value / 1.1959900463
-            elif to_unit == "Square Miles":
-                return value / 3097600.0
-            elif to_unit == "Square Feet":
-                return value * 9.0
-            elif to_unit == "Square Inches":
-                return value * 1296.0
-            elif to_unit == "Hectares":
-                return value / 11959.900463011
-            elif to_unit == "Acres":
-                return value / 4840.0
-
-        raise ValueError("Invalid units or conversion not supported")
+        return area_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of areas from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return area_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts an area into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of area_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return area_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts an area from one unit to another without rounding, using
+        exact factors derived once per unit pair.
 
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return area_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of areas from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
 
+        return area_table.convert_exact_batch(values, from_unit, to_unit, precision)
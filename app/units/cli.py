@@ -0,0 +1,693 @@
+"""
+Command-Line Module
+
+This module provides headless commands running the converters in app/units
+over files, without loading the Kivy app:
+
+    python -m app.units.cli csv --column distance --from Miles --to Kilometers in.csv out.csv
+    python -m app.units.cli binary --dtype float32 --from psi --to kPa capture.bin out.bin
+    python -m app.units.cli jsonl jobs.jsonl results.jsonl
+
+CSV files are streamed through a generator pipeline in fixed-size chunks, and
+each chunk is converted with a single vectorized call, so memory stays flat
+however large the file is and the per-row Python work is limited to reading
+and writing the row.
+
+Raw binary arrays are opened with numpy.memmap and converted chunk by chunk,
+in place or into a memory-mapped output file, writing each result directly
+into the output pages: no value is ever copied into a Python object.
+
+Both commands accept --jobs to spread the chunks over the worker processes of
+app.units.parallel, the output keeping the order of the input.
+
+Newline-delimited JSON job files hold one request per line, such as
+{"category": "length", "from": "Miles", "to": "Kilometers", "value": 3} or
+with "values" holding an array. Requests are read in windows of lines and
+grouped by unit pair, each group being converted with one vectorized call,
+and the answers are written in input order.
+
+Functions:
+----------
+get_pair_converter(from_unit, to_unit, category=None) : Resolves a unit pair
+                                                        into a converter.
+get_pair_coefficients(from_unit, to_unit, category=None) : Resolves a unit
+                                                           pair into a scale
+                                                           and an offset.
+iter_chunks(iterable, size) : Groups an iterable into lists of up to size items.
+convert_csv(source, target, column, from_unit, to_unit, category=None,
+            chunk_size=65536, jobs=1) : Converts one column of a CSV stream.
+convert_binary(source, target, from_unit, to_unit, category=None,
+               dtype='float64', chunk_size=1048576, jobs=1) : Converts a raw
+                                                              binary array file.
+convert_jsonl(source, target, window=65536) : Answers a stream of JSON
+                                              conversion requests.
+main(argv=None) : Command-line entry point.
+
+Variables:
+----------
+default_chunk_size : int
+    Number of rows or values converted per vectorized call by default.
+binary_chunk_size : int
+    Number of values of a binary file converted at a time by default.
+-------------------------------------------------------------------------------
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from itertools import islice
+from app.units.engine import get_coefficients, get_converter, get_table
+from app.units.parsing import parse_numbers
+
+# Rows or values converted per vectorized call
+default_chunk_size = 65536
+# Values of a memory-mapped file converted at a time (8 MiB of float64)
+binary_chunk_size = 1 << 20
+
+
+def get_pair_converter(from_unit, to_unit, category=None):
+    """
+    Resolves a unit pair into a converter, inferring the category from the
+    units when it is not given.
+
+    Parameters:
+    -----------
+    from_unit : str
+        The unit of the input values, by name or alias.
+    to_unit : str
+        The unit to convert the values into, by name or alias.
+    category : str, optional
+        Name of the category of both units.
+
+    Returns:
+    --------
+    callable
+        The converter returned by engine.get_converter.
+
+    Raises:
+    -------
+    ValueError
+        If a unit is unknown or the units belong to different categories.
+    """
+
+    from app.units.aliases import resolve_pair
+
+    return get_converter(*resolve_pair(from_unit, to_unit, category))
+
+
+def get_pair_coefficients(from_unit, to_unit, category=None):
+    """
+    Resolves a unit pair into the (scale, offset) such that a value x converts
+    into scale * x + offset, inferring the category from the units when it is
+    not given. The offset is 0.0 for every category but temperature.
+
+    Raises:
+    -------
+    ValueError
+        If a unit is unknown or the units belong to different categories.
+    """
+
+    from app.units.aliases import resolve_pair
+
+    return get_coefficients(*resolve_pair(from_unit, to_unit, category))
+
+
+def iter_chunks(iterable, size):
+    """
+    Groups an iterable into lists of up to size items, lazily.
+
+    Raises:
+    -------
+    ValueError
+        If size is smaller than 1.
+
+    Examples:
+    ---------
+    >>> list(iter_chunks(range(5), 2))
+    [[0, 1], [2, 3], [4]]
+    """
+
+    if size < 1:
+        raise ValueError(f"Invalid chunk size: {size}")
+    return _chunks(iter(iterable), size)
+
+
+def _chunks(iterator, size):
+    """Yields the chunks of iter_chunks."""
+
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _convert_column(rows, index, converter):
+    """
+    Converts the cells of column index in a chunk of rows in place, with one
+    vectorized call. Cells that are not numbers are left untouched.
+    """
+
+    import numpy
+
+    cells = [row[index] if index < len(row) else "" for row in rows]
+    try:
+        values = numpy.array(cells, dtype=numpy.float64)
+        positions = range(len(rows))
+    except ValueError:
+        positions, numbers = parse_numbers(cells)
+        values = numpy.array(numbers, dtype=numpy.float64)
+
+    for position, value in zip(positions, converter(values).tolist()):
+        rows[position][index] = value
+    return rows
+
+
+def _convert_csv_chunk(task):
+    """
+    Converts a chunk of CSV rows in a worker process and returns them as CSV
+    text: task is (rows, index, category, from_unit, to_unit).
+    """
+
+    rows, index, category, from_unit, to_unit = task
+    text = io.StringIO()
+    csv.writer(text).writerows(_convert_column(rows, index, get_converter(category, from_unit, to_unit)))
+    return text.getvalue()
+
+
+def convert_csv(source, target, column, from_unit, to_unit, category=None,
+                chunk_size=default_chunk_size, jobs=1):
+    """
+    Converts one column of a CSV stream, writing every row to another stream.
+
+    Parameters:
+    -----------
+    source : file
+        The input CSV stream, whose first row is a header.
+    target : file
+        The output CSV stream.
+    column : str
+        The header of the column to convert.
+    from_unit : str
+        The unit of the column values.
+    to_unit : str
+        The unit to convert the column values into.
+    category : str, optional
+        Name of the category of both units, inferred from them by default.
+    chunk_size : int, optional
+        Number of rows converted per vectorized call.
+    jobs : int, optional
+        Number of worker processes converting and writing out chunks while
+        the next ones are read. 0 means one per CPU core.
+
+    Returns:
+    --------
+    int
+        The number of data rows written.
+
+    Raises:
+    -------
+    ValueError
+        If the column is missing or the units cannot be converted.
+    """
+
+    from app.units.aliases import resolve_pair
+
+    category, from_unit, to_unit = resolve_pair(from_unit, to_unit, category)
+    converter = get_converter(category, from_unit, to_unit)
+    reader = csv.reader(source)
+    writer = csv.writer(target)
+
+    header = next(reader, None)
+    if header is None:
+        return 0
+    if column not in header:
+        raise ValueError(f"Column not found: {column}")
+    index = header.index(column)
+    writer.writerow(header)
+
+    count = 0
+    if jobs == 1:
+        for rows in iter_chunks(reader, chunk_size):
+            writer.writerows(_convert_column(rows, index, converter))
+            count += len(rows)
+        return count
+
+    from app.units.parallel import imap_ordered
+
+    def tasks():
+        nonlocal count
+        for rows in iter_chunks(reader, chunk_size):
+            count += len(rows)
+            yield rows, index, category, from_unit, to_unit
+
+    for text in imap_ordered(_convert_csv_chunk, tasks(), jobs or None):
+        target.write(text)
+    return count
+
+
+def _convert_binary_range(task):
+    """
+    Converts the values start to stop of a binary file through memory maps:
+    task is (source, target, dtype, start, stop, scale, offset, chunk_size),
+    target being equal to source for an in-place conversion.
+    """
+
+    import numpy
+
+    source, target, dtype, start, stop, scale, offset, chunk_size = task
+    dtype = numpy.dtype(dtype)
+    shape = (stop - start,)
+    position = start * dtype.itemsize
+    if target == source:
+        values = results = numpy.memmap(source, dtype=dtype, mode="r+", offset=position, shape=shape)
+    else:
+        values = numpy.memmap(source, dtype=dtype, mode="r", offset=position, shape=shape)
+        results = numpy.memmap(target, dtype=dtype, mode="r+", offset=position, shape=shape)
+
+    for chunk_start in range(0, shape[0], chunk_size):
+        chunk = results[chunk_start:chunk_start + chunk_size]
+        numpy.multiply(values[chunk_start:chunk_start + chunk_size], scale, out=chunk, casting="same_kind")
+        if offset:
+            numpy.add(chunk, offset, out=chunk, casting="same_kind")
+    results.flush()
+    return stop - start
+
+
+def convert_binary(source, target, from_unit, to_unit, category=None,
+                   dtype="float64", chunk_size=binary_chunk_size, jobs=1):
+    """
+    Converts a file holding a raw array of floating-point values, chunk by
+    chunk through memory maps.
+
+    Each chunk is multiplied (and shifted, for temperature) straight from the
+    input pages into the output pages, so the only memory used is the page
+    cache, whatever the size of the file.
+
+    Parameters:
+    -----------
+    source : str
+        Path of the input file.
+    target : str or None
+        Path of the output file, created or overwritten with the same size as
+        the input. When None or equal to source, the file is converted in
+        place.
+    from_unit : str
+        The unit of the stored values.
+    to_unit : str
+        The unit to convert the values into.
+    category : str, optional
+        Name of the category of both units, inferred from them by default.
+    dtype : str, optional
+        NumPy floating-point dtype of the values, e.g. 'float32' or '>f8'.
+    chunk_size : int, optional
+        Number of values converted at a time.
+    jobs : int, optional
+        Number of worker processes, each mapping and converting its own
+        range of the file. 0 means one per CPU core.
+
+    Returns:
+    --------
+    int
+        The number of values converted.
+
+    Raises:
+    -------
+    ValueError
+        If the dtype is not a floating-point type, the file size is not a
+        multiple of its item size or the units cannot be converted.
+    """
+
+    import numpy
+
+    dtype = numpy.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"Expected a floating-point dtype, got {dtype}")
+    scale, offset = get_pair_coefficients(from_unit, to_unit, category)
+
+    size = os.path.getsize(source)
+    if size % dtype.itemsize:
+        raise ValueError(f"File size is not a multiple of {dtype.itemsize} bytes: {source}")
+    count = size // dtype.itemsize
+    # Compared by inode, so a link to the source is not truncated before it is read
+    if target is None or os.path.exists(target) and os.path.samefile(source, target):
+        target = source
+    else:
+        with open(target, "wb") as output:
+            output.truncate(size)
+    if count == 0:
+        return 0
+
+    if jobs == 1:
+        return _convert_binary_range((source, target, dtype.str, 0, count, scale, offset, chunk_size))
+
+    from app.units.parallel import imap_ordered
+
+    # A few ranges per worker, each a whole number of chunks
+    workers = jobs or os.cpu_count() or 1
+    range_size = max(chunk_size, -(-count // (4 * workers * chunk_size)) * chunk_size)
+    tasks = ((source, target, dtype.str, start, min(start + range_size, count), scale, offset, chunk_size)
+             for start in range(0, count, range_size))
+    return sum(imap_ordered(_convert_binary_range, tasks, jobs or None))
+
+
+def _reject_constant(name):
+    """Rejects the NaN and Infinity literals, which are not valid JSON."""
+
+    raise ValueError(f"Invalid number: {name}")
+
+
+def _parse_lines(lines):
+    """
+    Decodes a window of JSON lines one line at a time, so that every line
+    gives exactly one request, skipping blank ones. Lines that fail to decode
+    give their ValueError.
+    """
+
+    decode = json.JSONDecoder(parse_constant=_reject_constant).decode
+    requests = []
+    for line in lines:
+        if not line or line.isspace():
+            continue
+        try:
+            requests.append(decode(line.rstrip("\r\n")))
+        except ValueError as error:
+            requests.append(error)
+    return requests
+
+
+def _is_number(value):
+    """Returns whether a decoded JSON value is a number, booleans excluded."""
+
+    return type(value) is int or type(value) is float
+
+
+def _request_pair(key):
+    """
+    Resolves the (category, from, to) key of a request into the canonical
+    unit pair, or returns the ValueError explaining why it cannot be. Units
+    of a given category are canonicalized by its table, so that aliases of
+    the same pair share one group.
+    """
+
+    from app.units.aliases import resolve_pair
+
+    if not all(isinstance(part, str) for part in key if part is not None):
+        return ValueError("Invalid units or conversion not supported")
+    try:
+        category, from_unit, to_unit = resolve_pair(key[1], key[2], key[0] or None)
+        if key[0]:
+            table = get_table(category)
+            from_unit, to_unit = table.canonical(from_unit), table.canonical(to_unit)
+        pair = category, from_unit, to_unit
+        get_converter(*pair)
+    except ValueError as error:
+        return error
+    return pair
+
+
+def _request_error(request, error):
+    """Returns the message explaining why a request has no unit pair."""
+
+    if isinstance(request, ValueError):
+        return str(request)
+    if not isinstance(request, dict):
+        return "Expected a JSON object"
+    if isinstance(error, KeyError):
+        return f"Missing parameter: {error.args[0]}"
+    return "Invalid units or conversion not supported"
+
+
+def _answer_window(requests):
+    """
+    Answers a window of decoded requests, converting the values of all the
+    requests of each unit pair with one vectorized call.
+    """
+
+    import numpy
+
+    answers = [None] * len(requests)
+    pairs = {}
+    # Per unit pair: the flat values, and (position, start, length) per
+    # request, length being None for a single value
+    groups = {}
+    for position, request in enumerate(requests):
+        try:
+            key = (request.get("category"), request["from"], request["to"])
+            pair = pairs.get(key)
+        except (AttributeError, KeyError, TypeError) as error:
+            answers[position] = {"error": _request_error(request, error)}
+            continue
+        if pair is None:
+            pair = pairs[key] = _request_pair(key)
+        if isinstance(pair, ValueError):
+            answers[position] = {"error": str(pair)}
+            continue
+
+        group = groups.get(pair)
+        if group is None:
+            group = groups[pair] = ([], [])
+        numbers, members = group
+        if "values" in request:
+            values = request["values"]
+            if not isinstance(values, list) or not all(map(_is_number, values)):
+                answers[position] = {"error": "Expected an array of numbers"}
+                continue
+            members.append((position, len(numbers), len(values)))
+            numbers.extend(values)
+        elif "value" in request:
+            if not _is_number(request["value"]):
+                answers[position] = {"error": "Expected a number"}
+                continue
+            members.append((position, len(numbers), None))
+            numbers.append(request["value"])
+        else:
+            answers[position] = {"error": "Missing parameter: value"}
+
+    # Results too large for a float are reported by _encode_lines
+    with numpy.errstate(over="ignore"):
+        _convert_groups(requests, answers, groups)
+    return answers
+
+
+def _convert_groups(requests, answers, groups):
+    """
+    Converts the values of each unit pair of a window in one vectorized call
+    and fills in the answers of their requests.
+    """
+
+    import numpy
+
+    for pair, (numbers, members) in groups.items():
+        converter = get_converter(*pair)
+        try:
+            converted = converter(numpy.array(numbers, dtype=numpy.float64)).tolist()
+        except (TypeError, ValueError):
+            converted = None
+
+        category, from_unit, to_unit = pair
+        for position, start, length in members:
+            stop = start + (1 if length is None else length)
+            try:
+                if converted is not None:
+                    values = converted[start:stop]
+                else:
+                    values = converter(numpy.array(numbers[start:stop], dtype=numpy.float64)).tolist()
+            except (TypeError, ValueError):
+                answers[position] = {"error": "Expected a number" if length is None else "Expected an array of numbers"}
+                continue
+            answer = {**requests[position], "category": category, "from": from_unit, "to": to_unit}
+            if length is None:
+                answer["value"] = values[0]
+            else:
+                answer["values"] = values
+            answers[position] = answer
+
+
+def convert_jsonl(source, target, window=default_chunk_size):
+    """
+    Answers a stream of newline-delimited JSON conversion requests.
+
+    Each line holds an object with 'from', 'to' and either 'value' or a
+    'values' array, and optionally 'category'. It is answered on one line
+    with the same fields, the units replaced by their canonical names and
+    the values by the converted ones, or with an 'error' field. Requests are
+    processed a window of lines at a time, grouped by unit pair so that each
+    group is converted in one vectorized call, and answered in input order.
+
+    Parameters:
+    -----------
+    source : file
+        The input stream, one JSON request per line. Blank lines are skipped.
+    target : file
+        The output stream.
+    window : int, optional
+        Number of lines decoded, grouped and converted together, which bounds
+        the memory used.
+
+    Returns:
+    --------
+    int
+        The number of requests answered.
+    """
+
+    count = 0
+    for lines in iter_chunks(source, window):
+        answers = _answer_window(_parse_lines(lines))
+        target.write(_encode_lines(answers))
+        count += len(answers)
+    return count
+
+
+def _encode_lines(answers):
+    """
+    Encodes a list of objects as JSON lines. The list is encoded in a single
+    call, then split where one object ends and the next begins, unless that
+    separator also appears inside an object and the split would be ambiguous.
+    Answers whose results overflowed to infinity, which JSON cannot hold, are
+    replaced by an error.
+    """
+
+    try:
+        text = json.dumps(answers, allow_nan=False)
+    except ValueError:
+        text = None
+    if text is not None and text.count("}, {") == len(answers) - 1:
+        return text[1:-1].replace("}, {", "}\n{") + "\n"
+    return "".join([_encode_line(answer) + "\n" for answer in answers])
+
+
+def _encode_line(answer):
+    """Encodes one answer, or an error if its results are not finite."""
+
+    try:
+        return json.dumps(answer, allow_nan=False)
+    except ValueError:
+        return json.dumps({"error": "Result out of range"})
+
+
+def _open(path, mode):
+    """Opens a path for streaming, '-' standing for stdin or stdout."""
+
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def _run_csv(args):
+    """Runs the csv command."""
+
+    source = _open(args.input, "r")
+    target = _open(args.output, "w")
+    try:
+        count = convert_csv(source, target, args.column, args.from_unit, args.to_unit,
+                            args.category, args.chunk_size, args.jobs)
+    finally:
+        for stream in (source, target):
+            if stream not in (sys.stdin, sys.stdout):
+                stream.close()
+    print(f"{count} rows converted", file=sys.stderr)
+
+
+def _run_binary(args):
+    """Runs the binary command."""
+
+    count = convert_binary(args.input, args.output, args.from_unit, args.to_unit,
+                           args.category, args.dtype, args.chunk_size, args.jobs)
+    print(f"{count} values converted", file=sys.stderr)
+
+
+def _run_jsonl(args):
+    """Runs the jsonl command."""
+
+    source = _open(args.input, "r")
+    target = _open(args.output, "w")
+    try:
+        count = convert_jsonl(source, target, args.window)
+    finally:
+        for stream in (source, target):
+            if stream not in (sys.stdin, sys.stdout):
+                stream.close()
+    print(f"{count} requests answered", file=sys.stderr)
+
+
+def _positive_int(text):
+    """Parses a command-line count, which must be at least 1."""
+
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text!r}")
+    return value
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Parameters:
+    -----------
+    argv : list, optional
+        Command-line arguments, defaulting to sys.argv[1:].
+
+    Returns:
+    --------
+    int
+        The process exit status.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.units.cli",
+        description="Convert the values of files between units.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    csv_parser = commands.add_parser("csv", help="convert one column of a CSV file")
+    csv_parser.add_argument("--column", required=True, help="header of the column to convert")
+    csv_parser.add_argument("--from", dest="from_unit", required=True, help="unit of the column values")
+    csv_parser.add_argument("--to", dest="to_unit", required=True, help="unit to convert the values into")
+    csv_parser.add_argument("--category", help="category of the units, inferred by default")
+    csv_parser.add_argument("--chunk-size", type=_positive_int, default=default_chunk_size,
+                            help="rows converted at a time")
+    csv_parser.add_argument("--jobs", type=int, default=1,
+                            help="worker processes, 0 for one per CPU core")
+    csv_parser.add_argument("input", help="input CSV file, or - for stdin")
+    csv_parser.add_argument("output", help="output CSV file, or - for stdout")
+    csv_parser.set_defaults(run=_run_csv)
+
+    binary_parser = commands.add_parser("binary", help="convert a raw binary array of floats")
+    binary_parser.add_argument("--from", dest="from_unit", required=True, help="unit of the stored values")
+    binary_parser.add_argument("--to", dest="to_unit", required=True, help="unit to convert the values into")
+    binary_parser.add_argument("--category", help="category of the units, inferred by default")
+    binary_parser.add_argument("--dtype", default="float64", help="dtype of the values, e.g. float32 or >f8")
+    binary_parser.add_argument("--chunk-size", type=_positive_int, default=binary_chunk_size,
+                               help="values converted at a time")
+    binary_parser.add_argument("--jobs", type=int, default=1,
+                               help="worker processes, 0 for one per CPU core")
+    binary_parser.add_argument("input", help="input binary file")
+    binary_parser.add_argument("output", nargs="?", help="output binary file, the input is converted in place by default")
+    binary_parser.set_defaults(run=_run_binary)
+
+    jsonl_parser = commands.add_parser("jsonl", help="answer a file of JSON conversion requests")
+    jsonl_parser.add_argument("--window", type=_positive_int, default=default_chunk_size,
+                              help="lines grouped and converted together")
+    jsonl_parser.add_argument("input", help="input JSONL file, or - for stdin")
+    jsonl_parser.add_argument("output", help="output JSONL file, or - for stdout")
+    jsonl_parser.set_defaults(run=_run_jsonl)
+
+    args = parser.parse_args(argv)
+    try:
+        args.run(args)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
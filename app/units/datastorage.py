@@ -11,13 +11,61 @@ DataStorageConverter : Provides a static method for converting data storage
 
 Variables:
 ----------
+data_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 data_units : list
     A list of supported data storage units for conversion.
+data_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+data_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols, prefix systems
+    and smallest prefix power of ten.
+data_table : UnitTable
+    The conversion table built from data_factors, data_aliases and data_prefixed.
 -------------------------------------------------------------------------------
 """
 
-data_units = ["Bits", "Kilobits", "Megabits", "Gigabits", "Terabits", "Kilobytes",
-              "Megabytes", "Gigabytes", "Terabytes", "Kibibits", "Mebibits"]
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Bits
+data_factors = {
+    "Bits": 1.0,
+    "Kilobits": 1000.0,
+    "Megabits": 1e+6,
+    "Gigabits": 1e+9,
+    "Terabits": 1e+12,
+    "Kilobytes": 8000.0,
+    "Megabytes": 8e+6,
+    "Gigabytes": 8e+9,
+    "Terabytes": 8e+12,
+    "Kibibits": 1024.0,
+    "Mebibits": 1048576.0,
+}
+
+# Symbols and alternative spellings accepted for each unit
+data_aliases = {
+    "Bits": ("b", "bit", "Bit"),
+    "Kilobits": ("kbit", "Kb", "Kilobit"),
+    "Megabits": ("Mbit", "Mb", "Megabit"),
+    "Gigabits": ("Gbit", "Gb", "Gigabit"),
+    "Terabits": ("Tbit", "Tb", "Terabit"),
+    "Kilobytes": ("kB", "KB", "Kilobyte"),
+    "Megabytes": ("MB", "Megabyte"),
+    "Gigabytes": ("GB", "Gigabyte"),
+    "Terabytes": ("TB", "Terabyte"),
+    "Kibibits": ("Kibit", "Kib", "Kibibit"),
+    "Mebibits": ("Mibit", "Mib", "Mebibit"),
+}
+
+# Units accepting SI and IEC prefixes, generated on demand, from kilo up:
+# (factor, symbols, prefix systems, smallest power of ten)
+data_prefixed = {
+    "Bits": (1.0, ("bit", "b"), ("SI", "IEC"), 3),
+    "Bytes": (8.0, ("B",), ("SI", "IEC"), 3),
+}
+
+data_units = list(data_factors)
+data_table = UnitTable("datastorage", data_factors, data_aliases, data_prefixed)
 
 class DataStorageConverter:
     """
@@ -28,6 +76,14 @@ class DataStorageConverter:
     convert(value, from_unit, to_unit)
         Converts a data storage value from one unit to another, if the conversion
         is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of data storage values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a data storage value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a data storage value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of data storage values exactly.
     """
     
     @staticmethod
@@ -75,249 +131,120 @@ class DataStorageConverter:
         8000000000.0
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Bits":
-            if to_unit == "Kilobits":
-                return value / 1000.0
-            elif to_unit == "Megabits":
-                return value / 1e+6
-            elif to_unit == "Gigabits":
-                return value / 1e+9
-            elif to_unit == "Terabits":
-                return value / 1e+12
-            elif to_unit == "Kilobytes":
-                return value / 8000.0
-            elif to_unit == "Megabytes":
-                return value / 8e+6
-            elif to_unit == "Gigabytes":
-                return value / 8e+9
-            elif to_unit == "Terabytes":
-                return value / 8e+12
-            elif to_unit == "Kibibits":
-                return value / 1024.0
-            elif to_unit == "Mebibits":
-                return value / 1048576.0
-
-        elif from_unit == "Kilobits":
-            if to_unit == "Bits":
-                return value * 1000.0
-            elif to_unit == "Megabits":
-                return value / 1000.0
-            elif to_unit == "Gigabits":
-                return value / 1e+6
-            elif to_unit == "Terabits":
-                return value / 1e+9
-            elif to_unit == "Kilobytes":
-                return value / 8.0
-            elif to_unit == "Megabytes":
-                return value / 8000.0
-            elif to_unit == "Gigabytes":
-                return value / 8e+6
-            elif to_unit == "Terabytes":
-                return value / 8e+9
-            elif to_unit == "Kibibits":
-                return value / 1.024
-            elif to_unit == "Mebibits":
-                return value / 1048.58
-
-        elif from_unit == "Megabits":
-            if to_unit == "Bits":
-                return value * 1e+6
-            elif to_unit == "Kilobits":
-                return value * 1000.0
-            elif to_unit == "Gigabits":
-                return value / 1000.0
-            elif to_unit == "Terabits":
-                return value / 1e+6
-            elif to_unit == "Kilobytes":
-                return value * 125.0
-            elif to_unit == "Megabytes":
-                return value / 8.0
-            elif to_unit == "Gigabytes":
-                return value / 8000.0
-            elif to_unit == "Terabytes":
-                return value / 8e+6
-            elif to_unit == "Kibibits":
-                return value * 976.563
-            elif to_unit == "Mebibits":
-                return value / 1.04858
-
-        elif from_unit == "Gigabits":
-            if to_unit == "Bits":
-                return value * 1e+9
-            elif to_unit == "Kilobits":
-                return value * 1e+6
-            elif to_unit == "Megabits":
-                return value * 1000.0
-            elif to_unit == "Terabits":
-                return value / 1000.0
-            elif to_unit == "Kilobytes":
-                return value * 125000.0
-            elif to_unit == "Megabytes":
-                return value * 125.0
-            elif to_unit == "Gigabytes":
-                return value / 8.0
-            elif to_unit == "Terabytes":
-                return value / 8000.0
-            elif to_unit == "Kibibits":
-                return value * 976562.5
-            elif to_unit == "Mebibits":
-                return value * 953.67431640625
-
-        elif from_unit == "Terabits":
-            if to_unit == "Bits":
-                return value * 1e+12
-            elif to_unit == "Kilobits":
-                return value * 1e+9
-            elif to_unit == "Megabits":
-                return value * 1e+6
-            elif to_unit == "Gigabits":
-                return value * 1000.0
-            elif to_unit == "Kilobytes":
-                return value * 1.25e+8
-            elif to_unit == "Megabytes":
-                return value * 125000.0
-            elif to_unit == "Gigabytes":
-                return value * 125.0
-            elif to_unit == "Terabytes":
-                return value / 8.0
-            elif to_unit == "Kibibits":
-                return value * 976562500.0
-            elif to_unit == "Mebibits":
-                return value * 953674.0
-
-        elif from_unit == "Kilobytes":
-            if to_unit == "Bits":
-                return value * 8000.0
-            elif to_unit == "Kilobits":
-                return value * 8.0
-            elif to_unit == "Megabits":
-                return value / 125.0
-            elif to_unit == "Gigabits":
-                return value / 125000.0
-            elif to_unit == "Terabits":
-                return value / 1.25e+8
-            elif to_unit == "Megabytes":
-                return value / 1000.0
-            elif to_unit == "Gigabytes":
-                return value / 1e+6
-            elif to_unit == "Terabytes":
-                return value / 1e+9
-            elif to_unit == "Kibibits":
-                return value * 7.8125
-            elif to_unit == "Mebibits":
-                return value * 0.00762939
-
-        elif from_unit == "Megabytes":
-            if to_unit == "Bits":
-                return value * 8e+6
-            elif to_unit == "Kilobits":
-                return value * 8000.0
-            elif to_unit == "Megabits":
-                return value * 8.0
-            elif to_unit == "Gigabits":
-                return value / 125.0
-            elif to_unit == "Terabits":
-                return value / 125000.0
-            elif to_unit == "Kilobytes":
-                return value * 1000.0
-            elif to_unit == "Gigabytes":
-                return value / 1000.0
-            elif to_unit == "Terabytes":
-                return value / 1e+6
-            elif to_unit == "Kibibits":
-                return value * 7812.5
-            elif to_unit == "Mebibits":
-                return value * 7.62939
-
-        elif from_unit == "Gigabytes":
-            if to_unit == "Bits":
-                return value * 8e+9
-            elif to_unit == "Kilobits":
-                return value * 8e+6
-            elif to_unit == "Megabits":
-                return value * 8000.0
-            elif to_unit == "Gigabits":
-                return value * 8.0
-            elif to_unit == "Terabits":
-                return value / 125.0
-            elif to_unit == "Kilobytes":
-                return value * 1e+6
-            elif to_unit == "Megabytes":
-                return value * 1000.0
-            elif to_unit == "Terabytes":
-                return value / 1000.0
-            elif to_unit == "Kibibits":
-                return value * 7812500.0
-            elif to_unit == "Mebibits":
-                return value * 7629.39
-
-        elif from_unit == "Terabytes":
-            if to_unit == "Bits":
-                return value * 8e+12
-            elif to_unit == "Kilobits":
-                return value * 8e+9
-            elif to_unit == "Megabits":
-                return value * 8e+6
-            elif to_unit == "Gigabits":
-                return value * 8000.0
-            elif to_unit == "Terabits":
-                return value * 8.0
-            elif to_unit == "Kilobytes":
-                return value * 1e+9
-            elif to_unit == "Megabytes":
-                return value * 1e+6
-            elif to_unit == "Gigabytes":
-                return value * 1000.0
-            elif to_unit == "Kibibits":
-                return value * 7812500000.0
-            elif to_unit == "Mebibits":
-                return value / 0.000000131072
-
-        elif from_unit == "Kibibits":
-            if to_unit == "Bits":
-                return value * 1024.0
-            elif to_unit == "Kilobits":
-                return value * 1.024
-            elif to_unit == "Megabits":
-                return value / 976.563
-            elif to_unit == "Gigabits":
-                return value / 976562.5
-            elif to_unit == "Terabits":
-                return value / 976562500.0
-            elif to_unit == "Kilobytes":
-                return value / 7.8125
-            elif to_unit == "Megabytes":
-                return value / 7812.5
-            elif to_unit == "Gigabytes":
-                return value / 7812500.0
-            elif to_unit == "Terabytes":
-                return value / 7812500000.0
-            elif to_unit == "Mebibits":
-                return value / 1024.0
-
-        elif from_unit == "Mebibits":
-            if to_unit == "Bits":
-                return value * 1048576.0
-            elif to_unit == "Kilobits":
-                return value * 1048.58
-            elif to_unit == "Megabits":
-                return value * 1.04858
-            elif to_unit == "Gigabits":
-                return value / 953.67431640625
-            elif to_unit == "Terabits":
-                return value / 953674.0
-            elif to_unit == "Kilobytes":
-                return value / 0.00762939
-            elif to_unit == "Megabytes":
-                return value / 7.62939
-            elif to_unit == "Gigabytes":
-                return value / 7629.39
-            elif to_unit == "Terabytes":
-                return value * 0.000000131072
-            elif to_unit == "Kibibits":
-                return value * 1024.0
-            
-        raise ValueError("Invalid units or conversion not supported")
\ No newline at end of file
+        return data_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of data storage values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return data_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a data storage value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of data_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return data_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a data storage value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return data_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of data storage values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return data_table.convert_exact_batch(values, from_unit, to_unit, precision)
@@ -0,0 +1,273 @@
+"""
+Dimensions Module
+
+This module describes every linear category in app/units by a vector of
+exponents over base dimensions (length, mass, time, information and angle),
+so that compound units are derived from base units instead of being
+hard-coded. Area, volume and speed build their factor tables with derive(),
+and arbitrary compound expressions such as "kg/m³" or "GB/s" can be parsed
+into an SI factor and a dimension.
+
+Derived factors are exact fractions and are cached on first use, so the
+tables built from them stay as fast as hand-written ones.
+
+Classes:
+--------
+Dimension : Exponents of a quantity over the base dimensions.
+Quantity : An SI factor paired with a Dimension.
+
+Functions:
+----------
+si_factor(category, unit) : Returns the value of a unit in SI units.
+derive(*terms) : Returns the SI factor of a product of unit powers.
+parse(expression) : Parses a compound unit expression into a Quantity.
+convert(value, from_expression, to_expression) : Converts between two
+                                                 compound unit expressions.
+
+Variables:
+----------
+dimensions : dict
+    Maps each linear category to its Dimension.
+si_units : dict
+    Maps each linear category to its SI unit.
+-------------------------------------------------------------------------------
+"""
+
+import re
+from collections import namedtuple
+from fractions import Fraction
+from functools import lru_cache
+from app.units.engine import exact_factor, get_table
+
+
+class Dimension(namedtuple("Dimension", ["length", "mass", "time", "information", "angle"])):
+    """
+    Exponents of a quantity over the base dimensions.
+
+    Methods:
+    --------
+    __mul__(other)
+        Returns the dimension of the product of two quantities.
+    __pow__(power)
+        Returns the dimension of a quantity raised to a power.
+    """
+
+    __slots__ = ()
+
+    def __mul__(self, other):
+        return Dimension(*(a + b for a, b in zip(self, other)))
+
+    def __pow__(self, power):
+        return Dimension(*(a * power for a in self))
+
+
+Quantity = namedtuple("Quantity", ["factor", "dimension"])
+
+dimensions = {
+    "length": Dimension(1, 0, 0, 0, 0),
+    "mass": Dimension(0, 1, 0, 0, 0),
+    "time": Dimension(0, 0, 1, 0, 0),
+    "datastorage": Dimension(0, 0, 0, 1, 0),
+    "angle": Dimension(0, 0, 0, 0, 1),
+    "area": Dimension(2, 0, 0, 0, 0),
+    "volume": Dimension(3, 0, 0, 0, 0),
+    "speed": Dimension(1, 0, -1, 0, 0),
+    "frequency": Dimension(0, 0, -1, 0, 0),
+    "force": Dimension(1, 1, -2, 0, 0),
+    "pressure": Dimension(-1, 1, -2, 0, 0),
+}
+
+si_units = {
+    "length": "Meters",
+    "mass": "Kilograms",
+    "time": "Seconds",
+    "datastorage": "Bits",
+    "angle": "Radians",
+    "area": "Square Metres",
+    "volume": "Cubic Metres",
+    "speed": "Metres per Second",
+    "frequency": "Hertz",
+    "force": "Newtons",
+    "pressure": "Pascals",
+}
+
+# A unit symbol followed by an optional power, e.g. "m", "s^-2" or "m³"
+_term_pattern = re.compile(r"(?P<symbol>.+?)(?:\^(?P<power>[+-]?\d+)|(?P<superscript>[²³]))?")
+_operator_pattern = re.compile(r"\s*([*/·])\s*")
+_superscripts = {"²": 2, "³": 3}
+
+
+@lru_cache(maxsize=None)
+def si_factor(category, unit):
+    """
+    Returns the exact value of a unit in the SI unit of its category.
+
+    Parameters:
+    -----------
+    category : str
+        Name of a linear category (e.g. 'length').
+    unit : str
+        Name of a unit of that category.
+
+    Returns:
+    --------
+    Fraction
+        The value of one unit in SI units.
+
+    Raises:
+    -------
+    ValueError
+        If the category has no dimension or the unit is unknown.
+    """
+
+    if category not in dimensions:
+        raise ValueError(f"Category has no linear dimension: {category}")
+
+    factors = get_table(category).factors
+    try:
+        return exact_factor(factors[unit]) / exact_factor(factors[si_units[category]])
+    except KeyError:
+        raise ValueError("Invalid units or conversion not supported") from None
+
+
+def derive(*terms):
+    """
+    Returns the exact SI factor of a product of unit powers.
+
+    Parameters:
+    -----------
+    *terms : tuple
+        (category, unit, power) triples, e.g. ('length', 'Miles', 1) and
+        ('time', 'Hours', -1) for Miles per Hour.
+
+    Returns:
+    --------
+    Fraction
+        The value of one derived unit in SI units.
+
+    Examples:
+    ---------
+    >>> derive(('length', 'Feet', 2))
+    Fraction(145161, 1562500)
+    """
+
+    factor = Fraction(1)
+    for category, unit, power in terms:
+        factor *= si_factor(category, unit) ** power
+    return factor
+
+
+@lru_cache(maxsize=1024)
+def parse(expression):
+    """
+    Parses a compound unit expression into its SI factor and dimension.
+
+    Terms are unit names or aliases resolved through the alias index, which
+    also generates prefixed units such as 'PB' or 'THz', optionally
+    raised to a power with '^n', '²' or '³', and joined with '*', '·' or '/'.
+    Each '/' divides by the term that follows it.
+
+    Parameters:
+    -----------
+    expression : str
+        The expression to parse, e.g. 'kg/m³', 'GB/s' or 'm/s^2'.
+
+    Returns:
+    --------
+    Quantity
+        The SI factor and the dimension of the expression.
+
+    Raises:
+    -------
+    ValueError
+        If a term does not denote a unit of a linear category.
+
+    Examples:
+    ---------
+    >>> parse('km/h').factor
+    Fraction(5, 18)
+    """
+
+    from app.units.aliases import resolve
+
+    expression = expression.strip()
+    try:
+        return _unit_quantity(resolve(expression))
+    except ValueError:
+        pass
+
+    tokens = _operator_pattern.split(expression)
+    factor = Fraction(1)
+    dimension = Dimension(0, 0, 0, 0, 0)
+    sign = 1
+    for position, token in enumerate(tokens):
+        if position % 2:
+            sign = -1 if token == "/" else 1
+            continue
+
+        match = _term_pattern.fullmatch(token)
+        if not token or match is None:
+            raise ValueError(f"Invalid unit expression: {expression}")
+        try:
+            unit = resolve(token)
+            power = 1
+        except ValueError:
+            unit = resolve(match["symbol"])
+            power = int(match["power"] or _superscripts.get(match["superscript"], 1))
+
+        quantity = _unit_quantity(unit)
+        factor *= quantity.factor ** (sign * power)
+        dimension = dimension * quantity.dimension ** (sign * power)
+    return Quantity(factor, dimension)
+
+
+def _unit_quantity(unit):
+    """Returns the Quantity of a registered unit."""
+
+    if unit.category not in dimensions:
+        raise ValueError(f"Unit cannot be combined: {unit.name}")
+    return Quantity(si_factor(unit.category, unit.name), dimensions[unit.category])
+
+
+@lru_cache(maxsize=1024)
+def _ratio(from_expression, to_expression):
+    """Returns the multiplier between two compound unit expressions."""
+
+    source = parse(from_expression)
+    target = parse(to_expression)
+    if source.dimension != target.dimension:
+        raise ValueError(f"Incompatible dimensions: {from_expression} and {to_expression}")
+    return float(source.factor / target.factor)
+
+
+def convert(value, from_expression, to_expression):
+    """
+    Converts a value between two compound unit expressions of the same
+    dimension.
+
+    Parameters:
+    -----------
+    value : float
+        The numerical value to be converted.
+    from_expression : str
+        The unit expression of the input value, e.g. 'kg/m³'.
+    to_expression : str
+        The unit expression to convert the value into, e.g. 'g/cm³'.
+
+    Returns:
+    --------
+    float
+        The converted value.
+
+    Raises:
+    -------
+    ValueError
+        If an expression is invalid or the dimensions differ.
+
+    Examples:
+    ---------
+    >>> convert(1000, 'kg/m³', 'g/cm³')
+    1.0
+    """
+
+    return value * _ratio(from_expression, to_expression)
@@ -0,0 +1,922 @@
+"""
+Conversion Engine Module
+
+This module provides the table-driven engine shared by the unit modules in
+app/units. Each category declares a single factor per unit, expressing how many
+base units one unit is worth, and the engine derives every pairwise ratio from
+that table once. A conversion is then a dictionary lookup and one
+multiplication, whatever the unit pair. Names that are not found are resolved
+through the alias index, so symbols and spellings such as 'km' or 'KM/H' are
+accepted as well. Arrays are converted through a dense factor matrix indexed
+by unit ID, built with NumPy the first time a batch conversion is requested.
+
+Every table also keeps the exact rational value of each ratio, derived once,
+so that conversions can return fractions.Fraction or a Decimal at a chosen
+precision without rounding error from the factor literals.
+
+Categories with a shifted zero, such as temperature, are described instead by
+an affine transform per unit, and every pair reduces to a single a * x + b.
+
+Classes:
+--------
+UnitTable : Holds the factor table of a category and converts values with it.
+AffineTransform : A scale and offset pair that can be applied and composed.
+AffineTable : Holds the affine transforms of a category and converts values with them.
+
+Functions:
+----------
+get_table(category) : Returns the conversion table of a category by name.
+get_converter(category, from_unit, to_unit) : Returns a cached callable
+                                              specialized for one unit pair.
+get_coefficients(category, from_unit, to_unit) : Returns the scale and offset
+                                                 of one unit pair.
+
+Variables:
+----------
+categories : list
+    Names of the unit modules in app/units, one per category.
+-------------------------------------------------------------------------------
+"""
+
+import numbers
+from collections import namedtuple
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache
+from importlib import import_module
+
+# Names of the unit modules in app/units, one per category
+categories = ["angle", "area", "datastorage", "force", "frequency", "length",
+              "mass", "pressure", "speed", "temperature", "time", "volume"]
+
+# Conversion tables by category name, filled in as the unit modules are imported
+_tables = {}
+
+
+def exact_factor(factor):
+    """
+    Returns the exact rational value a factor literal stands for.
+
+    Float literals are read back through their shortest decimal representation
+    so that a factor written as 0.3048 is treated as 3048/10000 rather than as
+    its nearest binary approximation.
+
+    Parameters:
+    -----------
+    factor : int, float, str, Decimal or Fraction
+        The factor to convert. NumPy integer and floating-point scalars are
+        read like int and float.
+
+    Returns:
+    --------
+    Fraction
+        The exact value of the factor.
+    """
+
+    if isinstance(factor, numbers.Integral):
+        return Fraction(int(factor))
+    if isinstance(factor, numbers.Real) and not isinstance(factor, numbers.Rational):
+        return Fraction(repr(float(factor)))
+    return Fraction(factor)
+
+
+class UnitTable:
+    """
+    A class used to convert values between the units of one category.
+
+    Attributes:
+    -----------
+    name : str
+        Name of the category (e.g. 'length').
+    factors : dict
+        Maps each unit name to its value expressed in the base unit.
+    units : list
+        Unit names in declaration order, followed by the units added later.
+    declared : int
+        Number of units declared by the category, the first ones of units.
+    aliases : dict
+        Maps unit names to their symbols and alternative spellings.
+    prefixed : dict
+        Maps the units accepting SI or IEC prefixes to their
+        (factor, symbols, prefix systems[, smallest power of ten]).
+    ratios : dict
+        Maps each (from_unit, to_unit) pair to its precomputed multiplier.
+    exact_ratios : dict
+        Maps each (from_unit, to_unit) pair to its exact multiplier as a Fraction.
+    index : dict
+        Maps each unit name to its unit ID, its position in units.
+
+    Methods:
+    --------
+    canonical(unit)
+        Returns the name of a unit of the table given a name or an alias.
+    ratio(from_unit, to_unit)
+        Returns the multiplier converting from_unit into to_unit.
+    convert(value, from_unit, to_unit)
+        Converts a value from one unit to another.
+    unit_id(unit)
+        Returns the ID of a unit within the table.
+    matrix
+        The N x N factor matrix, built on first access.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a value into every declared unit of the table at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of values exactly.
+    add_unit(name, factor, aliases=())
+        Adds a unit to the table after construction.
+    """
+
+    def __init__(self, name, factors, aliases=None, prefixed=None):
+        """
+        Initializes the table and precomputes the ratio of every unit pair.
+
+        Ratios are computed exactly from the factor literals and rounded once,
+        so a pair such as Inches to Centimeters yields exactly 2.54.
+
+        Parameters:
+        -----------
+        name : str
+            Name of the category.
+        factors : dict
+            Maps each unit name to its value expressed in the base unit.
+        aliases : dict, optional
+            Maps unit names to their symbols and alternative spellings.
+        prefixed : dict, optional
+            Maps the units accepting prefixes to their (factor, symbols,
+            prefix systems), e.g. {'Bytes': (8, ('B',), ('SI', 'IEC'))},
+            optionally followed by the smallest power of ten a prefix may
+            stand for, e.g. 3 to start at kilo. Prefixed units are generated
+            lazily by app.units.prefixes.
+        """
+
+        self.name = name
+        self.factors = dict(factors)
+        self.units = list(self.factors)
+        self.declared = len(self.units)
+        self.aliases = dict(aliases or {})
+        self.prefixed = dict(prefixed or {})
+        self.index = {unit: unit_id for unit_id, unit in enumerate(self.units)}
+        self._matrix = None
+        _tables[name] = self
+
+        self._exact_factors = {unit: exact_factor(factor) for unit, factor in self.factors.items()}
+        self.exact_ratios = {
+            (from_unit, to_unit): from_factor / to_factor
+            for from_unit, from_factor in self._exact_factors.items()
+            for to_unit, to_factor in self._exact_factors.items()
+        }
+        self.ratios = {pair: float(ratio) for pair, ratio in self.exact_ratios.items()}
+
+    def add_unit(self, name, factor, aliases=()):
+        """
+        Adds a unit to the table after construction, computing its ratios to
+        every existing unit. The factor matrix is rebuilt on its next use.
+        The unit gets the next ID but is not one of the declared units, so
+        convert_to_all leaves it out.
+
+        The ratios are in place before the unit is listed in units and index,
+        so readers never find a listed unit without ratios. Concurrent calls
+        must be serialized by the caller, as app.units.prefixes does.
+
+        Parameters:
+        -----------
+        name : str
+            Name of the new unit.
+        factor : int, float or Fraction
+            Value of the new unit expressed in the base unit.
+        aliases : tuple, optional
+            Symbols and alternative spellings of the new unit.
+        """
+
+        exact = exact_factor(factor)
+        self.factors[name] = factor
+        self.aliases[name] = tuple(aliases)
+        self._exact_factors[name] = exact
+        for other, other_factor in list(self._exact_factors.items()):
+            self.exact_ratios[name, other] = exact / other_factor
+            self.exact_ratios[other, name] = other_factor / exact
+            self.ratios[name, other] = float(exact / other_factor)
+            self.ratios[other, name] = float(other_factor / exact)
+        self.index[name] = len(self.units)
+        self.units.append(name)
+        self._matrix = None
+
+    def canonical(self, unit):
+        """
+        Returns the name of a unit of the table given its name, one of its
+        aliases (e.g. 'km' or 'KM/H').
+
+        Raises:
+        -------
+        ValueError
+            If the unit does not resolve to a unit of the table.
+        """
+
+        return _canonical(self, unit)
+
+    def ratio(self, from_unit, to_unit):
+        """
+        Returns the multiplier converting from_unit into to_unit.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            return self.ratios[from_unit, to_unit]
+        except KeyError:
+            return self.ratios[self.canonical(from_unit), self.canonical(to_unit)]
+
+    def convert(self, value, from_unit, to_unit):
+        """
+        Converts a value from one unit to another.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value.
+        to_unit : str
+            The unit to convert the value into.
+
+        Returns:
+        --------
+        float
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            return value * self.ratios[from_unit, to_unit]
+        except KeyError:
+            return value * self.ratio(from_unit, to_unit)
+
+    def unit_id(self, unit):
+        """
+        Returns the ID of a unit within the table.
+
+        Raises:
+        -------
+        ValueError
+            If the unit does not belong to the table.
+        """
+
+        try:
+            return self.index[unit]
+        except KeyError:
+            return self.index[self.canonical(unit)]
+
+    @property
+    def matrix(self):
+        """
+        The N x N factor matrix of the table, where matrix[i, j] converts unit
+        ID i into unit ID j. It is built from the ratios on first access.
+        """
+
+        if self._matrix is None:
+            import numpy
+
+            units = list(self.units)
+            self._matrix = numpy.array(
+                [[self.ratios[from_unit, to_unit] for to_unit in units]
+                 for from_unit in units],
+                dtype=numpy.float64,
+            )
+        return self._matrix
+
+    def convert_batch(self, values, from_unit, to_unit):
+        """
+        Converts an array of values from one unit to another with a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values.
+        to_unit : str
+            The unit to convert the values into.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit, as float64.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        import numpy
+
+        from_id, to_id = self.unit_id(from_unit), self.unit_id(to_unit)
+        factor = self.matrix[from_id, to_id]
+        return numpy.multiply(values, factor, dtype=numpy.float64)
+
+    def convert_to_all(self, value, from_unit):
+        """
+        Converts a value into every declared unit of the table with a single
+        vectorized multiplication by the row of from_unit in the factor
+        matrix. Units generated later, such as prefixed units, are left out.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, where element i is expressed in units[i],
+            for each of the declared units.
+
+        Raises:
+        -------
+        ValueError
+            If the unit does not belong to the table.
+        """
+
+        from_id = self.unit_id(from_unit)
+        return self.matrix[from_id, :self.declared] * value
+
+    def convert_exact(self, value, from_unit, to_unit, precision=None):
+        """
+        Converts a value from one unit to another without rounding.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted. Floats are read through their
+            shortest decimal representation, so 0.1 means exactly 1/10.
+        from_unit : str
+            The unit of the input value.
+        to_unit : str
+            The unit to convert the value into.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            ratio = self.exact_ratios[from_unit, to_unit]
+        except KeyError:
+            ratio = self.exact_ratios[self.canonical(from_unit), self.canonical(to_unit)]
+        return _exact_result(exact_factor(value) * ratio, precision)
+
+    def convert_exact_batch(self, values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of values from one unit to another without
+        rounding, looking the exact ratio up once.
+
+        Returns:
+        --------
+        list
+            The converted values, as Fractions or as Decimals when a precision
+            is given.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            ratio = self.exact_ratios[from_unit, to_unit]
+        except KeyError:
+            ratio = self.exact_ratios[self.canonical(from_unit), self.canonical(to_unit)]
+        return [_exact_result(exact_factor(value) * ratio, precision) for value in values]
+
+
+def _canonical(table, unit):
+    """
+    Returns the name of a unit of table given its name or an alias, resolving
+    aliases through the alias index only when the name is not a unit of the
+    table.
+    """
+
+    if unit in table.index:
+        return unit
+    if not isinstance(unit, str):
+        raise ValueError("Invalid units or conversion not supported")
+
+    from app.units.aliases import resolve
+
+    try:
+        return resolve(unit, table.name).name
+    except ValueError:
+        raise ValueError("Invalid units or conversion not supported") from None
+
+
+def _exact_result(result, precision):
+    """Returns result unchanged, or as a Decimal with precision digits."""
+
+    if precision is None:
+        return result
+    with localcontext() as context:
+        context.prec = precision
+        return Decimal(result.numerator) / Decimal(result.denominator)
+
+
+class AffineTransform(namedtuple("AffineTransform", ["scale", "offset"])):
+    """
+    An affine map x -> scale * x + offset.
+
+    Methods:
+    --------
+    __call__(values)
+        Applies the transform to a number or an array of numbers.
+    then(other)
+        Returns the single transform equivalent to applying self, then other.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, values):
+        """
+        Applies the transform to a number, or to an array in place of a fresh
+        float64 copy so that only one temporary is allocated.
+        """
+
+        if isinstance(values, (int, float)):
+            return values * self.scale + self.offset
+
+        import numpy
+
+        result = numpy.multiply(values, self.scale, dtype=numpy.float64)
+        result += self.offset
+        return result
+
+    def then(self, other):
+        """
+        Returns the single transform equivalent to applying self, then other.
+        """
+
+        return AffineTransform(self.scale * other.scale, self.offset * other.scale + other.offset)
+
+
+class AffineTable:
+    """
+    A class used to convert values between units related by a scale and an
+    offset, such as temperature scales.
+
+    Attributes:
+    -----------
+    name : str
+        Name of the category (e.g. 'temperature').
+    transforms : dict
+        Maps each unit name to the (scale, offset) pair taking it to the base unit.
+    units : list
+        Unit names in declaration order.
+    aliases : dict
+        Maps unit names to their symbols and alternative spellings.
+    index : dict
+        Maps each unit name to its unit ID, its position in units.
+    pairs : dict
+        Maps each (from_unit, to_unit) pair to its precomputed AffineTransform.
+    exact_pairs : dict
+        Maps each (from_unit, to_unit) pair to its exact (scale, offset) Fractions.
+
+    Methods:
+    --------
+    canonical(unit)
+        Returns the name of a unit of the table given a name or an alias.
+    transform(from_unit, to_unit)
+        Returns the AffineTransform converting from_unit into to_unit.
+    chain(*units)
+        Folds a chain of conversions into a single AffineTransform.
+    convert(value, from_unit, to_unit)
+        Converts a value from one unit to another.
+    unit_id(unit)
+        Returns the ID of a unit within the table.
+    matrix
+        The 2 x N x N scale and offset matrices, built on first access.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a value into every unit of the table at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of values exactly.
+    """
+
+    def __init__(self, name, transforms, aliases=None):
+        """
+        Initializes the table and precomputes the transform of every unit pair.
+
+        Parameters:
+        -----------
+        name : str
+            Name of the category.
+        transforms : dict
+            Maps each unit name to the (scale, offset) pair such that
+            base = scale * value + offset.
+        aliases : dict, optional
+            Maps unit names to their symbols and alternative spellings.
+        """
+
+        self.name = name
+        self.transforms = dict(transforms)
+        self.units = list(self.transforms)
+        self.aliases = dict(aliases or {})
+        self.index = {unit: unit_id for unit_id, unit in enumerate(self.units)}
+        self._matrix = None
+        _tables[name] = self
+
+        exact = {
+            unit: (exact_factor(scale), exact_factor(offset))
+            for unit, (scale, offset) in self.transforms.items()
+        }
+        self.exact_pairs = {
+            (from_unit, to_unit): (from_scale / to_scale, (from_offset - to_offset) / to_scale)
+            for from_unit, (from_scale, from_offset) in exact.items()
+            for to_unit, (to_scale, to_offset) in exact.items()
+        }
+        self.pairs = {
+            pair: AffineTransform(float(scale), float(offset))
+            for pair, (scale, offset) in self.exact_pairs.items()
+        }
+
+    def canonical(self, unit):
+        """
+        Returns the name of a unit of the table given its name, one of its
+        aliases (e.g. 'km' or 'KM/H').
+
+        Raises:
+        -------
+        ValueError
+            If the unit does not resolve to a unit of the table.
+        """
+
+        return _canonical(self, unit)
+
+    def transform(self, from_unit, to_unit):
+        """
+        Returns the AffineTransform converting from_unit into to_unit.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            return self.pairs[from_unit, to_unit]
+        except KeyError:
+            return self.pairs[self.canonical(from_unit), self.canonical(to_unit)]
+
+    def chain(self, *units):
+        """
+        Folds the conversions between consecutive units into a single
+        AffineTransform, so that e.g. chain('Celsius', 'Kelvin', 'Fahrenheit')
+        applies as one multiply and one add.
+
+        Every step maps through the same base unit, so the composition equals
+        the precomputed transform from the first unit to the last one, which
+        is returned instead of accumulating rounding error step by step.
+
+        Raises:
+        -------
+        ValueError
+            If fewer than two units are given or any unit does not belong to
+            the table.
+        """
+
+        if len(units) < 2:
+            raise ValueError("A conversion chain needs at least two units")
+
+        for unit in units:
+            self.unit_id(unit)
+        return self.transform(units[0], units[-1])
+
+    def convert(self, value, from_unit, to_unit):
+        """
+        Converts a value from one unit to another.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value.
+        to_unit : str
+            The unit to convert the value into.
+
+        Returns:
+        --------
+        float
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            scale, offset = self.pairs[from_unit, to_unit]
+        except KeyError:
+            scale, offset = self.transform(from_unit, to_unit)
+        return value * scale + offset
+
+    def unit_id(self, unit):
+        """
+        Returns the ID of a unit within the table.
+
+        Raises:
+        -------
+        ValueError
+            If the unit does not belong to the table.
+        """
+
+        try:
+            return self.index[unit]
+        except KeyError:
+            return self.index[self.canonical(unit)]
+
+    @property
+    def matrix(self):
+        """
+        The scale and offset matrices of the table, stacked into a 2 x N x N
+        array, where matrix[:, i, j] converts unit ID i into unit ID j. They
+        are built from the pairs on first access.
+        """
+
+        if self._matrix is None:
+            import numpy
+
+            self._matrix = numpy.array(
+                [[[self.pairs[from_unit, to_unit][part] for to_unit in self.units]
+                  for from_unit in self.units]
+                 for part in range(2)],
+                dtype=numpy.float64,
+            )
+        return self._matrix
+
+    def convert_batch(self, values, from_unit, to_unit):
+        """
+        Converts an array of values from one unit to another with a single
+        vectorized multiply-add.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values.
+        to_unit : str
+            The unit to convert the values into.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit, as float64.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        return self.transform(from_unit, to_unit)(values)
+
+    def convert_to_all(self, value, from_unit):
+        """
+        Converts a value into every unit of the table with a single vectorized
+        multiply-add over the row of from_unit in the scale and offset
+        matrices.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, where element i is expressed in units[i].
+
+        Raises:
+        -------
+        ValueError
+            If the unit does not belong to the table.
+        """
+
+        scales, offsets = self.matrix[:, self.unit_id(from_unit)]
+        result = scales * value
+        result += offsets
+        return result
+
+    def convert_exact(self, value, from_unit, to_unit, precision=None):
+        """
+        Converts a value from one unit to another without rounding.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted. Floats are read through their
+            shortest decimal representation, so 0.1 means exactly 1/10.
+        from_unit : str
+            The unit of the input value.
+        to_unit : str
+            The unit to convert the value into.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            scale, offset = self.exact_pairs[from_unit, to_unit]
+        except KeyError:
+            scale, offset = self.exact_pairs[self.canonical(from_unit), self.canonical(to_unit)]
+        return _exact_result(exact_factor(value) * scale + offset, precision)
+
+    def convert_exact_batch(self, values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of values from one unit to another without
+        rounding, looking the exact transform up once.
+
+        Returns:
+        --------
+        list
+            The converted values, as Fractions or as Decimals when a precision
+            is given.
+
+        Raises:
+        -------
+        ValueError
+            If either unit does not belong to the table.
+        """
+
+        try:
+            scale, offset = self.exact_pairs[from_unit, to_unit]
+        except KeyError:
+            scale, offset = self.exact_pairs[self.canonical(from_unit), self.canonical(to_unit)]
+        return [_exact_result(exact_factor(value) * scale + offset, precision) for value in values]
+
+
+def get_table(category):
+    """
+    Returns the conversion table of a category, importing its unit module on
+    first use.
+
+    Parameters:
+    -----------
+    category : str
+        Name of the category, which is also the name of its module in
+        app/units (e.g. 'length' or 'datastorage').
+
+    Returns:
+    --------
+    UnitTable or AffineTable
+        The table of the category.
+
+    Raises:
+    -------
+    ValueError
+        If the category is not one of categories.
+    """
+
+    try:
+        return _tables[category]
+    except (KeyError, TypeError):
+        pass
+
+    # Only the known unit modules are imported, never an arbitrary module path
+    if category not in categories:
+        raise ValueError(f"Unknown category: {category}")
+    import_module(f"app.units.{category}")
+    return _tables[category]
+
+
+@lru_cache(maxsize=1024)
+def get_converter(category, from_unit, to_unit):
+    """
+    Resolves a unit pair once and returns a callable that converts with it.
+
+    The callable multiplies by a precomputed factor (or applies a precomputed
+    scale and offset), so its per-value cost is that of a single
+    multiplication. It accepts numbers and NumPy arrays directly and falls
+    back to a vectorized path for other sequences. Converters are cached per
+    (category, from_unit, to_unit).
+
+    Parameters:
+    -----------
+    category : str
+        Name of the category (e.g. 'length').
+    from_unit : str
+        The unit of the input values.
+    to_unit : str
+        The unit to convert the values into.
+
+    Returns:
+    --------
+    callable
+        A function taking a value or array and returning the converted result.
+
+    Raises:
+    -------
+    ValueError
+        If the category or either unit is unknown.
+
+    Examples:
+    ---------
+    >>> feet_to_meters = get_converter('length', 'Feet', 'Meters')
+    >>> feet_to_meters(10)
+    3.048
+    """
+
+    table = get_table(category)
+    if isinstance(table, AffineTable):
+        return _compile_affine(table.transform(from_unit, to_unit))
+    return _compile_linear(table.ratio(from_unit, to_unit))
+
+
+@lru_cache(maxsize=1024)
+def get_coefficients(category, from_unit, to_unit):
+    """
+    Returns the (scale, offset) such that a value x converts from from_unit
+    into to_unit as scale * x + offset. The offset is 0.0 for every category
+    but temperature. Coefficients are cached per (category, from_unit,
+    to_unit), and are what a worker needs to convert a buffer of values.
+
+    Raises:
+    -------
+    ValueError
+        If the category or either unit is unknown.
+
+    Examples:
+    ---------
+    >>> get_coefficients('temperature', 'Celsius', 'Fahrenheit')
+    (1.8, 32.0)
+    """
+
+    table = get_table(category)
+    if isinstance(table, AffineTable):
+        return tuple(table.transform(from_unit, to_unit))
+    return table.ratio(from_unit, to_unit), 0.0
+
+
+def _compile_linear(factor):
+    """Returns a converter multiplying by factor."""
+
+    def converter(value):
+        try:
+            return value * factor
+        except TypeError:
+            import numpy
+
+            return numpy.multiply(value, factor, dtype=numpy.float64)
+
+    return converter
+
+
+def _compile_affine(transform):
+    """Returns a converter applying transform."""
+
+    scale, offset = transform
+
+    def converter(value):
+        try:
+            return value * scale + offset
+        except TypeError:
+            return transform(value)
+
+    return converter
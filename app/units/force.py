@@ -10,12 +10,44 @@ ForceConverter : Provides a static method for converting force values between di
 
 Variables:
 ----------
+force_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 force_units : list
     A list of supported force units for conversion.
+force_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+force_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+force_table : UnitTable
+    The conversion table built from force_factors, force_aliases and force_prefixed.
 -------------------------------------------------------------------------------
 """
 
-force_units = ["Newtons", "Dynes", "Poundals", "Kilogramforce"]
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Newtons
+force_factors = {
+    "Newtons": 1.0,
+    "Dynes": 1e-5,
+    "Poundals": 0.138254954376,
+    "Kilogramforce": 9.80665,
+}
+
+# Symbols and alternative spellings accepted for each unit
+force_aliases = {
+    "Newtons": ("N", "Newton"),
+    "Dynes": ("dyn", "Dyne"),
+    "Poundals": ("pdl", "Poundal"),
+    "Kilogramforce": ("kgf", "kp", "Kilogram-force"),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+force_prefixed = {
+    "Newtons": (1.0, ("N",), ("SI",)),
+}
+
+force_units = list(force_factors)
+force_table = UnitTable("force", force_factors, force_aliases, force_prefixed)
 
 class ForceConverter:
     """
@@ -25,6 +57,14 @@ class ForceConverter:
    --------
    convert(value, from_unit, to_unit)
        Converts a force value from one unit to another, if the conversion is supported.
+   convert_batch(values, from_unit, to_unit)
+       Converts an array of force values from one unit to another.
+   convert_to_all(value, from_unit)
+       Converts a force value into every supported unit at once.
+   convert_exact(value, from_unit, to_unit, precision=None)
+       Converts a force value exactly, returning a Fraction or a Decimal.
+   convert_exact_batch(values, from_unit, to_unit, precision=None)
+       Converts a sequence of force values exactly.
    """
    
     @staticmethod
@@ -65,41 +105,120 @@ class ForceConverter:
         9.80665
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Newtons":
-            if to_unit=="Dynes":
-                return value * 100000.0
-            elif to_unit=="Poundals":
-                return value * 7.23301
-            elif to_unit=="Kilogramforce":
-                return value / 9.80665
-            
-        elif from_unit == "Dynes":
-            if to_unit=="Newtons":
-                return value / 100000.0
-            elif to_unit=="Poundals":
-                return value / 13825.4954376
-            elif to_unit=="Kilogramforce":
-                return value / 980665.0
-            
-        elif from_unit == "Poundals":
-            if to_unit=="Newtons":
-                return value / 7.23301
-            elif to_unit=="Dynes":
-                return value * 13825.4954376
-            elif to_unit=="Kilogramforce":
-                return value / 70.93163528397
-            
-        elif from_unit == "Kilogramforce":
-            if to_unit=="Newtons":
-                return value * 9.80665
-            elif to_unit=="Dynes":
-                return value * 980665.0
-            elif to_unit=="Poundals":
-                return value * 70.93163528397
-            
-        raise ValueError("Invalid units or conversion not supported")
-        
+        return force_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of force values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return force_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a force value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of force_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return force_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a force value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return force_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of force values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
 
+        return force_table.convert_exact_batch(values, from_unit, to_unit, precision)
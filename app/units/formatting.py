@@ -0,0 +1,194 @@
+"""
+Formatting Module
+
+This module turns conversion results into the short strings shown by the app.
+A result is written in fixed-point notation, trimmed of trailing zeros, as
+long as it fits in a given number of digits, and in truncated scientific
+notation otherwise.
+
+Format specs are built once per width, formatted strings are kept in a bounded
+LRU cache keyed on (value, sign, width, mode) so that repeated values (the initial
+values of each metric, toggling between units) are not formatted again, and
+whole arrays are formatted in a single printf-style operation instead of one
+f-string per element.
+
+Classes:
+--------
+FormatSpec : The precompiled format specs of one width.
+
+Functions:
+----------
+format_spec(width) : Returns the FormatSpec of a width.
+format_number(value, width=12, mode='auto') : Formats a single result.
+format_batch(values, width=12, mode='auto') : Formats an array of results.
+
+Variables:
+----------
+modes : tuple
+    The supported formatting modes.
+-------------------------------------------------------------------------------
+"""
+
+import math
+from collections import namedtuple
+from functools import lru_cache
+from itertools import repeat
+
+# 'auto' uses fixed-point notation when it fits in the width, scientific otherwise
+modes = ("auto", "fixed", "scientific")
+
+FormatSpec = namedtuple("FormatSpec", ["fixed", "scientific", "fixed_printf", "scientific_printf"])
+
+
+@lru_cache(maxsize=None)
+def format_spec(width):
+    """
+    Returns the format specs of a width: fixed-point with width decimals and
+    scientific with half as many, both for format() and for printf-style
+    formatting.
+
+    Parameters:
+    -----------
+    width : int
+        The maximum number of digits of a formatted result.
+
+    Returns:
+    --------
+    FormatSpec
+        The precompiled specs.
+    """
+
+    return FormatSpec(f".{width}f", f".{width // 2}e", f"%.{width}f", f"%.{width // 2}e")
+
+
+def format_number(value, width=12, mode="auto"):
+    """
+    Formats a conversion result to fit within width digits.
+
+    Parameters:
+    -----------
+    value : float
+        The result of a unit conversion.
+    width : int, optional
+        The maximum number of digits, 12 by default.
+    mode : str, optional
+        'fixed' for trimmed fixed-point notation, 'scientific' for scientific
+        notation cut to width characters, or 'auto' (the default) for
+        fixed-point when it has at most width digits, excluding the decimal
+        point and the sign, and scientific otherwise.
+
+    Returns:
+    --------
+    str
+        The formatted result.
+
+    Raises:
+    -------
+    ValueError
+        If the mode is unknown.
+
+    Examples:
+    ---------
+    >>> format_number(25.0)
+    '25'
+    >>> format_number(2.54)
+    '2.54'
+    >>> format_number(123456789.123456)
+    '1.234568e+08'
+    """
+
+    return _format_number(value, width, mode, math.copysign(1.0, value))
+
+
+@lru_cache(maxsize=4096)
+def _format_number(value, width, mode, sign):
+    """
+    Formats a result for format_number. The sign is part of the cache key,
+    as 0.0 and -0.0 are equal keys but are formatted differently.
+    """
+
+    spec = format_spec(width)
+    if mode == "scientific":
+        return format(value, spec.scientific)[:width]
+    if mode not in modes:
+        raise ValueError(f"Unknown formatting mode: {mode}")
+
+    fixed = format(value, spec.fixed).rstrip("0").rstrip(".")
+    if mode == "fixed":
+        return fixed
+
+    digit_count = len(fixed) - fixed.count(".") - fixed.count("-")
+    if digit_count <= width:
+        return fixed
+    return format(value, spec.scientific)[:width]
+
+
+def format_batch(values, width=12, mode="auto"):
+    """
+    Formats an array of conversion results, giving the same strings as
+    format_number for each element.
+
+    Values are formatted by a single printf-style operation over the whole
+    array, and the digit counts deciding between fixed-point and scientific
+    notation are gathered into NumPy arrays, so no Python code runs per
+    element.
+
+    Parameters:
+    -----------
+    values : array_like
+        The results of unit conversions.
+    width : int, optional
+        The maximum number of digits, 12 by default.
+    mode : str, optional
+        'auto', 'fixed' or 'scientific', as for format_number.
+
+    Returns:
+    --------
+    list
+        The formatted results, in the order of values.
+
+    Raises:
+    -------
+    ValueError
+        If the mode is unknown.
+    """
+
+    import numpy
+
+    if mode not in modes:
+        raise ValueError(f"Unknown formatting mode: {mode}")
+
+    spec = format_spec(width)
+    values = numpy.asarray(values, dtype=numpy.float64).ravel()
+    if mode == "scientific":
+        return _truncate(_printf(spec.scientific_printf, values.tolist()), width)
+
+    fixed = _printf(spec.fixed_printf, values.tolist())
+    fixed = list(map(str.rstrip, map(str.rstrip, fixed, repeat("0")), repeat(".")))
+    if mode == "fixed":
+        return fixed
+
+    digit_counts = numpy.fromiter(map(len, fixed), dtype=numpy.intp, count=len(fixed))
+    digit_counts -= numpy.fromiter(map(str.__contains__, fixed, repeat(".")), dtype=bool, count=len(fixed))
+    digit_counts -= numpy.signbit(values) & ~numpy.isnan(values)
+    overflow = numpy.flatnonzero(digit_counts > width)
+    if not overflow.size:
+        return fixed
+
+    result = numpy.array(fixed, dtype=object)
+    result[overflow] = _truncate(_printf(spec.scientific_printf, values[overflow].tolist()), width)
+    return result.tolist()
+
+
+def _printf(spec, values):
+    """Formats every value with a printf-style spec in one operation."""
+
+    if not values:
+        return []
+    return ("\n".join(repeat(spec, len(values))) % tuple(values)).split("\n")
+
+
+def _truncate(strings, width):
+    """Cuts every string to width characters in one operation."""
+
+    return _printf(f"%.{width}s", strings)
@@ -10,13 +10,45 @@ FrequencyConverter : Provides a static method for converting frequency values be
 
 Variables:
 ----------
+frequency_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 frequency_units : list
     A list of supported frequency units for conversion.
+frequency_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+frequency_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+frequency_table : UnitTable
+    The conversion table built from frequency_factors, frequency_aliases and frequency_prefixed.
     
 -------------------------------------------------------------------------------
 """
 
-frequency_units = ["Hertz", "Kilohertz", "Megahertz", "Gigahertz"]
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Hertz
+frequency_factors = {
+    "Hertz": 1.0,
+    "Kilohertz": 1000.0,
+    "Megahertz": 1e+6,
+    "Gigahertz": 1e+9,
+}
+
+# Symbols and alternative spellings accepted for each unit
+frequency_aliases = {
+    "Hertz": ("Hz",),
+    "Kilohertz": ("kHz",),
+    "Megahertz": ("MHz",),
+    "Gigahertz": ("GHz",),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+frequency_prefixed = {
+    "Hertz": (1.0, ("Hz",), ("SI",)),
+}
+
+frequency_units = list(frequency_factors)
+frequency_table = UnitTable("frequency", frequency_factors, frequency_aliases, frequency_prefixed)
 
 class FrequencyConverter:
     """
@@ -26,6 +58,14 @@ class FrequencyConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a frequency value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of frequency values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a frequency value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a frequency value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of frequency values exactly.
     """
     
     @staticmethod
@@ -66,39 +106,120 @@ class FrequencyConverter:
         1000.0
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Hertz":
-            if to_unit == "Kilohertz":
-                return value / 1000.0
-            elif to_unit == "Megahertz":
-                return value / 1e+6
-            elif to_unit == "Gigahertz":
-                return value / 1e+9
-
-        elif from_unit == "Kilohertz":
-            if to_unit == "Hertz":
-                return value * 1000.0
-            elif to_unit == "Megahertz":
-                return value / 1000.0
-            elif to_unit == "Gigahertz":
-                return value / 1e+6
-
-        elif from_unit == "Megahertz":
-            if to_unit == "Hertz":
-                return value * 1e+6
-            elif to_unit == "Kilohertz":
-                return value * 1000.0
-            elif to_unit == "Gigahertz":
-                return value / 1000.0
-
-        elif from_unit == "Gigahertz":
-            if to_unit == "Hertz":
-                return value * 1e+9
-            elif to_unit == "Kilohertz":
-                return value * 1e+6
-            elif to_unit == "Megahertz":
-                return value * 1000.0
-
-        raise ValueError("Invalid units or conversion not supported")
\ No newline at end of file
+        return frequency_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of frequency values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return frequency_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a frequency value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of frequency_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return frequency_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a frequency value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return frequency_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of frequency values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return frequency_table.convert_exact_batch(values, from_unit, to_unit, precision)
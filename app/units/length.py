@@ -10,12 +10,54 @@ LengthConverter : Provides a static method for converting length values between
 
 Variables:
 ----------
+length_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 length_units : list
     A list of supported length units for conversion.
+length_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+length_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+length_table : UnitTable
+    The conversion table built from length_factors, length_aliases and length_prefixed.
 -------------------------------------------------------------------------------
 """
 
-length_units = ["Millimeters", "Centimeters", "Meters", "Kilometers", "Inches", "Feet", "Yards", "Miles", "Nautical Miles"]
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Meters
+length_factors = {
+    "Millimeters": 0.001,
+    "Centimeters": 0.01,
+    "Meters": 1.0,
+    "Kilometers": 1000.0,
+    "Inches": 0.0254,
+    "Feet": 0.3048,
+    "Yards": 0.9144,
+    "Miles": 1609.344,
+    "Nautical Miles": 1852.0,
+}
+
+# Symbols and alternative spellings accepted for each unit
+length_aliases = {
+    "Millimeters": ("mm", "Millimeter", "Millimetres", "Millimetre"),
+    "Centimeters": ("cm", "Centimeter", "Centimetres", "Centimetre"),
+    "Meters": ("m", "Meter", "Metres", "Metre"),
+    "Kilometers": ("km", "Kilometer", "Kilometres", "Kilometre"),
+    "Inches": ("in", "Inch"),
+    "Feet": ("ft", "Foot"),
+    "Yards": ("yd", "Yard"),
+    "Miles": ("mi", "Mile"),
+    "Nautical Miles": ("nmi", "NM", "Nautical Mile"),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+length_prefixed = {
+    "Meters": (1.0, ("m",), ("SI",)),
+}
+
+length_units = list(length_factors)
+length_table = UnitTable("length", length_factors, length_aliases, length_prefixed)
 
 class LengthConverter:
     """
@@ -25,6 +67,14 @@ class LengthConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a length value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of length values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a length value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a length value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of length values exactly.
     """
     
     @staticmethod
@@ -70,160 +120,125 @@ class LengthConverter:
         5280.0
         """
         
-        if from_unit == to_unit:
-            return value
-        elif from_unit == "Centimeters":
-            if to_unit == "Millimeters":
-                return value * 10.0
-            elif to_unit == "Meters":
-                return value / 100.0
-            elif to_unit == "Kilometers":
-                return value / 100000.0
-            elif to_unit == "Inches":
-                return value / 2.54
-            elif to_unit == "Feet":
-                return value / 30.48
-            elif to_unit == "Yards":
-                return value / 91.44
-            elif to_unit == "Miles":
-                return value / 160934.4
-            elif to_unit == "Nautical Miles":
-                return value / 185200.0
-        elif from_unit == "Feet":
-            if to_unit == "Millimeters":
-                return value * 304.8
-            elif to_unit == "Centimeters":
-                return value * 30.48
-            elif to_unit == "Meters":
-                return value * 0.3048
-            elif to_unit == "Kilometers":
-                return value * 0.0003048
-            elif to_unit == "Inches":
-                return value * 12.0
-            elif to_unit == "Yards":
-                return value / 3.0
-            elif to_unit == "Miles":
-                return value / 5280.0
-            elif to_unit == "Nautical Miles":
-                return value / 6076.12
-        elif from_unit == "Inches":
-            if to_unit == "Millimeters":
-                return value * 25.4
-            elif to_unit == "Centimeters":
-                return value * 2.54
-            elif to_unit == "Meters":
-                return value / 39.37007874
-            elif to_unit == "Kilometers":
-                return value / 39370.07874
-            elif to_unit == "Feet":
-                return value / 12.0
-            elif to_unit == "Yards":
-                return value / 36.0
-            elif to_unit == "Miles":
-                return value / 63360.0
-            elif to_unit == "Nautical Miles":
-                return value / 72913.4
-        elif from_unit == "Meters":
-            if to_unit == "Millimeters":
-                return value * 1000.0
-            elif to_unit == "Centimeters":
-                return value * 100.0
-            elif to_unit == "Kilometers":
-                return value / 1000.0
-            elif to_unit == "Inches":
-                return value * 39.37007874
-            elif to_unit == "Feet":
-                return value / 0.3048
-            elif to_unit == "Yards":
-                return value / 0.9144
-            elif to_unit == "Miles":
-                return value / 1609.344
-            elif to_unit == "Nautical Miles":
-                return value / 1852.0
-        elif from_unit == "Kilometers":
-            if to_unit == "Millimeters":
-                return value * 1000000.0
-            elif to_unit == "Centimeters":
-                return value * 100000.0
-            elif to_unit == "Meters":
-                return value * 1000.0
-            elif to_unit == "Inches":
-                return value * 39370.07874
-            elif to_unit == "Feet":
-                return value / 0.0003048
-            elif to_unit == "Yards":
-                return value / 0.0009144
-            elif to_unit == "Miles":
-                return value / 1.609344
-            elif to_unit == "Nautical Miles":
-                return value / 1.85200
-        elif from_unit == "Miles":
-            if to_unit == "Millimeters":
-                return value * 1609344.0
-            elif to_unit == "Centimeters":
-                return value * 160934.4
-            elif to_unit == "Meters":
-                return value * 1609.344
-            elif to_unit == "Kilometers":
-                return value * 1.609344
-            elif to_unit == "Inches":
-                return value * 63360.0
-            elif to_unit == "Feet":
-                return value * 5280.0
-            elif to_unit == "Yards":
-                return value * 1760.0
-            elif to_unit == "Nautical Miles":
-                return value / 1.15078
-        elif from_unit == "Millimeters":
-            if to_unit == "Centimeters":
-                return value / 10.0
-            elif to_unit == "Meters":
-                return value / 1000.0
-            elif to_unit == "Kilometers":
-                return value / 1000000.0
-            elif to_unit == "Inches":
-                return value / 25.4
-            elif to_unit == "Feet":
-                return value / 304.8
-            elif to_unit == "Yards":
-                return value / 914.4
-            elif to_unit == "Miles":
-                return value / 1609344.0
-            elif to_unit == "Nautical Miles":
-                return value / 1852000.0
-        elif from_unit == "Nautical Miles":
-            if to_unit == "Millimeters":
-                return value * 1852000.0
-            elif to_unit == "Centimeters":
-                return value * 185200.0
-            elif to_unit == "Meters":
-                return value * 1852.0
-            elif to_unit == "Kilometers":
-                return value * 1.85200
-            elif to_unit == "Inches":
-                return value * 72913.4
-            elif to_unit == "Feet":
-                return value * 6076.12
-            elif to_unit == "Yards":
-                return value * 2025.37
-            elif to_unit == "Miles":
-                return value * 1.15078
-        elif from_unit == "Yards":
-            if to_unit == "Millimeters":
-                return value * 914.4
-            elif to_unit == "Centimeters":
-                return value * 91.44
-            elif to_unit == "Meters":
-                return value * 0.9144
-            elif to_unit == "Kilometers":
-                return value * 0.0009144
-            elif to_unit == "Inches":
-                return value * 36.0
-            elif to_unit == "Feet":
-                return value * 3.0
-            elif to_unit == "Miles":
-                return value / 1760.0
-            elif to_unit == "Nautical Miles":
-                return value / 2025.37
-        
-        raise ValueError("Invalid units or conversion not supported")
+        return length_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of length values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return length_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a length value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of length_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return length_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a length value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+
+        Examples:
+        ---------
+        >>> LengthConverter.convert_exact(1, 'Nautical Miles', 'Yards')
+        Fraction(2315000, 1143)
+        """
+
+        return length_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of length values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return length_table.convert_exact_batch(values, from_unit, to_unit, precision)
@@ -10,12 +10,52 @@ MassConverter : Provides a static method for converting mass values between diff
 
 Variables:
 ----------
+mass_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 mass_units : list
     A list of supported mass units for conversion.
+mass_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+mass_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+mass_table : UnitTable
+    The conversion table built from mass_factors, mass_aliases and mass_prefixed.
 -------------------------------------------------------------------------------
 """
 
-mass_units = ["Grams", "Milligrams", "Kilograms", "Tonnes", "Ounces", "Pounds", "Stones", "Carats"]
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Grams
+mass_factors = {
+    "Grams": 1.0,
+    "Milligrams": 0.001,
+    "Kilograms": 1000.0,
+    "Tonnes": 1e+6,
+    "Ounces": 28.349523125,
+    "Pounds": 453.59237,
+    "Stones": 6350.29318,
+    "Carats": 0.2,
+}
+
+# Symbols and alternative spellings accepted for each unit
+mass_aliases = {
+    "Grams": ("g", "Gram", "Grammes", "Gramme"),
+    "Milligrams": ("mg", "Milligram"),
+    "Kilograms": ("kg", "Kilogram", "Kilo"),
+    "Tonnes": ("t", "Tonne", "Metric Tons"),
+    "Ounces": ("oz", "Ounce"),
+    "Pounds": ("lb", "lbs", "Pound"),
+    "Stones": ("st", "Stone"),
+    "Carats": ("ct", "Carat"),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+mass_prefixed = {
+    "Grams": (1.0, ("g",), ("SI",)),
+}
+
+mass_units = list(mass_factors)
+mass_table = UnitTable("mass", mass_factors, mass_aliases, mass_prefixed)
 
 class MassConverter:
     """
@@ -25,6 +65,14 @@ class MassConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a mass value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of mass values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a mass value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a mass value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of mass values exactly.
     """
     
     @staticmethod
@@ -69,138 +117,120 @@ class MassConverter:
         16.0
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Grams":
-            if to_unit == "Milligrams":
-                return value * 1000.0
-            elif to_unit == "Kilograms":
-                return value / 1000.0
-            elif to_unit == "Tonnes":
-                return value * 1e-6
-            elif to_unit == "Ounces":
-                return value / 28.3495231
-            elif to_unit == "Pounds":
-                return value / 453.59237
-            elif to_unit == "Stones":
-                return value / 6350.29318
-            elif to_unit == "Carats":
-                return value * 5.0
-            
-        elif from_unit == "Milligrams":
-            if to_unit == "Grams":
-                return value / 1000.0
-            elif to_unit == "Kilograms":
-                return value / 1e+6
-            elif to_unit == "Tonnes":
-                return value / 1e+9
-            elif to_unit == "Ounces":
-                return value / 28349.5231
-            elif to_unit == "Pounds":
-                return value / 453592.37
-            elif to_unit == "Stones":
-                return value / 6350293.18
-            elif to_unit == "Carats":
-                return value / 200.0
-            
-        elif from_unit == "Kilograms":
-            if to_unit == "Milligrams":
-                return value * 1e+6
-            elif to_unit == "Grams":
-                return value * 1000.0
-            elif to_unit == "Tonnes":
-                return value * 0.001
-            elif to_unit == "Ounces":
-                return value * 35.274
-            elif to_unit == "Pounds":
-                return value * 2.20462
-            elif to_unit == "Stones":
-                return value / 6.35029
-            elif to_unit == "Carats":
-                return value * 5000.0
-            
-        elif from_unit == "Tonnes":
-            if to_unit == "Milligrams":
-                return value * 1e+9
-            elif to_unit == "Grams":
-                return value * 1e+6
-            elif to_unit == "Kilograms":
-                return value * 1000.0
-            elif to_unit == "Ounces":
-                return value / 0.0000283495231
-            elif to_unit == "Pounds":
-                return value * 2204.62
-            elif to_unit == "Stones":
-                return value * 157.473
-            elif to_unit == "Carats":
-                return value * 5e+6
-            
-        elif from_unit == "Ounces":
-            if to_unit == "Milligrams":
-                return value * 28349.5231
-            elif to_unit == "Grams":
-                return value * 28.3495231
-            elif to_unit == "Kilograms":
-                return value / 35.274
-            elif to_unit == "Tonnes":
-                return value * 0.0000283495231
-            elif to_unit == "Pounds":
-                return value * 0.0625
-            elif to_unit == "Stones":
-                return value / 224.0
-            elif to_unit == "Carats":
-                return value / 0.00705479
-            
-        elif from_unit == "Pounds":
-            if to_unit == "Milligrams":
-                return value * 453592.37
-            elif to_unit == "Grams":
-                return value * 453.59237
-            elif to_unit == "Kilograms":
-                return value / 2.20462
-            elif to_unit == "Tonnes":
-                return value / 2204.62
-            elif to_unit == "Ounces":
-                return value * 16.0
-            elif to_unit == "Stones":
-                return value / 14.0
-            elif to_unit == "Carats":
-                return value / 0.000440925
-            
-        elif from_unit == "Stones":
-            if to_unit == "Milligrams":
-                return value * 6350293.18
-            elif to_unit == "Grams":
-                return value * 6350.29318
-            elif to_unit == "Kilograms":
-                return value * 6.35029
-            elif to_unit == "Tonnes":
-                return value / 157.473
-            elif to_unit == "Ounces":
-                return value * 224.0
-            elif to_unit == "Pounds":
-                return value * 14.0
-            elif to_unit == "Carats":
-                return value / 3.1495e-5
-            
-        elif from_unit == "Carats":
-            if to_unit == "Milligrams":
-                return value * 200.0
-            elif to_unit == "Grams":
-                return value / 5.0
-            elif to_unit == "Kilograms":
-                return value / 5000.0
-            elif to_unit == "Tonnes":
-                return value / 5e+6
-            elif to_unit == "Ounces":
-                return value * 0.00705479
-            elif to_unit == "Pounds":
-                return value * 0.000440925
-            elif to_unit == "Stones":
-                return value * 3.1495e-5
-            
-        raise ValueError("Invalid units or conversion not supported")
-            
-        
-            
+        return mass_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of mass values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return mass_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a mass value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of mass_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return mass_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a mass value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return mass_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of mass values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return mass_table.convert_exact_batch(values, from_unit, to_unit, precision)
@@ -0,0 +1,264 @@
+"""
+Parallel Module
+
+This module spreads large batch conversions over every CPU core. The
+converters of app/units are pure functions, so an input can be split into
+chunks that are converted by a pool of worker processes and put back together
+in their original order.
+
+The pool is created on first use and reused by every later job, so the cost of
+starting the workers and of loading the unit tables in each of them is only
+paid once per process.
+
+Arrays are never pickled: convert_parallel places its input and output in
+multiprocessing.shared_memory blocks and sends each worker only a descriptor
+(block names, offset, length, scale and offset of the unit pair), so every
+core reads and writes the same pages. Inputs allocated with shared_empty are
+used as they are, without even the initial copy.
+
+Functions:
+----------
+get_pool(processes=None) : Returns the shared process pool.
+shared_empty(shape, dtype='float64') : Returns an array backed by shared memory.
+imap_ordered(function, iterable, processes=None, window=None) : Applies a
+    function to the items of an iterable in the pool, yielding the results
+    in order.
+convert_parallel(values, from_unit, to_unit, category=None, processes=None,
+                 chunk_size=None) : Converts an array using every core.
+
+Variables:
+----------
+min_chunk_size : int
+    Inputs up to this many values are converted in the calling process.
+-------------------------------------------------------------------------------
+"""
+
+import os
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from app.units.engine import get_coefficients
+
+# Below this many values, shipping chunks to workers costs more than it saves
+min_chunk_size = 1 << 16
+
+_pool = None
+_pool_size = None
+# Shared memory blocks by the id of the array they back
+_blocks = {}
+
+
+def get_pool(processes=None):
+    """
+    Returns the process pool shared by every parallel job, creating it on
+    first use. Asking for a different number of processes replaces it.
+
+    Parameters:
+    -----------
+    processes : int, optional
+        Number of worker processes, one per CPU core by default.
+
+    Returns:
+    --------
+    concurrent.futures.ProcessPoolExecutor
+        The shared pool.
+    """
+
+    global _pool, _pool_size
+
+    processes = processes or os.cpu_count() or 1
+    if _pool is None or _pool_size != processes:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = ProcessPoolExecutor(max_workers=processes)
+        _pool_size = processes
+    return _pool
+
+
+def imap_ordered(function, iterable, processes=None, window=None):
+    """
+    Applies function to every item of iterable in the shared pool and yields
+    the results in the order of the items.
+
+    Unlike Executor.map, items are only read from iterable as results are
+    consumed, at most window of them being in flight at once, so a stream of
+    any length can be processed in bounded memory.
+
+    Parameters:
+    -----------
+    function : callable
+        A module-level function, which the workers can import.
+    iterable : iterable
+        The items, each passed as the only argument of function.
+    processes : int, optional
+        Number of worker processes, one per CPU core by default.
+    window : int, optional
+        Maximum number of pending items, twice the number of workers by
+        default.
+
+    Yields:
+    -------
+    object
+        The result of function for each item, in order.
+    """
+
+    pool = get_pool(processes)
+    window = window or 2 * _pool_size
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(function, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def shared_empty(shape, dtype="float64"):
+    """
+    Returns an uninitialized array backed by a shared memory block, which
+    convert_parallel hands to its workers without copying it. The block is
+    released once the array and every view of it are garbage collected.
+
+    Parameters:
+    -----------
+    shape : int or tuple
+        Shape of the array.
+    dtype : str, optional
+        NumPy dtype of the array.
+
+    Returns:
+    --------
+    numpy.ndarray
+        The shared array.
+    """
+
+    import numpy
+
+    dtype = numpy.dtype(dtype)
+    size = int(numpy.prod(shape)) * dtype.itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    array = numpy.ndarray(shape, dtype=dtype, buffer=block.buf)
+    _blocks[id(array)] = block
+    weakref.finalize(array, _release, id(array))
+    return array
+
+
+def _release(array_id):
+    """Closes and removes the shared memory block of a collected array."""
+
+    block = _blocks.pop(array_id)
+    block.close()
+    block.unlink()
+
+
+def _locate(values):
+    """
+    Returns (block name, byte offset) of a C-contiguous array allocated by
+    shared_empty, or of a view into one, and None for any other array.
+    """
+
+    import numpy
+
+    if not values.flags.c_contiguous:
+        return None
+    # Arrays over a memory map or bytes have a base which is not an array
+    root = values
+    while isinstance(root.base, numpy.ndarray) and id(root) not in _blocks:
+        root = root.base
+    block = _blocks.get(id(root))
+    if block is None:
+        return None
+    return block.name, values.__array_interface__["data"][0] - root.__array_interface__["data"][0]
+
+
+def _convert_range(task):
+    """
+    Converts a range of a shared buffer in a worker. task is (source block,
+    source byte offset, target block, target byte offset, length, scale,
+    offset): only these descriptors cross the process boundary.
+    """
+
+    import numpy
+
+    source_name, source_offset, target_name, target_offset, length, scale, offset = task
+    source = shared_memory.SharedMemory(name=source_name)
+    target = source if target_name == source_name else shared_memory.SharedMemory(name=target_name)
+    try:
+        values = numpy.ndarray(length, dtype=numpy.float64, buffer=source.buf, offset=source_offset)
+        results = numpy.ndarray(length, dtype=numpy.float64, buffer=target.buf, offset=target_offset)
+        numpy.multiply(values, scale, out=results)
+        if offset:
+            results += offset
+        del values, results
+    finally:
+        source.close()
+        if target is not source:
+            target.close()
+    return length
+
+
+def convert_parallel(values, from_unit, to_unit, category=None, processes=None, chunk_size=None):
+    """
+    Converts an array of values between two units, splitting it into chunks
+    converted by the shared pool of worker processes through shared memory.
+
+    Parameters:
+    -----------
+    values : array_like
+        The numerical values to be converted. A float64 array from
+        shared_empty is read in place; anything else is first copied into a
+        shared block.
+    from_unit : str
+        The unit of the input values.
+    to_unit : str
+        The unit to convert the values into.
+    category : str, optional
+        Name of the category of both units, inferred from them by default.
+    processes : int, optional
+        Number of worker processes, one per CPU core by default.
+    chunk_size : int, optional
+        Number of values per chunk. By default the input is split into four
+        chunks per worker, of at least min_chunk_size values.
+
+    Returns:
+    --------
+    numpy.ndarray
+        The converted values in the target unit, as float64, in input order.
+        Inputs split across workers give an array backed by shared memory.
+
+    Raises:
+    -------
+    ValueError
+        If a unit is unknown or the units belong to different categories.
+    """
+
+    import numpy
+    from app.units.aliases import resolve_pair
+
+    scale, offset = get_coefficients(*resolve_pair(from_unit, to_unit, category))
+    values = numpy.asarray(values, dtype=numpy.float64)
+    processes = processes or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(min_chunk_size, -(-values.size // (4 * processes)))
+    if processes == 1 or values.size <= chunk_size:
+        result = numpy.multiply(values, scale)
+        if offset:
+            result += offset
+        return result
+
+    source = _locate(values)
+    if source is None:
+        shared = shared_empty(values.shape)
+        shared[...] = values
+        source = _locate(shared)
+    result = shared_empty(values.shape)
+    target = _locate(result)
+
+    itemsize = result.itemsize
+    tasks = ((source[0], source[1] + start * itemsize, target[0], target[1] + start * itemsize,
+              min(chunk_size, values.size - start), scale, offset)
+             for start in range(0, values.size, chunk_size))
+    for _ in imap_ordered(_convert_range, tasks, processes):
+        pass
+    return result
@@ -0,0 +1,131 @@
+"""
+Parsing Module
+
+This module reads numbers typed by the user without relying on float()
+raising ValueError. Every text is classified as one of three states:
+
+    complete    a number, e.g. '12', '-3.', '.5', '1e-3'
+    incomplete  not a number yet, but the start of one, e.g. '', '-', '.', '1e', '2.5E+', 'in'
+    invalid     no number starts this way, e.g. '1-', 'e3', '1.2.3'
+
+so that a text input can keep its last result on screen while the user is
+still typing, and only report invalid input when no further keystroke could
+make it a number. Numbers are the decimal literals accepted by float(), with
+'inf', 'infinity' and 'nan' but without digit-group underscores.
+
+Classification is done with precompiled regular expressions and results are
+kept in a bounded LRU cache, so the keystroke path raises no exception and
+repeated texts are not parsed again. parse_numbers applies the same rules to
+a whole column of texts.
+
+Classes:
+--------
+ParseResult : The state and value of a parsed text.
+
+Functions:
+----------
+parse_number(text) : Classifies a text and returns its value when complete.
+is_number(text) : Returns whether a text is a complete number.
+parse_numbers(texts) : Returns the positions and values of the numbers among
+                       texts.
+
+Variables:
+----------
+states : tuple
+    The possible states of a parsed text.
+-------------------------------------------------------------------------------
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+states = ("complete", "incomplete", "invalid")
+
+ParseResult = namedtuple("ParseResult", ["state", "value"])
+
+# A whole number, as accepted by float()
+_complete_pattern = re.compile(
+    r"\s*[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|inf(?:inity)?|nan)\s*", re.IGNORECASE)
+# A prefix of a number which is not one yet: a sign, a lone point, a missing
+# exponent or the start of 'inf', 'infinity' or 'nan'
+_incomplete_pattern = re.compile(
+    r"\s*[-+]?(?:(?:\d+\.?\d*|\.\d+)[eE][-+]?|\.|i(?:n(?:f(?:i(?:n(?:i(?:t)?)?)?)?)?)?|na?)?\s*",
+    re.IGNORECASE)
+
+_incomplete = ParseResult("incomplete", None)
+_invalid = ParseResult("invalid", None)
+
+
+@lru_cache(maxsize=1024)
+def parse_number(text):
+    """
+    Classifies a text as a complete number, the incomplete start of one or
+    invalid, and returns its value when it is complete.
+
+        >>> parse_number('2.5')
+        ParseResult(state='complete', value=2.5)
+        >>> parse_number('2.5e')
+        ParseResult(state='incomplete', value=None)
+
+    Parameters:
+    -----------
+    text : str
+        The text to be parsed.
+
+    Returns:
+    --------
+    ParseResult
+        The state of the text, one of states, and its value as a float, which
+        is None unless the state is 'complete'.
+    """
+
+    if _complete_pattern.fullmatch(text):
+        return ParseResult("complete", float(text))
+    if _incomplete_pattern.fullmatch(text):
+        return _incomplete
+    return _invalid
+
+
+def is_number(text):
+    """
+    Returns whether a text is a complete number.
+
+    Parameters:
+    -----------
+    text : str
+        The text to be checked.
+
+    Returns:
+    --------
+    bool
+        True if float(text) would succeed.
+    """
+
+    return _complete_pattern.fullmatch(text) is not None
+
+
+def parse_numbers(texts):
+    """
+    Finds the complete numbers among a sequence of texts, such as the cells
+    of a column, skipping every other text.
+
+    Parameters:
+    -----------
+    texts : iterable
+        The texts to be parsed.
+
+    Returns:
+    --------
+    tuple
+        (positions, values): the indices of the texts which are numbers, and
+        their values as floats.
+    """
+
+    match = _complete_pattern.fullmatch
+    positions, values = [], []
+    for position, text in enumerate(texts):
+        if match(text):
+            positions.append(position)
+            values.append(float(text))
+    return positions, values
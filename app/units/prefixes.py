@@ -0,0 +1,178 @@
+"""
+Prefixes Module
+
+This module generates prefixed units such as Petabytes, Exbibytes, Terahertz
+or Micrometers on demand, from a base unit declared by a category plus the SI
+or IEC prefix tables. Nothing is generated up front: a prefixed unit is
+created the first time it is looked up, then added to its conversion table and
+to the unit registry, so later lookups take the same path as built-in units
+and the catalog shown in the app does not grow. Generation is serialized by a
+lock, as units may be looked up from several threads at once.
+
+Functions:
+----------
+generate(text, category=None) : Returns the prefixed unit named by text,
+                                creating it on first use.
+
+Variables:
+----------
+si_prefixes : dict
+    Maps each SI prefix name to its symbol and power of ten.
+iec_prefixes : dict
+    Maps each IEC prefix name to its symbol and power of two.
+-------------------------------------------------------------------------------
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from threading import Lock
+from app.units.engine import categories, exact_factor, get_table
+
+si_prefixes = {
+    "Quecto": ("q", -30),
+    "Ronto": ("r", -27),
+    "Yocto": ("y", -24),
+    "Zepto": ("z", -21),
+    "Atto": ("a", -18),
+    "Femto": ("f", -15),
+    "Pico": ("p", -12),
+    "Nano": ("n", -9),
+    "Micro": ("µ", -6),
+    "Milli": ("m", -3),
+    "Centi": ("c", -2),
+    "Deci": ("d", -1),
+    "Deca": ("da", 1),
+    "Hecto": ("h", 2),
+    "Kilo": ("k", 3),
+    "Mega": ("M", 6),
+    "Giga": ("G", 9),
+    "Tera": ("T", 12),
+    "Peta": ("P", 15),
+    "Exa": ("E", 18),
+    "Zetta": ("Z", 21),
+    "Yotta": ("Y", 24),
+    "Ronna": ("R", 27),
+    "Quetta": ("Q", 30),
+}
+
+iec_prefixes = {
+    "Kibi": ("Ki", 10),
+    "Mebi": ("Mi", 20),
+    "Gibi": ("Gi", 30),
+    "Tebi": ("Ti", 40),
+    "Pebi": ("Pi", 50),
+    "Exbi": ("Ei", 60),
+    "Zebi": ("Zi", 70),
+    "Yobi": ("Yi", 80),
+}
+
+# Serializes the creation of units, which changes both tables and the registry
+_lock = Lock()
+
+# Symbols accepted in place of the canonical ones
+_symbol_variants = {"u": "µ", "μ": "µ"}
+
+
+# (name, symbol, factor) of every prefix, by prefix system
+_prefix_systems = {
+    "SI": [(name, symbol, Fraction(10) ** power) for name, (symbol, power) in si_prefixes.items()],
+    "IEC": [(name, symbol, Fraction(2) ** power) for name, (symbol, power) in iec_prefixes.items()],
+}
+
+
+@lru_cache(maxsize=None)
+def _forms(category):
+    """
+    Returns the prefixed forms of every base unit of a category, built once:
+    (symbols, names), mapping each prefixed symbol (case-sensitive, e.g.
+    'PB') and each case-folded prefixed name (e.g. 'petabyte') to the list of
+    its (base, prefix name, prefix symbol, prefix factor). The base unit
+    itself is listed with an empty prefix, and prefixes below the smallest
+    power of ten allowed for the base, if any, are left out.
+    """
+
+    symbols_index, names_index = {}, {}
+    for base, (base_factor, symbols, systems, *minimum) in getattr(get_table(category), "prefixed", {}).items():
+        words = (base.casefold(), base.casefold().removesuffix("s"))
+        smallest = Fraction(10) ** minimum[0] if minimum else 0
+        prefixes = [("", "", Fraction(1))]
+        prefixes += [prefix for system in systems for prefix in _prefix_systems[system]
+                     if prefix[2] >= smallest]
+        for name, symbol, factor in prefixes:
+            match = (base, name, symbol, factor)
+            variants = [symbol] + [variant for variant, canonical in _symbol_variants.items()
+                                   if canonical == symbol and symbol]
+            for prefix_symbol in variants:
+                for base_symbol in symbols:
+                    symbols_index.setdefault(prefix_symbol + base_symbol, []).append(match)
+            for word in words:
+                names_index.setdefault(name.casefold() + word, []).append(match)
+    return symbols_index, names_index
+
+
+def generate(text, category=None):
+    """
+    Returns the prefixed unit named by text, creating it on first use.
+
+    Categories declare which of their units accept prefixes through the
+    prefixed table attribute. The generated unit is named after the prefix and
+    the base unit (e.g. 'Petabytes'), gets the prefixed symbols as aliases
+    (e.g. 'PB') and is added to the unit registry, then to its table.
+
+    Parameters:
+    -----------
+    text : str
+        A prefixed unit name or symbol, e.g. 'Exbibytes', 'EiB' or 'THz'.
+    category : str, optional
+        Restricts generation to one category.
+
+    Returns:
+    --------
+    Unit or None
+        The registered unit, or None if text is not a prefixed unit.
+
+    Examples:
+    ---------
+    >>> generate('PB').name
+    'Petabytes'
+    """
+
+    from app.units.registry import registry
+
+    folded = text.strip().casefold()
+    for name in [category] if category is not None else categories:
+        symbols_index, names_index = _forms(name)
+        matches = symbols_index.get(text, []) + names_index.get(folded, [])
+        if not matches:
+            continue
+
+        table = get_table(name)
+        for base, prefix, prefix_symbol, prefix_factor in matches:
+            base_factor, symbols = table.prefixed[base][:2]
+            unit_name = prefix + base.lower() if prefix else base
+            if unit_name not in table.index:
+                with _lock:
+                    if unit_name not in table.index:
+                        if unit_name in registry:
+                            continue
+                        _create(table, unit_name, prefix_symbol, symbols,
+                                prefix_factor * exact_factor(base_factor))
+            return registry.units[registry.unit_id(unit_name)]
+    return None
+
+
+def _create(table, unit_name, prefix_symbol, symbols, factor):
+    """
+    Registers a prefixed unit, then adds it to its table, so that a unit of
+    the table is always known to the registry. Called with _lock held.
+    """
+
+    from app.units.registry import registry
+
+    aliases = [prefix_symbol + symbol for symbol in symbols]
+    if prefix_symbol == "µ":
+        aliases += ["u" + symbol for symbol in symbols]
+    aliases.append(unit_name.removesuffix("s"))
+    aliases = [alias for alias in aliases if alias not in registry and alias != unit_name]
+    registry.register(table.name, unit_name, aliases)
+    table.add_unit(unit_name, factor, aliases)
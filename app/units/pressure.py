@@ -10,12 +10,48 @@ PressureConverter : Provides a static method for converting pressure values betw
 
 Variables:
 ----------
+pressure_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 pressure_units : list
     A list of supported pressure units for conversion.
+pressure_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+pressure_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+pressure_table : UnitTable
+    The conversion table built from pressure_factors, pressure_aliases and pressure_prefixed.
 -------------------------------------------------------------------------------
 """
 
-pressure_units = ["Atmospheres", "Bars", "Pascals", "Psi", "Torrs"]
+from fractions import Fraction
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Pascals
+pressure_factors = {
+    "Atmospheres": 101325.0,
+    "Bars": 100000.0,
+    "Pascals": 1.0,
+    "Psi": Fraction("0.45359237") * Fraction("9.80665") / Fraction("0.0254") ** 2,
+    "Torrs": Fraction(101325, 760),
+}
+
+# Symbols and alternative spellings accepted for each unit
+pressure_aliases = {
+    "Atmospheres": ("atm", "Atmosphere"),
+    "Bars": ("bar",),
+    "Pascals": ("Pa", "Pascal"),
+    "Psi": ("lbf/in²",),
+    "Torrs": ("Torr",),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+pressure_prefixed = {
+    "Pascals": (1.0, ("Pa",), ("SI",)),
+    "Bars": (100000.0, ("bar",), ("SI",)),
+}
+
+pressure_units = list(pressure_factors)
+pressure_table = UnitTable("pressure", pressure_factors, pressure_aliases, pressure_prefixed)
 
 class PressureConverter:
     """
@@ -25,6 +61,14 @@ class PressureConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a pressure value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of pressure values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a pressure value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a pressure value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of pressure values exactly.
     """
     
     @staticmethod
@@ -63,60 +107,123 @@ class PressureConverter:
         >>> PressureConverter.convert(1, 'Atmospheres', 'Pascals')
         101325.0
         >>> PressureConverter.convert(1, 'Psi', 'Bars')
-        0.0689476
+        0.06894757293168362
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Atmospheres":
-            if to_unit == "Bars":
-                return value * 1.01325
-            elif to_unit == "Pascals":
-                return value * 101325.0
-            elif to_unit == "Psi":
-                return value * 14.69596432068
-            elif to_unit == "Torrs":
-                return value * 760.0
-
-        elif from_unit == "Bars":
-            if to_unit == "Atmospheres":
-                return value / 1.01325
-            elif to_unit == "Pascals":
-                return value / 0.00001
-            elif to_unit == "Psi":
-                return value * 14.50378911491
-            elif to_unit == "Torrs":
-                return value * 750.0616827042
-
-        elif from_unit == "Pascals":
-            if to_unit == "Atmospheres":
-                return value / 101325.0
-            elif to_unit == "Bars":
-                return value * 0.00001
-            elif to_unit == "Psi":
-                return value * 0.0001450378911491
-            elif to_unit == "Torrs":
-                return value * 0.007500616827042
-
-        elif from_unit == "Psi":
-            if to_unit == "Atmospheres":
-                return value / 14.69596432068
-            elif to_unit == "Bars":
-                return value / 14.50378911491
-            elif to_unit == "Pascals":
-                return value / 0.0001450378911491
-            elif to_unit == "Torrs":
-                return value / 0.01933679515879
-
-        elif from_unit == "Torrs":
-            if to_unit == "Atmospheres":
-                return value / 760.0
-            elif to_unit == "Bars":
-                return value / 750.0616827042
-            elif to_unit == "Pascals":
-                return value / 0.007500616827042
-            elif to_unit == "Psi":
-                return value * 0.01933679515879
-        
-        raise ValueError("Invalid units or conversion not supported")    
\ No newline at end of file
+        return pressure_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of pressure values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return pressure_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a pressure value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of pressure_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return pressure_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a pressure value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return pressure_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of pressure values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return pressure_table.convert_exact_batch(values, from_unit, to_unit, precision)
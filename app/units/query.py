@@ -0,0 +1,183 @@
+"""
+Query Module
+
+This module answers free-text conversion queries such as "5 ft 3 in to cm",
+"72 km/h in knots" or "10 kg/m³ as g/cm³" by dispatching to the converters in
+app/units.
+
+Numbers are pulled out of a query with a precompiled pattern, leaving its
+shape (e.g. "# ft # in to cm"). Each shape is compiled once into a plan of
+specialized converters, kept in a bounded LRU cache, so repeated query shapes
+skip parsing and unit resolution entirely.
+
+Classes:
+--------
+QueryPlan : The compiled form of a query shape.
+QueryResult : The answer to a query.
+
+Functions:
+----------
+compile_query(shape) : Compiles a query shape into a QueryPlan.
+run(query) : Answers a free-text conversion query.
+main(argv=None) : Command-line entry point.
+-------------------------------------------------------------------------------
+"""
+
+import argparse
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from app.units.engine import AffineTable, get_converter, get_table
+
+QueryPlan = namedtuple("QueryPlan", ["converters", "unit", "category"])
+QueryResult = namedtuple("QueryResult", ["value", "unit", "category"])
+
+# Placeholder left in the query shape where a number was found
+_slot = "\x00"
+# A number not glued to a preceding word or caret, so neither the 2 of "m2"
+# nor that of "m^2" or "m^-2" is a number
+_number_pattern = re.compile(r"(?<![\w.^])(?<!\^[-+])[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+# The keyword between the source and the target, matched without consuming spaces
+_separator_pattern = re.compile(r"(?<=\s)(?:to|in|into|as)(?=\s)|->|=>|→", re.IGNORECASE)
+_source_pattern = re.compile(rf"(?:\s*{_slot}\s*[^{_slot}]+?)+\s*")
+_term_pattern = re.compile(rf"{_slot}\s*([^{_slot}]+?)\s*(?={_slot}|$)")
+
+
+@lru_cache(maxsize=4096)
+def compile_query(shape):
+    """
+    Compiles a query shape into a plan of specialized converters.
+
+    Parameters:
+    -----------
+    shape : str
+        The query with every number replaced by a placeholder.
+
+    Returns:
+    --------
+    QueryPlan
+        One converter per source term, plus the target unit and category.
+
+    Raises:
+    -------
+    ValueError
+        If the shape is not a conversion query, a unit cannot be resolved or
+        several amounts of a category with an offset, such as temperature,
+        would have to be added.
+    """
+
+    separators = list(_separator_pattern.finditer(shape))
+    if not separators:
+        raise ValueError("Expected a query such as '5 ft 3 in to cm'")
+
+    separator = separators[-1]
+    source = shape[:separator.start()]
+    target = shape[separator.end():].strip()
+    if not target or not _source_pattern.fullmatch(source):
+        raise ValueError("Expected a query such as '5 ft 3 in to cm'")
+
+    units = _term_pattern.findall(source)
+    converters = []
+    category = None
+    unit = target
+    for from_unit in units:
+        converter, category, unit = _resolve(from_unit, target)
+        converters.append(converter)
+    if len(converters) > 1 and category and isinstance(get_table(category), AffineTable):
+        raise ValueError(f"Cannot add several amounts of {category}")
+    return QueryPlan(tuple(converters), unit, category)
+
+
+def _resolve(from_unit, to_unit):
+    """
+    Returns (converter, category, canonical target name) for a unit pair,
+    resolved through the alias index, falling back to compound unit
+    expressions when either side is not a registered unit.
+    """
+
+    from app.units import dimensions
+    from app.units.aliases import resolve
+
+    try:
+        source = resolve(from_unit)
+        target = resolve(to_unit)
+    except ValueError:
+        ratio = dimensions.convert(1.0, from_unit, to_unit)
+        return (lambda value: value * ratio), None, to_unit
+
+    if source.category != target.category:
+        raise ValueError(f"Cannot convert {source.name} to {target.name}")
+    return get_converter(source.category, source.name, target.name), target.category, target.name
+
+
+def run(query):
+    """
+    Answers a free-text conversion query.
+
+    Parameters:
+    -----------
+    query : str
+        A query such as '5 ft 3 in to cm'. When several amounts are given,
+        their converted values are added together, which is refused for
+        categories with an offset such as temperature.
+
+    Returns:
+    --------
+    QueryResult
+        The converted value, the target unit and its category.
+
+    Raises:
+    -------
+    ValueError
+        If the query cannot be parsed or its units cannot be converted.
+
+    Examples:
+    ---------
+    >>> run('5 ft 3 in to cm')
+    QueryResult(value=160.02, unit='Centimeters', category='length')
+    """
+
+    values = [float(number) for number in _number_pattern.findall(query)]
+    plan = compile_query(_number_pattern.sub(_slot, query.strip()))
+
+    result = 0.0
+    for converter, value in zip(plan.converters, values):
+        result += converter(value)
+    return QueryResult(result, plan.unit, plan.category)
+
+
+def main(argv=None):
+    """
+    Command-line entry point: answers the query given as arguments.
+
+    Parameters:
+    -----------
+    argv : list, optional
+        Command-line arguments, defaulting to sys.argv[1:].
+
+    Returns:
+    --------
+    int
+        The process exit status.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.units.query",
+        description="Answer a conversion query such as '72 km/h in knots'.",
+    )
+    parser.add_argument("query", nargs="+", help="the conversion query")
+    args = parser.parse_args(argv)
+
+    try:
+        result = run(" ".join(args.query))
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    print(f"{result.value:.12g} {result.unit}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
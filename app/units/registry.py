@@ -0,0 +1,311 @@
+"""
+Unit Registry Module
+
+This module assigns every unit of every category a small integer ID and keeps
+its canonical name, aliases and category. Hot paths and batch arrays can then
+carry compact integer IDs (e.g. uint8 or uint16 arrays) instead of display
+strings, and resolve them with plain list or array indexing.
+
+Classes:
+--------
+Unit : Describes one registered unit.
+UnitRegistry : Interns unit names into integer IDs across all categories.
+
+Variables:
+----------
+registry : UnitRegistry
+    The global registry, loaded with every category in app/units.
+-------------------------------------------------------------------------------
+"""
+
+import re
+from collections import namedtuple
+from enum import IntEnum
+from app.units.engine import AffineTable, categories, get_table
+
+Unit = namedtuple("Unit", ["id", "name", "category", "aliases"])
+
+
+class UnitRegistry:
+    """
+    A class used to intern unit names into small integer IDs.
+
+    IDs are assigned in category order, then in unit order, so they are stable
+    from one run to the next as long as the unit lists are only appended to.
+
+    Attributes:
+    -----------
+    units : list
+        Registered units, indexed by their ID.
+
+    Methods:
+    --------
+    register_table(table)
+        Registers every unit of a conversion table.
+    register(category, name, aliases=())
+        Registers a single unit and returns it.
+    unit_id(name)
+        Returns the ID of a unit given its name or one of its aliases.
+    unit(unit_id)
+        Returns the Unit registered under an ID.
+    ids
+        An IntEnum of every registered unit, e.g. ids.METERS.
+    id_dtype
+        The smallest unsigned NumPy dtype able to hold every ID.
+    encode(names)
+        Converts unit names into an array of IDs.
+    decode(unit_ids)
+        Converts IDs back into canonical unit names.
+    convert(value, from_id, to_id)
+        Converts a value between two units given by ID.
+    convert_ids(values, unit_ids, to_unit)
+        Converts an array of values, each in its own unit, into one unit.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+
+        self.units = []
+        self._lookup = {}
+        self._folded = {}
+        self._coefficients_by_target = {}
+        self._ids = None
+
+    def __len__(self):
+        return len(self.units)
+
+    def __contains__(self, name):
+        return name in self._lookup
+
+    def register_table(self, table):
+        """
+        Registers every unit of a conversion table.
+
+        Parameters:
+        -----------
+        table : UnitTable or AffineTable
+            The table whose units are registered.
+        """
+
+        for name in table.units:
+            self.register(table.name, name, table.aliases.get(name, ()))
+
+    def register(self, category, name, aliases=()):
+        """
+        Registers a single unit and returns it.
+
+        Parameters:
+        -----------
+        category : str
+            Name of the category the unit belongs to.
+        name : str
+            Canonical name of the unit.
+        aliases : tuple, optional
+            Symbols and alternative spellings of the unit.
+
+        Returns:
+        --------
+        Unit
+            The registered unit.
+
+        Raises:
+        -------
+        ValueError
+            If the name or one of the aliases already denotes another unit.
+        """
+
+        unit = Unit(len(self.units), name, category, tuple(aliases))
+        keys = (name,) + unit.aliases
+        for key in keys:
+            if key in self._lookup:
+                raise ValueError(f"Unit name already registered: {key}")
+
+        self.units.append(unit)
+        self._coefficients_by_target = {}
+        self._ids = None
+
+        for key in keys:
+            self._lookup[key] = unit.id
+            folded = key.casefold()
+            # Keys that only differ by case (e.g. 'MB' and 'Mb') stay case-sensitive
+            if self._folded.setdefault(folded, unit.id) != unit.id:
+                self._folded[folded] = None
+        return unit
+
+    def unit_id(self, name):
+        """
+        Returns the ID of a unit given its name or one of its aliases.
+
+        Exact matches are tried first, then case-insensitive ones as long as
+        they are unambiguous.
+
+        Raises:
+        -------
+        ValueError
+            If the name does not denote a registered unit.
+        """
+
+        try:
+            return self._lookup[name]
+        except (KeyError, TypeError):
+            pass
+
+        if not isinstance(name, str):
+            raise ValueError(f"Unknown unit: {name!r}")
+        unit_id = self._folded.get(name.strip().casefold())
+        if unit_id is None:
+            raise ValueError(f"Unknown unit: {name}")
+        return unit_id
+
+    def unit(self, unit_id):
+        """
+        Returns the Unit registered under an ID.
+
+        Raises:
+        -------
+        ValueError
+            If no unit has that ID.
+        """
+
+        if not 0 <= unit_id < len(self.units):
+            raise ValueError(f"Unknown unit ID: {unit_id}")
+        return self.units[unit_id]
+
+    @property
+    def ids(self):
+        """
+        An IntEnum with one member per registered unit, named after its
+        canonical name (e.g. ids.METRES_PER_SECOND).
+        """
+
+        if self._ids is None:
+            self._ids = IntEnum(
+                "UnitId",
+                [(re.sub(r"\W+", "_", unit.name).upper(), unit.id) for unit in self.units],
+            )
+        return self._ids
+
+    @property
+    def id_dtype(self):
+        """
+        The smallest unsigned NumPy dtype able to hold every ID.
+        """
+
+        import numpy
+
+        return numpy.min_scalar_type(max(len(self.units) - 1, 0))
+
+    def encode(self, names):
+        """
+        Converts unit names into an array of IDs using id_dtype.
+
+        Raises:
+        -------
+        ValueError
+            If a name does not denote a registered unit.
+        """
+
+        import numpy
+
+        return numpy.fromiter((self.unit_id(name) for name in names), dtype=self.id_dtype)
+
+    def decode(self, unit_ids):
+        """
+        Converts IDs back into canonical unit names.
+
+        Raises:
+        -------
+        ValueError
+            If an ID is unknown.
+        """
+
+        return [self.unit(unit_id).name for unit_id in unit_ids]
+
+    def convert(self, value, from_id, to_id):
+        """
+        Converts a value between two units given by ID.
+
+        Raises:
+        -------
+        ValueError
+            If the IDs are unknown or the units belong to different categories.
+        """
+
+        from_unit = self.unit(from_id)
+        to_unit = self.unit(to_id)
+        if from_unit.category != to_unit.category:
+            raise ValueError("Invalid units or conversion not supported")
+        return get_table(from_unit.category).convert(value, from_unit.name, to_unit.name)
+
+    def convert_ids(self, values, unit_ids, to_unit):
+        """
+        Converts an array of values, each expressed in its own unit, into a
+        single target unit with vectorized indexing.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        unit_ids : array_like
+            The unit ID of each value.
+        to_unit : int or str
+            The unit to convert the values into, by ID or name.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit, as float64.
+
+        Raises:
+        -------
+        ValueError
+            If a unit does not belong to the category of the target unit.
+        """
+
+        import numpy
+
+        to_id = self.unit_id(to_unit) if isinstance(to_unit, str) else to_unit
+        scales, offsets = self._coefficients(to_id)
+        unit_ids = numpy.asarray(unit_ids)
+        scales, offsets = scales[unit_ids], offsets[unit_ids]
+        if numpy.isnan(scales).any():
+            raise ValueError("Invalid units or conversion not supported")
+
+        result = numpy.multiply(values, scales, dtype=numpy.float64)
+        result += offsets
+        return result
+
+    def _coefficients(self, to_id):
+        """
+        Returns the arrays (a, b), indexed by unit ID, such that a * x + b
+        converts a value x into the unit to_id. Units from other categories
+        get NaN. The arrays are built once per target unit.
+        """
+
+        import numpy
+
+        try:
+            return self._coefficients_by_target[to_id]
+        except KeyError:
+            pass
+
+        target = self.unit(to_id)
+        table = get_table(target.category)
+        scales = numpy.full(len(self.units), numpy.nan)
+        offsets = numpy.full(len(self.units), numpy.nan)
+        for unit in self.units:
+            if unit.category != target.category:
+                continue
+            if isinstance(table, AffineTable):
+                scales[unit.id], offsets[unit.id] = table.transform(unit.name, target.name)
+            else:
+                scales[unit.id], offsets[unit.id] = table.ratio(unit.name, target.name), 0.0
+
+        self._coefficients_by_target[to_id] = scales, offsets
+        return scales, offsets
+
+registry = UnitRegistry()
+for category in categories:
+    registry.register_table(get_table(category))
@@ -0,0 +1,501 @@
+"""
+Service Module
+
+This module serves the converters of app/units over HTTP with asyncio, without
+importing Kivy or any app screen:
+
+    python -m app.units.service --port 8080
+
+Endpoints:
+
+    GET  /convert?category=length&from=Miles&to=Kilometers&value=3
+    POST /batch   {"category": "length", "from": "mi", "to": "km", "values": [1, 2, 3]}
+    GET  /stats   cache and coalescing counters
+
+The category is optional and inferred from the units when omitted, and units
+may be given by name or alias. Connections are kept alive (HTTP/1.1), single
+conversions are answered directly on the event loop, and batch bodies are
+decoded, converted with one vectorized call and encoded on an executor so
+that large batches never block the loop.
+
+Identical requests arriving while one of them is being answered share its
+response instead of computing it again, and encoded responses are kept in a
+size-bounded LRU cache whose entries expire after a time to live.
+
+Classes:
+--------
+ResponseCache : A size-bounded LRU cache with expiring entries.
+ConversionService : Answers conversion requests and serves them over HTTP.
+
+Functions:
+----------
+main(argv=None) : Command-line entry point.
+
+Variables:
+----------
+max_body_size : int
+    Largest request body accepted, in bytes.
+max_cached_body_size : int
+    Largest batch body whose response is cached, in bytes.
+-------------------------------------------------------------------------------
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+from app.units.engine import get_converter
+
+# Largest request body accepted, in bytes
+max_body_size = 64 * 1024 * 1024
+# Larger batches are still coalesced, but their responses are not cached
+max_cached_body_size = 64 * 1024
+
+
+class ResponseCache:
+    """
+    A size-bounded LRU cache whose entries expire after a time to live.
+
+    Attributes:
+    -----------
+    maxsize : int
+        Maximum number of entries.
+    ttl : float
+        Lifetime of an entry, in seconds.
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups not found, or found expired.
+    evictions : int
+        Number of entries dropped to stay within maxsize.
+    expirations : int
+        Number of entries dropped because they outlived ttl.
+
+    Methods:
+    --------
+    get(key)
+        Returns the value cached under key, or None.
+    put(key, value)
+        Caches a value under key, evicting the least recently used entry
+        when full.
+    stats()
+        Returns the counters and the current size.
+    """
+
+    def __init__(self, maxsize=4096, ttl=60.0):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        -----------
+        maxsize : int, optional
+            Maximum number of entries.
+        ttl : float, optional
+            Lifetime of an entry, in seconds.
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Returns the value cached under key and marks it as recently used, or
+        None if it is missing or expired.
+        """
+
+        try:
+            expires, value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        if expires <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Caches a value under key for ttl seconds, evicting the least recently
+        used entries beyond maxsize.
+        """
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """
+        Returns the hit, miss, eviction and expiration counters, and the
+        number of cached entries.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
+
+
+class ConversionService:
+    """
+    A class used to answer conversion requests, over HTTP or directly.
+
+    Attributes:
+    -----------
+    executor : concurrent.futures.Executor
+        The executor running batch conversions.
+    cache : ResponseCache
+        The encoded responses of recent requests.
+    coalesced : int
+        Number of requests answered by sharing an identical in-flight one.
+
+    Methods:
+    --------
+    convert(params)
+        Answers a single conversion given its query parameters.
+    batch(body)
+        Answers a batch conversion given its JSON body.
+    handle(method, target, body)
+        Routes an HTTP request and returns its status and JSON payload.
+    respond(method, target, body)
+        Returns the encoded response of a request, cached and coalesced.
+    serve(host='127.0.0.1', port=8080)
+        Serves HTTP requests until cancelled.
+    """
+
+    def __init__(self, executor=None, cache=None):
+        """
+        Initializes the service.
+
+        Parameters:
+        -----------
+        executor : concurrent.futures.Executor, optional
+            The executor running batch conversions, a thread pool by default.
+            NumPy releases the GIL while multiplying, so threads are enough
+            to keep the event loop responsive.
+        cache : ResponseCache, optional
+            The response cache, holding 4096 entries for 60 seconds by
+            default.
+        """
+
+        self.executor = executor or ThreadPoolExecutor()
+        self.cache = cache if cache is not None else ResponseCache()
+        self.coalesced = 0
+        self._inflight = {}
+
+    @staticmethod
+    def _reject_constant(name):
+        """Rejects the NaN and Infinity literals, which are not valid JSON."""
+
+        raise ValueError(f"Invalid number: {name}")
+
+    @staticmethod
+    def _pair(request):
+        """Returns (category, from_unit, to_unit) of a request mapping."""
+
+        from app.units.aliases import resolve_pair
+
+        try:
+            from_unit, to_unit, category = request["from"], request["to"], request.get("category") or None
+        except KeyError as error:
+            raise ValueError(f"Missing parameter: {error.args[0]}") from None
+        if not all(isinstance(part, str) for part in (from_unit, to_unit, category) if part is not None):
+            raise ValueError("Invalid units or conversion not supported")
+        return resolve_pair(from_unit, to_unit, category)
+
+    def convert(self, params):
+        """
+        Answers a single conversion.
+
+        Parameters:
+        -----------
+        params : dict
+            The 'from', 'to' and 'value' parameters, and optionally
+            'category'.
+
+        Returns:
+        --------
+        dict
+            The converted value, with the category and target unit.
+
+        Raises:
+        -------
+        ValueError
+            If a parameter is missing or invalid.
+        """
+
+        from app.units.parsing import parse_number
+
+        category, from_unit, to_unit = self._pair(params)
+        try:
+            state, value = parse_number(params["value"])
+        except KeyError:
+            raise ValueError("Missing parameter: value") from None
+        if state != "complete" or not math.isfinite(value):
+            raise ValueError("Expected a finite number")
+        result = get_converter(category, from_unit, to_unit)(value)
+        if not math.isfinite(result):
+            raise ValueError("Result out of range")
+        return {
+            "category": category,
+            "from": from_unit,
+            "to": to_unit,
+            "value": result,
+        }
+
+    def batch(self, body):
+        """
+        Answers a batch conversion with a single vectorized call.
+
+        Parameters:
+        -----------
+        body : bytes
+            A JSON object with 'from', 'to' and 'values', and optionally
+            'category'.
+
+        Returns:
+        --------
+        dict
+            The converted values, with the category and target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the body is not valid JSON or a field is missing or invalid.
+        """
+
+        import numpy
+
+        request = json.loads(body, parse_constant=self._reject_constant)
+        if not isinstance(request, dict):
+            raise ValueError("Expected a JSON object")
+        category, from_unit, to_unit = self._pair(request)
+        try:
+            values = request["values"]
+        except KeyError:
+            raise ValueError("Missing parameter: values") from None
+        # Booleans are ints in Python but not numbers in JSON
+        if not isinstance(values, list) or not all(type(value) in (int, float) for value in values):
+            raise ValueError("Expected an array of numbers")
+        try:
+            values = numpy.array(values, dtype=numpy.float64)
+        except OverflowError:
+            raise ValueError("Value out of range") from None
+        if not numpy.isfinite(values).all():
+            raise ValueError("Value out of range")
+        with numpy.errstate(over="ignore"):
+            converted = numpy.asarray(get_converter(category, from_unit, to_unit)(values))
+        if not numpy.isfinite(converted).all():
+            raise ValueError("Result out of range")
+        return {
+            "category": category,
+            "from": from_unit,
+            "to": to_unit,
+            "values": converted.tolist(),
+        }
+
+    async def handle(self, method, target, body=b""):
+        """
+        Routes an HTTP request to its endpoint.
+
+        Parameters:
+        -----------
+        method : str
+            The HTTP method.
+        target : str
+            The request target, path and query string.
+        body : bytes, optional
+            The request body.
+
+        Returns:
+        --------
+        tuple
+            The HTTPStatus and the JSON-serializable payload of the response.
+        """
+
+        url = urlsplit(target)
+        try:
+            if url.path == "/convert":
+                if method != "GET":
+                    return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use GET"}
+                params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                return HTTPStatus.OK, self.convert(params)
+            if url.path == "/batch":
+                if method != "POST":
+                    return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST"}
+                loop = asyncio.get_running_loop()
+                return HTTPStatus.OK, await loop.run_in_executor(self.executor, self.batch, body)
+            if url.path == "/stats":
+                return HTTPStatus.OK, dict(self.cache.stats(), coalesced=self.coalesced)
+        except ValueError as error:
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown endpoint: {url.path}"}
+
+    async def respond(self, method, target, body=b""):
+        """
+        Returns the status and encoded JSON content of the response to a
+        request.
+
+        Conversions are looked up in the response cache first. On a miss, a
+        request identical to one still being answered waits for that answer
+        instead of computing it again (singleflight), and the answer is then
+        cached, except for batches larger than max_cached_body_size.
+
+        Returns:
+        --------
+        tuple
+            The HTTPStatus and the encoded JSON content.
+        """
+
+        if not target.startswith(("/convert", "/batch")):
+            status, payload = await self.handle(method, target, body)
+            return status, json.dumps(payload, allow_nan=False).encode()
+
+        key = (method, target, body)
+        response = self.cache.get(key)
+        if response is not None:
+            return response
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        pending = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            status, payload = await self.handle(method, target, body)
+            response = status, json.dumps(payload, allow_nan=False).encode()
+        except BaseException as error:
+            pending.set_exception(error)
+            pending.exception()  # Retrieved here, so an unshared failure is not logged twice
+            raise
+        finally:
+            del self._inflight[key]
+
+        if len(body) <= max_cached_body_size:
+            self.cache.put(key, response)
+        pending.set_result(response)
+        return response
+
+    async def _connection(self, reader, writer):
+        """Serves the requests of one connection until it is closed."""
+
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                if version == "HTTP/1.0":
+                    keep_alive = headers.get("connection", "").lower() == "keep-alive"
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    status, content, keep_alive = HTTPStatus.BAD_REQUEST, b'{"error": "Invalid Content-Length"}', False
+                elif length > max_body_size:
+                    status, content, keep_alive = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b'{"error": "Body too large"}', False
+                else:
+                    try:
+                        body = await reader.readexactly(length)
+                    except (asyncio.IncompleteReadError, ConnectionError):
+                        return
+                    try:
+                        status, content = await self.respond(method, target, body)
+                    except Exception:
+                        # A bug must not drop the connection without an answer
+                        traceback.print_exc()
+                        status, content = HTTPStatus.INTERNAL_SERVER_ERROR, b'{"error": "Internal server error"}'
+                        keep_alive = False
+
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        """
+        Serves HTTP requests on host and port until cancelled.
+        """
+
+        server = await asyncio.start_server(self._connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    """
+    Command-line entry point: runs the conversion service.
+
+    Parameters:
+    -----------
+    argv : list, optional
+        Command-line arguments, defaulting to sys.argv[1:].
+
+    Returns:
+    --------
+    int
+        The process exit status.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.units.service",
+        description="Serve unit conversions over HTTP.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("--cache-size", type=int, default=4096, help="responses kept in the cache")
+    parser.add_argument("--cache-ttl", type=float, default=60.0, help="seconds a cached response stays valid")
+    args = parser.parse_args(argv)
+
+    service = ConversionService(cache=ResponseCache(args.cache_size, args.cache_ttl))
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
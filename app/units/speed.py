@@ -10,14 +10,42 @@ SpeedConverter : Provides a static method for converting speed values between di
 
 Variables:
 ----------
+speed_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 speed_units : list
     A list of supported speed units for conversion.
+speed_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+speed_table : UnitTable
+    The conversion table built from speed_factors and speed_aliases.
     
 -------------------------------------------------------------------------------
 """
 
+from app.units.dimensions import derive
+from app.units.engine import UnitTable
 
-speed_units = ["Feet per Second", "Metres per Second", "Kilometres per Hour", "Miles per Hour", "Knots"]
+
+# Value of one unit expressed in Metres per Second, derived from length and time units
+speed_factors = {
+    "Feet per Second": derive(("length", "Feet", 1), ("time", "Seconds", -1)),
+    "Metres per Second": derive(("length", "Meters", 1), ("time", "Seconds", -1)),
+    "Kilometres per Hour": derive(("length", "Kilometers", 1), ("time", "Hours", -1)),
+    "Miles per Hour": derive(("length", "Miles", 1), ("time", "Hours", -1)),
+    "Knots": derive(("length", "Nautical Miles", 1), ("time", "Hours", -1)),
+}
+
+# Symbols and alternative spellings accepted for each unit
+speed_aliases = {
+    "Feet per Second": ("ft/s", "fps", "Foot per Second"),
+    "Metres per Second": ("m/s", "mps", "Metre per Second", "Meters per Second", "Meter per Second"),
+    "Kilometres per Hour": ("km/h", "kph", "kmh", "Kilometre per Hour", "Kilometers per Hour", "Kilometer per Hour"),
+    "Miles per Hour": ("mph", "mi/h", "Mile per Hour"),
+    "Knots": ("kn", "kt", "Knot"),
+}
+
+speed_units = list(speed_factors)
+speed_table = UnitTable("speed", speed_factors, speed_aliases)
 
 class SpeedConverter:
     """
@@ -27,6 +55,14 @@ class SpeedConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a speed value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of speed values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a speed value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a speed value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of speed values exactly.
     """
     
     @staticmethod
@@ -63,62 +99,125 @@ class SpeedConverter:
         Examples:
         ---------
         >>> SpeedConverter.convert(1, 'Kilometres per Hour', 'Miles per Hour')
-        0.621371
+        0.621371192237334
         >>> SpeedConverter.convert(10, 'Metres per Second', 'Knots')
-        19.4384
+        19.438444924406046
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Feet per Second":
-            if to_unit == "Miles per Hour":
-                return value / 1.46667
-            elif to_unit == "Kilometres per Hour":
-                return value * 1.09728
-            elif to_unit == "Metres per Second":
-                return value / 3.28084
-            elif to_unit == "Knots":
-                return value / 1.68781
-            
-        elif from_unit == "Kilometres per Hour":
-            if to_unit == "Miles per Hour":
-                return value / 1.60934
-            elif to_unit == "Feet per Second":
-                return value / 1.09728
-            elif to_unit == "Metres per Second":
-                return value / 3.6
-            elif to_unit == "Knots":
-                return value / 1.852
-            
-        elif from_unit == "Knots":
-            if to_unit == "Miles per Hour":
-                return value * 1.15078
-            elif to_unit == "Kilometres per Hour":
-                return value * 1.852
-            elif to_unit == "Feet per Second":
-                return value * 1.68781
-            elif to_unit == "Metres per Second":
-                return value / 1.94384
-            
-        elif from_unit == "Metres per Second":
-            if to_unit == "Miles per Hour":
-                return value * 2.23694
-            elif to_unit == "Kilometres per Hour":
-                return value * 3.6
-            elif to_unit == "Feet per Second":
-                return value * 3.28084
-            elif to_unit == "Knots":
-                return value * 1.94384
-            
-        elif from_unit == "Miles per Hour":
-            if to_unit == "Kilometres per Hour":
-                return value * 1.60934
-            elif to_unit == "Feet per Second":
-                return value * 1.46667
-            elif to_unit == "Metres per Second":
-                return value / 2.23694
-            elif to_unit == "Knots":
-                return value / 1.15078
-
-        raise ValueError("Invalid units or conversion not supported")
+        return speed_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of speed values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return speed_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a speed value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of speed_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return speed_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a speed value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return speed_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of speed values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return speed_table.convert_exact_batch(values, from_unit, to_unit, precision)
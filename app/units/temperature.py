@@ -10,13 +10,39 @@ TemperatureConverter : Provides a static method for converting temperature value
 
 Variables:
 ----------
+temperature_transforms : dict
+    Maps each supported unit to the (scale, offset) pair taking it to Kelvin.
 temperature_units : list
     A list of supported temperature units for conversion.
+temperature_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+temperature_table : AffineTable
+    The conversion table built from temperature_transforms and temperature_aliases.
 
 -------------------------------------------------------------------------------
 """
 
-temperature_units = ["Celsius", "Fahrenheit", "Kelvin", "Rankine"]
+from fractions import Fraction
+from app.units.engine import AffineTable
+
+# (scale, offset) such that Kelvin = scale * value + offset
+temperature_transforms = {
+    "Celsius": (1.0, 273.15),
+    "Fahrenheit": (Fraction(5, 9), Fraction(45967, 180)),
+    "Kelvin": (1.0, 0.0),
+    "Rankine": (Fraction(5, 9), 0.0),
+}
+
+# Symbols and alternative spellings accepted for each unit
+temperature_aliases = {
+    "Celsius": ("°C", "C", "degC"),
+    "Fahrenheit": ("°F", "F", "degF"),
+    "Kelvin": ("K",),
+    "Rankine": ("°R", "R", "degR"),
+}
+
+temperature_units = list(temperature_transforms)
+temperature_table = AffineTable("temperature", temperature_transforms, temperature_aliases)
 
 class TemperatureConverter:
     """
@@ -26,6 +52,16 @@ class TemperatureConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a temperature value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of temperature values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a temperature value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a temperature value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of temperature values exactly.
+    chain(*units)
+        Folds a chain of temperature conversions into a single affine transform.
     """
     
     @staticmethod
@@ -66,39 +102,155 @@ class TemperatureConverter:
         373.15
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Celsius":
-            if to_unit == "Fahrenheit":
-                return value * 1.8 + 32.0
-            elif to_unit == "Kelvin":
-                return value + 273.15
-            elif to_unit == "Rankine":
-                return value * 9.0/5.0 + 491.67
-            
-        elif from_unit == "Fahrenheit":
-            if to_unit == "Celsius":
-                return ((value - 32.0) * 5.0) / 9.0
-            elif to_unit == "Kelvin":
-                return (((value - 32.0) * 5.0) / 9.0) + 273.15
-            elif to_unit == "Rankine":
-                return value + 459.67
-            
-        elif from_unit == "Kelvin":
-            if to_unit == "Celsius":
-                return value - 273.15
-            elif to_unit == "Fahrenheit":
-                return ((value - 273.15) * 1.8) + 32.0
-            elif to_unit == "Rankine":
-                return value * 1.8
-            
-        elif from_unit == "Rankine":
-            if to_unit == "Celsius":
-                return (value - 491.67) * 5.0/9.0
-            elif to_unit == "Fahrenheit":
-                return value - 459.67
-            elif to_unit == "Kelvin":
-                return value / 1.8
-
-        raise ValueError("Invalid units or conversion not supported")
\ No newline at end of file
+        return temperature_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of temperature values from one unit to another in a
+        single vectorized multiply-add.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return temperature_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a temperature value into every supported unit with a single
+        vectorized multiply-add, value * scale + offset, over the rows of
+        from_unit in the precomputed scale and offset matrices.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of temperature_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return temperature_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def chain(*units):
+        """
+        Folds the conversions between consecutive units into one affine
+        transform that can be applied to numbers or arrays.
+
+        Parameters:
+        -----------
+        *units : str
+            Two or more supported units, in conversion order.
+
+        Returns:
+        --------
+        AffineTransform
+            A callable (scale, offset) pair equivalent to the whole chain.
+
+        Raises:
+        -------
+        ValueError
+            If fewer than two units are given or a unit is not supported.
+
+        Examples:
+        ---------
+        >>> TemperatureConverter.chain('Celsius', 'Kelvin', 'Fahrenheit')(100)
+        212.0
+        """
+
+        return temperature_table.chain(*units)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a temperature value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+
+        Examples:
+        ---------
+        >>> TemperatureConverter.convert_exact(98.6, 'Fahrenheit', 'Celsius')
+        Fraction(37, 1)
+        """
+
+        return temperature_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of temperature values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return temperature_table.convert_exact_batch(values, from_unit, to_unit, precision)
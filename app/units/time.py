@@ -10,13 +10,60 @@ TimeConverter : Provides a static method for converting time values between diff
 
 Variables:
 ----------
+time_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 time_units : list
     A list of supported time units for conversion.
+time_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+time_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+time_table : UnitTable
+    The conversion table built from time_factors, time_aliases and time_prefixed.
 -------------------------------------------------------------------------------
 """
 
-time_units = ["Nanoseconds", "Microseconds", "Milliseconds", "Seconds","Minutes", 
-              "Hours", "Days", "Weeks","Months", "Years", "Decades", "Centuries"]
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Seconds
+time_factors = {
+    "Nanoseconds": 1e-9,
+    "Microseconds": 1e-6,
+    "Milliseconds": 0.001,
+    "Seconds": 1.0,
+    "Minutes": 60.0,
+    "Hours": 3600.0,
+    "Days": 86400.0,
+    "Weeks": 604800.0,
+    "Months": 2628000.0,
+    "Years": 31536000.0,
+    "Decades": 315360000.0,
+    "Centuries": 3153600000.0,
+}
+
+# Symbols and alternative spellings accepted for each unit
+time_aliases = {
+    "Nanoseconds": ("ns", "Nanosecond"),
+    "Microseconds": ("µs", "us", "Microsecond"),
+    "Milliseconds": ("ms", "Millisecond"),
+    "Seconds": ("s", "sec", "Second"),
+    "Minutes": ("min", "Minute"),
+    "Hours": ("h", "hr", "Hour"),
+    "Days": ("d", "Day"),
+    "Weeks": ("wk", "Week"),
+    "Months": ("mo", "Month"),
+    "Years": ("yr", "Year"),
+    "Decades": ("Decade",),
+    "Centuries": ("Century",),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+time_prefixed = {
+    "Seconds": (1.0, ("s",), ("SI",)),
+}
+
+time_units = list(time_factors)
+time_table = UnitTable("time", time_factors, time_aliases, time_prefixed)
 
 class TimeConverter:
     """
@@ -26,6 +73,14 @@ class TimeConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a time value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of time values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a time value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a time value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of time values exactly.
     """
     
     @staticmethod
@@ -74,319 +129,125 @@ class TimeConverter:
         24.0
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Centuries":
-            if to_unit == "Nanoseconds":
-                return value * 3.154e+18
-            elif to_unit == "Microseconds":
-                return value * 3.154e+15
-            elif to_unit == "Milliseconds":
-                return value * 3.154e+12
-            elif to_unit == "Seconds":
-                return value * 3.154e+9
-            elif to_unit == "Minutes":
-                return value * 5.256e+7
-            elif to_unit == "Hours":
-                return value * 876000.0
-            elif to_unit == "Days":
-                return value * 36500.0
-            elif to_unit == "Weeks":
-                return value * 5214.29
-            elif to_unit == "Months":
-                return value * 1200.0
-            elif to_unit == "Years":
-                return value * 100.0
-            elif to_unit == "Decades":
-                return value * 10.0
-
-        elif from_unit == "Nanoseconds":
-            if to_unit == "Centuries":
-                return value / 3.154e+18
-            elif to_unit == "Microseconds":
-                return value / 1000.0
-            elif to_unit == "Milliseconds":
-                return value / 1e+6
-            elif to_unit == "Seconds":
-                return value / 1e+9
-            elif to_unit == "Minutes":
-                return value / 6e+10
-            elif to_unit == "Hours":
-                return value / 3.6e+12
-            elif to_unit == "Days":
-                return value / 8.64e+13
-            elif to_unit == "Weeks":
-                return value / 6.048e+14
-            elif to_unit == "Months":
-                return value / 2629746000000000.0
-            elif to_unit == "Years":
-                return value / 3.154e+16
-            elif to_unit == "Decades":
-                return value / 3.154e+17
-
-        elif from_unit == "Days":
-            if to_unit == "Nanoseconds":
-                return value * 8.64e+13
-            elif to_unit == "Microseconds":
-                return value * 8.64e+10
-            elif to_unit == "Milliseconds":
-                return value * 8.64e+7
-            elif to_unit == "Seconds":
-                return value * 86400.0
-            elif to_unit == "Minutes":
-                return value * 1440.0
-            elif to_unit == "Hours":
-                return value * 24.0
-            elif to_unit == "Weeks":
-                return value / 7.0
-            elif to_unit == "Months":
-                return value / 30.4167
-            elif to_unit == "Years":
-                return value / 365.0
-            elif to_unit == "Decades":
-                return value / 3650.0
-            elif to_unit == "Centuries":
-                return value / 36500.0
-
-        elif from_unit == "Days":
-            if to_unit == "Nanoseconds":
-                return value * 8.64e+13
-            elif to_unit == "Microseconds":
-                return value * 8.64e+10
-            elif to_unit == "Milliseconds":
-                return value * 8.64e+7
-            elif to_unit == "Seconds":
-                return value * 86400.0
-            elif to_unit == "Minutes":
-                return value * 1440.0
-            elif to_unit == "Hours":
-                return value * 24.0
-            elif to_unit == "Weeks":
-                return value / 7.0
-            elif to_unit == "Months":
-                return value / 30.4167
-            elif to_unit == "Years":
-                return value / 365.0
-            elif to_unit == "Decades":
-                return value / 3650.0
-            elif to_unit == "Centuries":
-                return value / 36500.0
-
-        elif from_unit == "Decades":
-            if to_unit == "Nanoseconds":
-                return value * 3.154e+17
-            elif to_unit == "Microseconds":
-                return value * 3.154e+14
-            elif to_unit == "Milliseconds":
-                return value * 3.154e+11
-            elif to_unit == "Seconds":
-                return value * 3.154e+8
-            elif to_unit == "Minutes":
-                return value * 5.256e+6
-            elif to_unit == "Hours":
-                return value * 87600.0
-            elif to_unit == "Days":
-                return value * 3650.0
-            elif to_unit == "Weeks":
-                return value * 521.429
-            elif to_unit == "Months":
-                return value * 120.0
-            elif to_unit == "Years":
-                return value * 10.0
-            elif to_unit == "Centuries":
-                return value / 10.0
-
-        elif from_unit == "Years":
-            if to_unit == "Nanoseconds":
-                return value * 3.154e+16
-            elif to_unit == "Microseconds":
-                return value * 3.154e+13
-            elif to_unit == "Milliseconds":
-                return value * 31556952000.0
-            elif to_unit == "Seconds":
-                return value * 3.1536e+7
-            elif to_unit == "Minutes":
-                return value * 525600.0
-            elif to_unit == "Hours":
-                return value * 8760.0
-            elif to_unit == "Days":
-                return value * 365.0
-            elif to_unit == "Weeks":
-                return value * 52.143
-            elif to_unit == "Months":
-                return value * 12.0
-            elif to_unit == "Decades":
-                return value / 10.0
-            elif to_unit == "Centuries":
-                return value / 100.0
-
-        elif from_unit == "Months":
-            if to_unit == "Nanoseconds":
-                return value * 2629746000000000.0
-            elif to_unit == "Microseconds":
-                return value * 2629746000000.0
-            elif to_unit == "Milliseconds":
-                return value * 2629746000.0
-            elif to_unit == "Seconds":
-                return value * 2.628e+6
-            elif to_unit == "Minutes":
-                return value * 43800.0
-            elif to_unit == "Hours":
-                return value * 730.001
-            elif to_unit == "Days":
-                return value * 30.4167
-            elif to_unit == "Weeks":
-                return value * 4.34524
-            elif to_unit == "Years":
-                return value / 12.0
-            elif to_unit == "Decades":
-                return value / 120.0
-            elif to_unit == "Centuries":
-                return value / 1200.0
-
-        elif from_unit == "Weeks":
-            if to_unit == "Nanoseconds":
-                return value * 6.048e+14
-            elif to_unit == "Microseconds":
-                return value * 6.048e+11
-            elif to_unit == "Milliseconds":
-                return value * 6.048e+8
-            elif to_unit == "Seconds":
-                return value * 604800.0
-            elif to_unit == "Minutes":
-                return value * 10080.0
-            elif to_unit == "Hours":
-                return value * 168.0
-            elif to_unit == "Days":
-                return value * 7.0
-            elif to_unit == "Months":
-                return value / 4.34524
-            elif to_unit == "Years":
-                return value / 52.143
-            elif to_unit == "Decades":
-                return value / 521.429
-            elif to_unit == "Centuries":
-                return value / 5214.29
-
-        elif from_unit == "Hours":
-            if to_unit == "Nanoseconds":
-                return value * 3.6e+12
-            elif to_unit == "Microseconds":
-                return value * 3.6e+9
-            elif to_unit == "Milliseconds":
-                return value * 3.6e+6
-            elif to_unit == "Seconds":
-                return value * 3600.0
-            elif to_unit == "Minutes":
-                return value * 60.0
-            elif to_unit == "Days":
-                return value / 24.0
-            elif to_unit == "Weeks":
-                return value / 168.0
-            elif to_unit == "Months":
-                return value / 730.001
-            elif to_unit == "Years":
-                return value / 8760.0
-            elif to_unit == "Decades":
-                return value / 87600.0
-            elif to_unit == "Centuries":
-                return value / 876000.0
-
-        elif from_unit == "Minutes":
-            if to_unit == "Nanoseconds":
-                return value * 6e+10
-            elif to_unit == "Microseconds":
-                return value * 6e+7
-            elif to_unit == "Milliseconds":
-                return value * 60000.0
-            elif to_unit == "Seconds":
-                return value * 60.0
-            elif to_unit == "Hours":
-                return value / 60.0
-            elif to_unit == "Days":
-                return value / 1440.0
-            elif to_unit == "Weeks":
-                return value / 10080.0
-            elif to_unit == "Months":
-                return value / 43800.0
-            elif to_unit == "Years":
-                return value / 525600.0
-            elif to_unit == "Decades":
-                return value / 5.256e+6
-            elif to_unit == "Centuries":
-                return value / 5.256e+7
-
-        elif from_unit == "Seconds":
-            if to_unit == "Nanoseconds":
-                return value * 1e+9
-            elif to_unit == "Microseconds":
-                return value * 1e+6
-            elif to_unit == "Milliseconds":
-                return value * 1000.0
-            elif to_unit == "Minutes":
-                return value / 60.0
-            elif to_unit == "Hours":
-                return value / 3600.0
-            elif to_unit == "Days":
-                return value / 86400.0
-            elif to_unit == "Weeks":
-                return value / 604800.0
-            elif to_unit == "Months":
-                return value / 2.628e+6
-            elif to_unit == "Years":
-                return value / 3.1536e+7
-            elif to_unit == "Decades":
-                return value / 3.154e+8
-            elif to_unit == "Centuries":
-                return value / 3.154e+9
-
-        elif from_unit == "Milliseconds":
-            if to_unit == "Nanoseconds":
-                return value * 1e+6
-            elif to_unit == "Microseconds":
-                return value * 1000.0
-            elif to_unit == "Seconds":
-                return value / 1000.0
-            elif to_unit == "Minutes":
-                return value / 60000.0
-            elif to_unit == "Hours":
-                return value / 3.6e+6
-            elif to_unit == "Days":
-                return value / 8.64e+7
-            elif to_unit == "Weeks":
-                return value / 6.048e+8
-            elif to_unit == "Months":
-                return value / 2629746000.0
-            elif to_unit == "Years":
-                return value / 31556952000.0
-            elif to_unit == "Decades":
-                return value / 3.154e+11
-            elif to_unit == "Centuries":
-                return value / 3.154e+12
-
-        elif from_unit == "Microseconds":
-            if to_unit == "Nanoseconds":
-                return value * 1000.0
-            elif to_unit == "Milliseconds":
-                return value / 1000.0
-            elif to_unit == "Seconds":
-                return value / 1e+6
-            elif to_unit == "Minutes":
-                return value / 6e+7
-            elif to_unit == "Hours":
-                return value / 3.6e+9
-            elif to_unit == "Days":
-                return value / 8.64e+10
-            elif to_unit == "Weeks":
-                return value / 6.048e+11
-            elif to_unit == "Months":
-                return value / 2629746000000.0
-            elif to_unit == "Years":
-                return value / 3.154e+13
-            elif to_unit == "Decades":
-                return value / 3.154e+14
-            elif to_unit == "Centuries":
-                return value / 3.154e+15
-
-        raise ValueError("Invalid units or conversion not supported")
\ No newline at end of file
+        return time_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of time values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return time_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a time value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of time_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return time_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a time value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+
+        Examples:
+        ---------
+        >>> TimeConverter.convert_exact(1, 'Centuries', 'Nanoseconds')
+        Fraction(3153600000000000000, 1)
+        """
+
+        return time_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of time values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return time_table.convert_exact_batch(values, from_unit, to_unit, precision)
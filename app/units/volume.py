@@ -10,14 +10,64 @@ VolumeConverter : Provides a static method for converting volume values between
 
 Variables:
 ----------
+volume_factors : dict
+    Maps each supported unit to its value in the base unit of the category.
 volume_units : list
     A list of supported volume units for conversion.
+volume_aliases : dict
+    Maps each supported unit to its symbols and alternative spellings.
+volume_prefixed : dict
+    Maps the units accepting prefixes to their factor, symbols and prefix systems.
+volume_table : UnitTable
+    The conversion table built from volume_factors, volume_aliases and volume_prefixed.
 -------------------------------------------------------------------------------
 """
 
-volume_units = ["Millilitres", "Litres", "Kilolitres", "Teaspoons", 
-                "Tablespoons","Quarts", "Pints", "Gallons", "Fluid Ounces",
-                "Cubic Metres", "Cubic Feet", "Cubic Inches", "Oil Barrels"]
+from fractions import Fraction
+from app.units.dimensions import derive
+from app.units.engine import UnitTable
+
+# Value of one unit expressed in Cubic Metres, cubic units derived from length units
+volume_factors = {
+    "Millilitres": 1e-6,
+    "Litres": 0.001,
+    "Kilolitres": 1.0,
+    "Teaspoons": Fraction(284130625, 48000000000000),
+    "Tablespoons": 0.0000177581640625,
+    "Quarts": 0.0011365225,
+    "Pints": 0.00056826125,
+    "Gallons": 0.00454609,
+    "Fluid Ounces": 0.0000284130625,
+    "Cubic Metres": derive(("length", "Meters", 3)),
+    "Cubic Feet": derive(("length", "Feet", 3)),
+    "Cubic Inches": derive(("length", "Inches", 3)),
+    "Oil Barrels": 9702 * derive(("length", "Inches", 3)),
+}
+
+# Symbols and alternative spellings accepted for each unit
+volume_aliases = {
+    "Millilitres": ("mL", "ml", "Millilitre", "Milliliters", "Milliliter"),
+    "Litres": ("L", "l", "Litre", "Liters", "Liter"),
+    "Kilolitres": ("kL", "kl", "Kilolitre", "Kiloliters", "Kiloliter"),
+    "Teaspoons": ("tsp", "Teaspoon"),
+    "Tablespoons": ("tbsp", "Tablespoon"),
+    "Quarts": ("qt", "Quart"),
+    "Pints": ("pt", "Pint"),
+    "Gallons": ("gal", "Gallon"),
+    "Fluid Ounces": ("fl oz", "Fluid Ounce"),
+    "Cubic Metres": ("m³", "m3", "Cubic Metre", "Cubic Meters", "Cubic Meter"),
+    "Cubic Feet": ("ft³", "ft3", "cu ft", "Cubic Foot"),
+    "Cubic Inches": ("in³", "in3", "cu in", "Cubic Inch"),
+    "Oil Barrels": ("bbl", "Oil Barrel"),
+}
+
+# Units accepting SI prefixes, generated on demand: (factor, symbols, prefix systems)
+volume_prefixed = {
+    "Litres": (0.001, ("L", "l"), ("SI",)),
+}
+
+volume_units = list(volume_factors)
+volume_table = UnitTable("volume", volume_factors, volume_aliases, volume_prefixed)
 
 class VolumeConverter:
     """
@@ -27,6 +77,14 @@ class VolumeConverter:
     --------
     convert(value, from_unit, to_unit)
         Converts a volume value from one unit to another, if the conversion is supported.
+    convert_batch(values, from_unit, to_unit)
+        Converts an array of volume values from one unit to another.
+    convert_to_all(value, from_unit)
+        Converts a volume value into every supported unit at once.
+    convert_exact(value, from_unit, to_unit, precision=None)
+        Converts a volume value exactly, returning a Fraction or a Decimal.
+    convert_exact_batch(values, from_unit, to_unit, precision=None)
+        Converts a sequence of volume values exactly.
     """
     
     @staticmethod
@@ -73,348 +131,123 @@ class VolumeConverter:
         >>> VolumeConverter.convert(1, 'Litres', 'Millilitres')
         1000.0
         >>> VolumeConverter.convert(1, 'Gallons', 'Cubic Feet')
-        0.133681
+        0.16054365323589206
         """
         
-        if from_unit == to_unit:
-            return value
-        
-        elif from_unit == "Millilitres":
-            if to_unit == "Litres":
-                return value / 1000.0
-            elif to_unit == "Kilolitres":
-                return value / 1000000.0
-            elif to_unit == "Teaspoons":
-                return value / 5.9193904674479161344
-            elif to_unit == "Tablespoons":
-                return value / 17.758171402343747584
-            elif to_unit == "Quarts":
-                return value / 1136.52296975
-            elif to_unit == "Pints":
-                return value / 568.26148487499988992
-            elif to_unit == "Gallons":
-                return value / 4546.091879
-            elif to_unit == "Fluid Ounces":
-                return value / 28.413074243749994496
-            elif to_unit == "Cubic Metres":
-                return value / 1000000.0
-            elif to_unit == "Cubic Feet":
-                return value / 28316.8
-            elif to_unit == "Cubic Inches":
-                return value / 16.3871
-            elif to_unit == "Oil Barrels":
-                return value / 158987.0
-
-        elif from_unit == "Litres":
-            if to_unit == "Millilitres":
-                return value * 1000.0
-            elif to_unit == "Kilolitres":
-                return value / 1000.0
-            elif to_unit == "Teaspoons":
-                return value / 0.005919390467447916134
-            elif to_unit == "Tablespoons":
-                return value / 0.017758171402343747584
-            elif to_unit == "Quarts":
-                return value / 1.13652296975
-            elif to_unit == "Pints":
-                return value / 0.56826148487499988992
-            elif to_unit == "Gallons":
-                return value / 4.546091879
-            elif to_unit == "Fluid Ounces":
-                return value / 0.028413074243749994496
-            elif to_unit == "Cubic Metres":
-                return value / 1000.0
-            elif to_unit == "Cubic Feet":
-                return value / 28.3168
-            elif to_unit == "Cubic Inches":
-                return value * 61.0237
-            elif to_unit == "Oil Barrels":
-                return value / 158.987
-
-        elif from_unit == "Kilolitres":
-            if to_unit == "Millilitres":
-                return value * 1000000.0
-            elif to_unit == "Litres":
-                return value * 1000.0
-            elif to_unit == "Teaspoons":
-                return value / 0.000005919390467447916
-            elif to_unit == "Tablespoons":
-                return value / 0.000017758171402343747
-            elif to_unit == "Quarts":
-                return value / 0.00113652296975
-            elif to_unit == "Pints":
-                return value / 0.000568261484874999889
-            elif to_unit == "Gallons":
-                return value / 0.0045460918799
-            elif to_unit == "Fluid Ounces":
-                return value / 0.0000284130742437499946
-            elif to_unit == "Cubic Metres":
-                return value * 1.0
-            elif to_unit == "Cubic Feet":
-                return value * 35.3147
-            elif to_unit == "Cubic Inches":
-                return value * 61023.7
-            elif to_unit == "Oil Barrels":
-                return value * 6.28981
-
-        elif from_unit == "Teaspoons":
-            if to_unit == "Millilitres":
-                return value * 5.9193904674479161344
-            elif to_unit == "Litres":
-                return value * 0.005919390467447916134
-            elif to_unit == "Kilolitres":
-                return value * 0.000005919390467447916
-            elif to_unit == "Tablespoons":
-                return value / 3.0
-            elif to_unit == "Quarts":
-                return value / 192.0
-            elif to_unit == "Pints":
-                return value / 96.0
-            elif to_unit == "Gallons":
-                return value / 768.0
-            elif to_unit == "Fluid Ounces":
-                return value / 4.8
-            elif to_unit == "Cubic Metres":
-                return value / 168936.0
-            elif to_unit == "Cubic Feet":
-                return value / 4783.74
-            elif to_unit == "Cubic Inches":
-                return value / 2.76837
-            elif to_unit == "Oil Barrels":
-                return value / 26858.7
-
-        elif from_unit == "Tablespoons":
-            if to_unit == "Millilitres":
-                return value * 17.758171402343747584
-            elif to_unit == "Litres":
-                return value * 0.017758171402343747584
-            elif to_unit == "Kilolitres":
-                return value * 0.000017758171402343747
-            elif to_unit == "Teaspoons":
-                return value * 3.0
-            elif to_unit == "Quarts":
-                return value / 64.0
-            elif to_unit == "Pints":
-                return value / 32.0
-            elif to_unit == "Gallons":
-                return value / 256.0
-            elif to_unit == "Fluid Ounces":
-                return value / 1.6
-            elif to_unit == "Cubic Metres":
-                return value / 56312.1
-            elif to_unit == "Cubic Feet":
-                return value / 1594.58
-            elif to_unit == "Cubic Inches":
-                return value * 1.08367
-            elif to_unit == "Oil Barrels":
-                return value / 8952.91
-
-        elif from_unit == "Quarts":
-            if to_unit == "Millilitres":
-                return value * 1136.52296975
-            elif to_unit == "Litres":
-                return value * 1.13652296975
-            elif to_unit == "Kilolitres":
-                return value * 0.00113652296975
-            elif to_unit == "Teaspoons":
-                return value * 192.0
-            elif to_unit == "Tablespoons":
-                return value * 64.0
-            elif to_unit == "Pints":
-                return value * 2.0
-            elif to_unit == "Gallons":
-                return value / 4.0
-            elif to_unit == "Fluid Ounces":
-                return value * 40.0
-            elif to_unit == "Cubic Metres":
-                return value / 879.877
-            elif to_unit == "Cubic Feet":
-                return value / 24.9153
-            elif to_unit == "Cubic Inches":
-                return value * 69.3549
-            elif to_unit == "Oil Barrels":
-                return value / 139.889
-
-        elif from_unit == "Pints":
-            if to_unit == "Millilitres":
-                return value * 568.26148487499988992
-            elif to_unit == "Litres":
-                return value * 0.56826148487499988992
-            elif to_unit == "Kilolitres":
-                return value * 0.000568261484874999889
-            elif to_unit == "Teaspoons":
-                return value * 96.0
-            elif to_unit == "Tablespoons":
-                return value * 32.0
-            elif to_unit == "Quarts":
-                return value  / 2.0
-            elif to_unit == "Gallons":
-                return value / 8.0
-            elif to_unit == "Fluid Ounces":
-                return value * 20.0
-            elif to_unit == "Cubic Metres":
-                return value / 1759.75
-            elif to_unit == "Cubic Feet":
-                return value / 49.8307
-            elif to_unit == "Cubic Inches":
-                return value * 34.6774
-            elif to_unit == "Oil Barrels":
-                return value / 279.779
-
-        elif from_unit == "Gallons":
-            if to_unit == "Millilitres":
-                return value * 4546.091879
-            elif to_unit == "Litres":
-                return value * 4.546091879
-            elif to_unit == "Kilolitres":
-                return value * 0.0045460918799
-            elif to_unit == "Teaspoons":
-                return value * 768.0
-            elif to_unit == "Tablespoons":
-                return value * 256.0
-            elif to_unit == "Quarts":
-                return value * 4.0
-            elif to_unit == "Pints":
-                return value * 8.0
-            elif to_unit == "Fluid Ounces":
-                return value * 160.0
-            elif to_unit == "Cubic Metres":
-                return value / 219.969
-            elif to_unit == "Cubic Feet":
-                return value / 6.22884
-            elif to_unit == "Cubic Inches":
-                return value * 277.419
-            elif to_unit == "Oil Barrels":
-                return value / 34.9723
-
-        elif from_unit == "Fluid Ounces":
-            if to_unit == "Millilitres":
-                return value * 28.413074243749994496
-            elif to_unit == "Litres":
-                return value * 0.028413074243749994496
-            elif to_unit == "Kilolitres":
-                return value * 0.000028413074243749994
-            elif to_unit == "Teaspoons":
-                return value * 4.8
-            elif to_unit == "Tablespoons":
-                return value * 1.6
-            elif to_unit == "Quarts":
-                return value / 40.0
-            elif to_unit == "Pints":
-                return value / 20.0
-            elif to_unit == "Gallons":
-                return value / 160.0
-            elif to_unit == "Cubic Metres":
-                return value / 35195.1
-            elif to_unit == "Cubic Feet":
-                return value / 996.614
-            elif to_unit == "Cubic Inches":
-                return value * 1.73387
-            elif to_unit == "Oil Barrels":
-                return value / 5595.57
-
-        elif from_unit == "Cubic Metres":
-            if to_unit == "Millilitres":
-                return value * 1000000.0
-            elif to_unit == "Litres":
-                return value * 1000.0
-            elif to_unit == "Kilolitres":
-                return value * 1.0
-            elif to_unit == "Teaspoons":
-                return value * 168936.0
-            elif to_unit == "Tablespoons":
-                return value * 56312.1
-            elif to_unit == "Quarts":
-                return value * 879.877
-            elif to_unit == "Pints":
-                return value * 1759.75
-            elif to_unit == "Gallons":
-                return value * 219.969
-            elif to_unit == "Fluid Ounces":
-                return value * 35195.1
-            elif to_unit == "Cubic Feet":
-                return value * 35.3147
-            elif to_unit == "Cubic Inches":
-                return value * 61023.7
-            elif to_unit == "Oil Barrels":
-                return value * 6.28981
-
-        elif from_unit == "Cubic Feet":
-            if to_unit == "Millilitres":
-                return value * 28316.8
-            elif to_unit == "Litres":
-                return value * 28.3168
-            elif to_unit == "Kilolitres":
-                return value / 35.3147
-            elif to_unit == "Teaspoons":
-                return value * 4783.74
-            elif to_unit == "Tablespoons":
-                return value * 1594.58
-            elif to_unit == "Quarts":
-                return value * 24.9153
-            elif to_unit == "Pints":
-                return value * 49.8307
-            elif to_unit == "Gallons":
-                return value * 6.22884
-            elif to_unit == "Fluid Ounces":
-                return value * 996.614
-            elif to_unit == "Cubic Metres":
-                return value / 35.3147
-            elif to_unit == "Cubic Inches":
-                return value * 1728.0
-            elif to_unit == "Oil Barrels":
-                return value / 5.61458
-
-        elif from_unit == "Cubic Inches":
-            if to_unit == "Millilitres":
-                return value * 16.3871
-            elif to_unit == "Litres":
-                return value / 61.0237
-            elif to_unit == "Kilolitres":
-                return value / 61023.7
-            elif to_unit == "Teaspoons":
-                return value * 2.76837
-            elif to_unit == "Tablespoons":
-                return value / 1.08367
-            elif to_unit == "Quarts":
-                return value / 69.3549
-            elif to_unit == "Pints":
-                return value / 34.6774
-            elif to_unit == "Gallons":
-                return value / 277.419
-            elif to_unit == "Fluid Ounces":
-                return value / 1.73387
-            elif to_unit == "Cubic Metres":
-                return value / 61023.7
-            elif to_unit == "Cubic Feet":
-                return value / 1728.0
-            elif to_unit == "Oil Barrels":
-                return value / 9702.0
-
-        elif from_unit == "Oil Barrels":
-            if to_unit == "Millilitres":
-                return value * 158987.0
-            elif to_unit == "Litres":
-                return value * 158.987
-            elif to_unit == "Kilolitres":
-                return value / 6.28981
-            elif to_unit == "Teaspoons":
-                return value * 26858.7
-            elif to_unit == "Tablespoons":
-                return value * 8952.91
-            elif to_unit == "Quarts":
-                return value * 139.889
-            elif to_unit == "Pints":
-                return value * 279.779
-            elif to_unit == "Gallons":
-                return value * 34.9723
-            elif to_unit == "Fluid Ounces":
-                return value * 5595.57
-            elif to_unit == "Cubic Metres":
-                return value / 6.28981
-            elif to_unit == "Cubic Feet":
-                return value * 5.61458
-            elif to_unit == "Cubic Inches":
-                return value * 9702.0
-
-        raise ValueError("Invalid units or conversion not supported")
\ No newline at end of file
+        return volume_table.convert(value, from_unit, to_unit)
+
+    @staticmethod
+    def convert_batch(values, from_unit, to_unit):
+        """
+        Converts an array of volume values from one unit to another in a single
+        vectorized multiplication.
+
+        Parameters:
+        -----------
+        values : array_like
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return volume_table.convert_batch(values, from_unit, to_unit)
+
+    @staticmethod
+    def convert_to_all(value, from_unit):
+        """
+        Converts a volume value into every supported unit in a single vectorized
+        pass over a precomputed factor row.
+
+        Parameters:
+        -----------
+        value : float
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The converted values, in the order of volume_units.
+
+        Raises:
+        -------
+        ValueError
+            If the provided unit is invalid.
+        """
+
+        return volume_table.convert_to_all(value, from_unit)
+
+    @staticmethod
+    def convert_exact(value, from_unit, to_unit, precision=None):
+        """
+        Converts a volume value from one unit to another without rounding, using
+        exact factors derived once per unit pair.
+
+        Parameters:
+        -----------
+        value : int, float, str, Decimal or Fraction
+            The numerical value to be converted.
+        from_unit : str
+            The unit of the input value. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the value into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of a Decimal result. By default the
+            exact Fraction is returned.
+
+        Returns:
+        --------
+        Fraction or Decimal
+            The converted value in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return volume_table.convert_exact(value, from_unit, to_unit, precision)
+
+    @staticmethod
+    def convert_exact_batch(values, from_unit, to_unit, precision=None):
+        """
+        Converts a sequence of volume values from one unit to another without
+        rounding.
+
+        Parameters:
+        -----------
+        values : iterable
+            The numerical values to be converted.
+        from_unit : str
+            The unit of the input values. Must be one of the supported units.
+        to_unit : str
+            The unit to convert the values into. Must be one of the supported units.
+        precision : int, optional
+            Number of significant digits of Decimal results. By default exact
+            Fractions are returned.
+
+        Returns:
+        --------
+        list
+            The converted values in the target unit.
+
+        Raises:
+        -------
+        ValueError
+            If the provided units are invalid or if the conversion is unsupported.
+        """
+
+        return volume_table.convert_exact_batch(values, from_unit, to_unit, precision)
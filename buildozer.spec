@@ -9,7 +9,7 @@ source.include_exts = py,png,jpg,kv,atlas,ttf
 
 version = 1.4
 
-requirements = python3,kivy,kivymd==1.1.1,pillow
+requirements = python3,kivy,kivymd==1.1.1,pillow,numpy
 
 presplash.filename = %(source.dir)s/presplash.png
 icon.filename = %(source.dir)s/icon.png
@@ -1,7 +1,8 @@
 """
 Main Application Module
 
-This module initializes and runs the Universal Convert application. It loads the initial screen.
+This module initializes and runs the Universal Convert application. It loads the initial screen
+and, once the first frame is drawn, warms up the unit modules in the background.
 
 Classes:
 --------
@@ -15,9 +16,12 @@ from kivy.config import Config
 Config.set('graphics', 'width', '375')
 Config.set('graphics', 'height', '665')
 
+import os
+from kivy.core.window import Window
 from kivymd.app import MDApp
 from app.screens.menuscreen.menuscreen import MenuScreen
 from app.screens.conversionscreen.conversionscreen import ConversionScreen
+from app.screens.menuscreen.categories import CategoryUsage, start_warm_up
 
 class MainApp(MDApp):
     """
@@ -30,11 +34,18 @@ class MainApp(MDApp):
         Sets up the main app title and returns the initial app structure.
     on_start():
         Sets the initial screen to 'menu_screen' when the app starts.
+    on_first_frame(*args):
+        Starts warming up the unit modules once the first frame is drawn.
+    on_pause():
+        Saves the category visit counts when the app goes to the background.
+    on_stop():
+        Saves the category visit counts when the app closes.
     """
     
     def build(self):
         """
-        Builds the application, setting up the main title.
+        Builds the application, setting up the main title and loading the
+        number of visits of each metric category.
 
         Returns:
         --------
@@ -42,14 +53,43 @@ class MainApp(MDApp):
         """
         
         self.title = "Universal Convert"
+        self.category_usage = CategoryUsage(os.path.join(self.user_data_dir, 'usage.json'))
         
     def on_start(self):
         """
         Callback triggered when the application starts. Sets the initial screen
-        to 'menu_screen'.
+        to 'menu_screen' and waits for the first frame to start the warm-up.
         """
         
         self.root.current = 'menu_screen'
+        Window.bind(on_flip=self.on_first_frame)
+        
+    def on_first_frame(self, *args):
+        """
+        Called once the first frame is on screen. Loads the unit modules and
+        their conversion tables on a background thread, the most visited
+        categories first, so that opening any category is as fast as the
+        second time.
+        """
+        
+        Window.unbind(on_flip=self.on_first_frame)
+        start_warm_up(self.category_usage.ranking())
+        
+    def on_pause(self):
+        """
+        Saves the category visit counts, as a paused app may be killed without
+        being stopped, and allows the pause.
+        """
+        
+        self.category_usage.save()
+        return True
+        
+    def on_stop(self):
+        """
+        Saves the category visit counts when the app closes.
+        """
+        
+        self.category_usage.save()
     
 if __name__ == "__main__":
     MainApp().run()
\ No newline at end of file